@@ -2,20 +2,19 @@ import json
 import logging
 import os
 import datetime
-from argparse import Namespace
 from time import perf_counter
 
-from ariadne import (
-    gql,
-    graphql_sync,
-)
+from ariadne import graphql_sync
 
 from dataall.base.api import bootstrap as bootstrap_schema, get_executable_schema
+from dataall.base.api.schema_artifact import ApiArtifact, ARTIFACT_FILE_NAME
 from dataall.base.services.service_provider_factory import ServiceProviderFactory
 from dataall.core.tasks.service_handlers import Worker
 from dataall.base.aws.sqs import SqsQueue
 from dataall.base.aws.parameter_store import ParameterStoreManager
+from dataall.base.utils.parameter import parameter_cache
 from dataall.base.context import set_context, dispose_context, RequestContext
+from dataall.base.tracing import instrument, is_tracing_requested, trace_operation
 from dataall.core.permissions.db import save_permissions_with_tenant
 from dataall.core.permissions.db.tenant_policy_repositories import TenantPolicy
 from dataall.base.db import get_engine
@@ -30,37 +29,54 @@ start = perf_counter()
 for name in ['boto3', 's3transfer', 'botocore', 'boto']:
     logging.getLogger(name).setLevel(logging.ERROR)
 
-load_modules(modes={ImportMode.API})
-SCHEMA = bootstrap_schema()
-TYPE_DEFS = gql(SCHEMA.gql(with_directives=False))
+init_timings = {}
+
+
+def _timed(phase, fn, *args, **kwargs):
+    phase_start = perf_counter()
+    result = fn(*args, **kwargs)
+    init_timings[phase] = perf_counter() - phase_start
+    return result
+
+
+ARTIFACT = _timed('load_artifact', ApiArtifact.load, os.getenv('API_ARTIFACT_PATH', ARTIFACT_FILE_NAME))
+_timed('load_modules', load_modules, modes={ImportMode.API})
+SCHEMA = _timed('bootstrap_schema', bootstrap_schema)
 REAUTH_TTL = int(os.environ.get('REAUTH_TTL', '5'))
 ENVNAME = os.getenv('envname', 'local')
-ENGINE = get_engine(envname=ENVNAME)
-Worker.queue = SqsQueue.send
-
-save_permissions_with_tenant(ENGINE)
-
-
-def resolver_adapter(resolver):
-    def adapted(obj, info, **kwargs):
-        return resolver(
-            context=Namespace(
-                engine=info.context['engine'],
-                es=info.context['es'],
-                username=info.context['username'],
-                groups=info.context['groups'],
-                schema=info.context['schema'],
-            ),
-            source=obj or None,
-            **kwargs,
-        )
+ENGINE = _timed('get_engine', get_engine, envname=ENVNAME)
+instrument(ENGINE.engine)
+Worker.sender = SqsQueue.send
 
-    return adapted
 
+def _prefetch_parameters():
+    for path in ['reauth', 'pivotRole']:
+        try:
+            parameter_cache.prefetch(f'/dataall/{ENVNAME}/{path}')
+        except Exception as e:
+            log.warning(f'Failed to prefetch SSM parameters under {path}: {e}')
 
-executable_schema = get_executable_schema()
+
+_timed('prefetch_parameters', _prefetch_parameters)
+
+_timed(
+    'save_permissions',
+    save_permissions_with_tenant,
+    ENGINE,
+    fingerprint=ARTIFACT.permissions_fingerprint if ARTIFACT else None,
+)
+
+executable_schema = _timed(
+    'executable_schema',
+    get_executable_schema,
+    schema=SCHEMA,
+    type_defs=ARTIFACT.sdl if ARTIFACT else None,
+)
 end = perf_counter()
-print(f'Lambda Context ' f'Initialization took: {end - start:.3f} sec')
+print(
+    f'Lambda Context Initialization took: {end - start:.3f} sec '
+    f'({", ".join(f"{phase}: {duration:.3f}" for phase, duration in init_timings.items())})'
+)
 
 
 def get_cognito_groups(claims):
@@ -144,20 +160,12 @@ def handler(event, context):
                 groups.extend(get_cognito_groups(claims))
             log.debug('groups are %s', ",".join(groups))
             with ENGINE.scoped_session() as session:
-                for group in groups:
-                    policy = TenantPolicy.find_tenant_policy(
-                        session, group, 'dataall'
-                    )
-                    if not policy:
-                        print(
-                            f'No policy found for Team {group}. Attaching TENANT_ALL permissions'
-                        )
-                        TenantPolicy.attach_group_tenant_policy(
-                            session=session,
-                            group=group,
-                            permissions=permissions.TENANT_ALL,
-                            tenant_name='dataall',
-                        )
+                TenantPolicy.ensure_group_tenant_policies(
+                    session=session,
+                    groups=groups,
+                    permissions=permissions.TENANT_ALL,
+                    tenant_name='dataall',
+                )
 
         except Exception as e:
             print(f'Error managing groups due to: {e}')
@@ -216,11 +224,15 @@ def handler(event, context):
                 'body': json.dumps(response)
             }
 
-    success, response = graphql_sync(
-        schema=executable_schema, data=query, context_value=app_context
-    )
-
-    dispose_context()
+    try:
+        with trace_operation(query.get('operationName')) as trace, Worker.outbox(ENGINE):
+            success, response = graphql_sync(
+                schema=executable_schema, data=query, context_value=app_context
+            )
+        if is_tracing_requested(event.get('headers'), TenantPolicy.is_tenant_admin(app_context['groups'])):
+            response.setdefault('extensions', {})['tracing'] = trace.summary()
+    finally:
+        dispose_context()
     response = json.dumps(response)
 
     log.info('Lambda Response %s', response)
@@ -18,10 +18,24 @@ load_modules(modes={ImportMode.HANDLERS})
 
 
 def handler(event, context=None):
-    """Processes  messages received from sqs"""
+    """
+    Processes  messages received from sqs.
+    Returns the records with failed tasks as partial batch failures, so only those are retried.
+    When a record is received again, its failed tasks are started again
+    """
     log.info(f'Received Event: {event}')
+    batch_item_failures = []
     for record in event['Records']:
         log.info('Consumed record from queue: %s' % record)
-        message = json.loads(record['body'])
-        log.info(f'Extracted Message: {message}')
-        Worker.process(engine=engine, task_ids=message)
+        try:
+            message = json.loads(record['body'])
+            log.info(f'Extracted Message: {message}')
+            retry = int(record.get('attributes', {}).get('ApproximateReceiveCount', '1')) > 1
+            responses = Worker.process(engine=engine, task_ids=message, retry_failed=retry)
+            failed = [r['taskUri'] for r in responses if r['status'] == 'failed']
+            if failed:
+                raise Exception(f'Tasks {failed} failed')
+        except Exception as e:
+            log.exception(f'Failed to process record {record.get("messageId")}: {e}')
+            batch_item_failures.append({'itemIdentifier': record['messageId']})
+    return {'batchItemFailures': batch_item_failures}
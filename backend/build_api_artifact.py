@@ -0,0 +1,28 @@
+"""
+Creates the build-time artifact of the GraphQL API: the rendered schema and the fingerprint of permissions.
+It's executed while building the image of the GraphQL Lambda. Usage: python build_api_artifact.py [output path]
+"""
+import logging
+import sys
+
+from dataall.base.api import bootstrap
+from dataall.base.api.schema_artifact import ApiArtifact, ARTIFACT_FILE_NAME
+from dataall.base.loader import load_modules, ImportMode
+from dataall.core.permissions.db import permissions_fingerprint
+
+log = logging.getLogger(__name__)
+
+
+def build(path: str) -> None:
+    load_modules(modes={ImportMode.API})
+    schema = bootstrap()
+    ApiArtifact(
+        sdl=schema.gql(with_directives=False),
+        permissions_fingerprint=permissions_fingerprint(),
+    ).save(path)
+    log.info(f'API artifact is saved to {path}')
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    build(sys.argv[1] if len(sys.argv) > 1 else ARTIFACT_FILE_NAME)
@@ -12,6 +12,8 @@ from ariadne import (
 
 from dataall.base.api import gql
 from dataall.base.api.constants import GraphQLEnumMapper
+from dataall.base.api.dataloader import DataLoaders
+from dataall.base.tracing import set_resolver_path
 
 
 def bootstrap():
@@ -52,23 +54,37 @@ def bootstrap():
 
 def resolver_adapter(resolver):
     def adapted(obj, info, **kwargs):
-        response = resolver(
-            context=Namespace(
-                engine=info.context['engine'],
-                username=info.context['username'],
-                groups=info.context['groups'],
-                schema=info.context['schema'],
-            ),
-            source=obj or None,
-            **kwargs,
-        )
+        loaders = info.context.get('loaders')
+        if loaders is None:
+            loaders = info.context['loaders'] = DataLoaders(info.context['engine'])
+
+        previous_path = set_resolver_path('.'.join(str(key) for key in info.path.as_list()))
+        try:
+            response = resolver(
+                context=Namespace(
+                    engine=info.context['engine'],
+                    username=info.context['username'],
+                    groups=info.context['groups'],
+                    schema=info.context['schema'],
+                    loaders=loaders,
+                ),
+                source=obj or None,
+                **kwargs,
+            )
+        finally:
+            set_resolver_path(previous_path)
+        loaders.collect(response)
         return response
 
     return adapted
 
 
-def get_executable_schema():
-    schema = bootstrap()
+def get_executable_schema(schema: gql.Schema = None, type_defs: str = None):
+    """
+    Binds the resolvers and builds the executable schema.
+    An already bootstrapped schema and its rendered SDL can be provided to avoid building them again
+    """
+    schema = schema or bootstrap()
     _types = []
     for _type in schema.types:
         if _type.name == 'Query':
@@ -102,6 +118,6 @@ def get_executable_schema():
     for union in schema.unions:
         _unions.append(UnionType(union.name, union.resolver))
 
-    type_defs = GQL(schema.gql(with_directives=False))
+    type_defs = GQL(type_defs or schema.gql(with_directives=False))
     executable_schema = make_executable_schema(type_defs, *(_types + _enums + _unions))
     return executable_schema
@@ -27,4 +27,10 @@ class SortDirection(GraphQLEnumMapper):
     desc = 'desc'
 
 
+class CountMode(GraphQLEnumMapper):
+    none = 'none'
+    exact = 'exact'
+    estimate = 'estimate'
+
+
 GLUEBUSINESSPROPERTIES = ['EXAMPLE_GLUE_PROPERTY_TO_BE_ADDED_ON_ES']
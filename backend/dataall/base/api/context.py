@@ -4,7 +4,9 @@ class Context:
         engine=None,
         username=None,
         groups=None,
+        loaders=None,
     ):
         self.engine = engine
         self.username = username
         self.groups = groups
+        self.loaders = loaders
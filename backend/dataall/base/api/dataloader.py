@@ -0,0 +1,112 @@
+"""
+Batched lookups for nested GraphQL field resolvers.
+
+A resolver of a nested field (e.g. Dataset.environment) is invoked once per parent row. Rather than running
+one query per row, the resolver asks a DataLoader for the entity. When a resolver returns a list of rows,
+the resolver_adapter hands the rows to the per-request DataLoaders, which collect the keys of all siblings.
+The first load then resolves every collected key with a single IN (...) query and the rest of siblings
+are served from memory.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Type
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class DataLoaderDefinition:
+    """
+    Describes how to batch-load an entity type.
+    batch_load_fn receives an open session and a list of keys and returns a dict of key -> value.
+    sources maps parent types to the attribute that holds the key, used to collect keys of sibling rows
+    """
+    name: str
+    batch_load_fn: Callable[[Any, List[Any]], Dict[Any, Any]]
+    sources: Dict[Type, str] = field(default_factory=dict)
+
+
+class DataLoaderRegistry:
+    """Registers definitions of DataLoaders. Modules can add new definitions or new sources of keys"""
+    _DEFINITIONS: Dict[str, DataLoaderDefinition] = {}
+
+    @classmethod
+    def register(cls, definition: DataLoaderDefinition):
+        cls._DEFINITIONS[definition.name] = definition
+
+    @classmethod
+    def add_source(cls, name: str, source: Type, key_attr: str):
+        cls._DEFINITIONS[name].sources[source] = key_attr
+
+    @classmethod
+    def definitions(cls) -> Iterable[DataLoaderDefinition]:
+        return cls._DEFINITIONS.values()
+
+    @classmethod
+    def get_definition(cls, name: str) -> DataLoaderDefinition:
+        return cls._DEFINITIONS[name]
+
+
+class DataLoader:
+    """Caches loaded entities for the duration of one request and batches loading of pending keys"""
+
+    def __init__(self, engine, definition: DataLoaderDefinition):
+        self._engine = engine
+        self._definition = definition
+        self._cache: Dict[Any, Any] = {}
+        self._pending = set()
+
+    def collect(self, items: List[Any]) -> None:
+        for source, key_attr in self._definition.sources.items():
+            for item in items:
+                if isinstance(item, source):
+                    key = getattr(item, key_attr, None)
+                    if key is not None and key not in self._cache:
+                        self._pending.add(key)
+
+    def load(self, key):
+        if key is None:
+            return None
+        if key not in self._cache:
+            self._pending.add(key)
+            self._dispatch()
+        return self._cache.get(key)
+
+    def load_many(self, keys: List[Any]) -> List[Any]:
+        missing = {key for key in keys if key is not None and key not in self._cache}
+        if missing:
+            self._pending.update(missing)
+            self._dispatch()
+        return [self._cache.get(key) for key in keys]
+
+    def _dispatch(self):
+        keys = list(self._pending)
+        self._pending.clear()
+        log.debug(f'Batch loading {len(keys)} keys of {self._definition.name}')
+        with self._engine.scoped_session() as session:
+            values = self._definition.batch_load_fn(session, keys)
+        for key in keys:
+            self._cache[key] = values.get(key)
+
+
+class DataLoaders:
+    """Per-request set of DataLoaders. The loaders are instantiated lazily"""
+
+    def __init__(self, engine):
+        self._engine = engine
+        self._loaders: Dict[str, DataLoader] = {}
+
+    def get(self, name: str) -> DataLoader:
+        if name not in self._loaders:
+            self._loaders[name] = DataLoader(self._engine, DataLoaderRegistry.get_definition(name))
+        return self._loaders[name]
+
+    def collect(self, result) -> None:
+        """Collects keys from a list (or a page of nodes) returned by a resolver"""
+        items = result.get('nodes') if isinstance(result, dict) else result
+        if not items or not isinstance(items, list):
+            return
+
+        for definition in DataLoaderRegistry.definitions():
+            if any(isinstance(items[0], source) for source in definition.sources):
+                self.get(definition.name).collect(items)
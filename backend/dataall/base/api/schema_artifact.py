@@ -0,0 +1,39 @@
+"""
+Build-time artifact of the GraphQL API.
+Rendering the SDL of the whole schema and upserting the permissions are the most expensive steps of a cold start
+of the GraphQL Lambda. The artifact is created while the image is built and contains the rendered SDL and
+the fingerprint of the permissions defined in the code
+"""
+import json
+import logging
+import os
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+ARTIFACT_FILE_NAME = 'api_artifact.json'
+
+
+@dataclass
+class ApiArtifact:
+    sdl: str
+    permissions_fingerprint: str
+
+    def save(self, path: str) -> None:
+        with open(path, 'w') as artifact_file:
+            json.dump(asdict(self), artifact_file)
+
+    @staticmethod
+    def load(path: str) -> Optional['ApiArtifact']:
+        """Loads the artifact. Returns None if there is no artifact or it can't be read"""
+        if not os.path.exists(path):
+            log.info(f'No API artifact found at {path}')
+            return None
+
+        try:
+            with open(path) as artifact_file:
+                return ApiArtifact(**json.load(artifact_file))
+        except Exception as e:
+            log.warning(f'Failed to read API artifact {path}: {e}')
+            return None
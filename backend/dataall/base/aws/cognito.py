@@ -3,6 +3,7 @@ import logging
 import boto3
 
 from dataall.base.services.service_provider import ServiceProvider
+from dataall.base.utils.parameter import parameter_cache
 
 log = logging.getLogger(__name__)
 
@@ -16,8 +17,7 @@ class Cognito(ServiceProvider):
         try:
             envname = os.getenv('envname', 'local')
             parameter_path = f'/dataall/{envname}/cognito/userpool'
-            ssm = boto3.client('ssm', region_name=os.getenv('AWS_REGION', 'eu-west-1'))
-            user_pool_id = ssm.get_parameter(Name=parameter_path)['Parameter']['Value']
+            user_pool_id = parameter_cache.get(parameter_path, os.getenv('AWS_REGION', 'eu-west-1'))
             paginator = self.client.get_paginator('list_users_in_group')
             pages = paginator.paginate(
                 UserPoolId=user_pool_id,
@@ -50,8 +50,7 @@ class Cognito(ServiceProvider):
         groups = []
         try:
             parameter_path = f'/dataall/{envname}/cognito/userpool'
-            ssm = boto3.client('ssm', region_name=region)
-            user_pool_id = ssm.get_parameter(Name=parameter_path)['Parameter']['Value']
+            user_pool_id = parameter_cache.get(parameter_path, region)
             cognito = boto3.client('cognito-idp', region_name=region)
             paginator = cognito.get_paginator('list_groups')
             pages = paginator.paginate(UserPoolId=user_pool_id)
@@ -2,6 +2,7 @@ import logging
 
 from botocore.exceptions import ClientError
 
+from dataall.base.utils.parameter import parameter_cache
 from .sts import SessionHelper
 
 log = logging.getLogger(__name__)
@@ -29,6 +30,14 @@ class ParameterStoreManager:
     def get_parameter_value(AwsAccountId=None, region=None, parameter_path=None):
         if not parameter_path:
             raise Exception('Parameter name is None')
+        if not AwsAccountId:
+            try:
+                parameter_value = parameter_cache.get(parameter_path, region)
+            except ClientError as e:
+                raise Exception(e)
+            if parameter_value is None:
+                raise Exception(f'Parameter {parameter_path} not found')
+            return parameter_value
         try:
             parameter_value = ParameterStoreManager.client(
                 AwsAccountId, region
@@ -50,4 +59,6 @@ class ParameterStoreManager:
         except ClientError as e:
             raise Exception(e)
         else:
+            if not AwsAccountId:
+                parameter_cache.invalidate(parameter_name, region)
             return str(response)
@@ -1,7 +1,7 @@
+import hashlib
 import json
 import logging
 import os
-import uuid
 
 import boto3
 from botocore.exceptions import ClientError
@@ -12,8 +12,11 @@ logger = logging.getLogger(__name__)
 
 
 class SqsQueue:
+    SEND_BATCH_SIZE = 10
+    TASKS_PER_MESSAGE = 100
     disabled = True
     queue_url = None
+    _client = None
 
     @classmethod
     def configure_(cls, queue_url):
@@ -38,29 +41,51 @@ class SqsQueue:
     @classmethod
     def get_sqs_client(cls):
         if not cls.disabled:
-            client = boto3.client(
-                'sqs', region_name=os.getenv('AWS_REGION', 'eu-west-1')
-            )
-            return client
+            if cls._client is None:
+                cls._client = boto3.client(
+                    'sqs', region_name=os.getenv('AWS_REGION', 'eu-west-1')
+                )
+            return cls._client
 
     @classmethod
     def send(cls, engine, task_ids: [str]):
-        cls.configure_(
-            Parameter().get_parameter(env=cls.get_envname(), path='sqs/queue_url')
-        )
+        """
+        Sends the tasks in one message (or in messages of up to TASKS_PER_MESSAGE tasks), so that the worker
+        processes them together. Group and deduplication ids are derived from the task ids, a message is sent once
+        and the tasks of different messages are processed independently
+        """
+        if cls.queue_url is None:
+            cls.configure_(
+                Parameter().get_parameter(env=cls.get_envname(), path='sqs/queue_url')
+            )
         client = cls.get_sqs_client()
         logger.debug(f'Sending task {task_ids} through SQS {cls.queue_url}')
-        try:
-            return client.send_message(
-                QueueUrl=cls.queue_url,
-                MessageBody=json.dumps(task_ids),
-                MessageGroupId=cls._get_random_message_id(),
-                MessageDeduplicationId=cls._get_random_message_id(),
-            )
-        except ClientError as e:
-            logger.error(e)
-            raise e
+        messages = [task_ids[i:i + cls.TASKS_PER_MESSAGE] for i in range(0, len(task_ids), cls.TASKS_PER_MESSAGE)]
+        responses = []
+        for i in range(0, len(messages), cls.SEND_BATCH_SIZE):
+            batch = messages[i:i + cls.SEND_BATCH_SIZE]
+            try:
+                response = client.send_message_batch(
+                    QueueUrl=cls.queue_url,
+                    Entries=[
+                        {
+                            'Id': str(index),
+                            'MessageBody': json.dumps(message),
+                            'MessageGroupId': cls._get_message_id(message),
+                            'MessageDeduplicationId': cls._get_message_id(message),
+                        }
+                        for index, message in enumerate(batch)
+                    ],
+                )
+            except ClientError as e:
+                logger.error(e)
+                raise e
+            if response.get('Failed'):
+                logger.error(f'Failed to send tasks: {response["Failed"]}')
+                raise Exception(f'Failed to send {len(response["Failed"])} messages of tasks through SQS')
+            responses.append(response)
+        return responses
 
     @classmethod
-    def _get_random_message_id(cls):
-        return str(uuid.uuid4())
+    def _get_message_id(cls, task_ids: [str]):
+        return hashlib.sha256(','.join(task_ids).encode('utf-8')).hexdigest()
@@ -1,12 +1,19 @@
 import json
 import logging
 import os
+import threading
 import urllib
+from collections import defaultdict
+from typing import Callable, Dict, Tuple
 
 import boto3
+import botocore.session
 from botocore.client import Config
+from botocore.credentials import RefreshableCredentials
 from botocore.exceptions import ClientError
 
+from dataall.base.tracing import instrument_boto3_session
+from dataall.base.utils.parameter import parameter_cache
 from dataall.version import __version__, __pkg_name__
 
 try:
@@ -20,6 +27,84 @@ except ImportError:
 log = logging.getLogger(__name__)
 
 
+class ClientCachingSession(boto3.Session):
+    """boto3 Session that reuses the clients created for the same service, region and endpoint.
+    Clients created with other arguments (e.g. a custom Config) are not shared"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+        instrument_boto3_session(self)
+
+    def client(self, service_name, *args, **kwargs):
+        if args or set(kwargs) - {'region_name', 'endpoint_url'}:
+            return super().client(service_name, *args, **kwargs)
+
+        key = (service_name, kwargs.get('region_name'), kwargs.get('endpoint_url'))
+        with self._clients_lock:
+            if key not in self._clients:
+                self._clients[key] = super().client(service_name, **kwargs)
+            return self._clients[key]
+
+
+class RemoteSessionCache:
+    """
+    Process-wide cache of assumed role sessions keyed by (account, role arn, external id).
+    The credentials of a cached session are refreshed by botocore shortly before they expire,
+    a single thread performs the refresh while the others keep using the valid credentials.
+    Concurrent creation of a session for the same key results in one sts:AssumeRole call.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[Tuple[str, str, str], boto3.Session] = {}
+        self._lock = threading.Lock()
+        self._key_locks = defaultdict(threading.Lock)
+        self.assume_role_calls = 0
+
+    def get(self, key: Tuple[str, str, str], assume_role: Callable[[], dict]) -> boto3.Session:
+        session = self._sessions.get(key)
+        if session:
+            return session
+
+        with self._lock:
+            key_lock = self._key_locks[key]
+        with key_lock:
+            session = self._sessions.get(key)
+            if not session:
+                session = self._create_session(assume_role)
+                self._sessions[key] = session
+            return session
+
+    def clear(self):
+        with self._lock:
+            self._sessions.clear()
+            self._key_locks.clear()
+
+    def _create_session(self, assume_role):
+        def refresh():
+            self.assume_role_calls += 1
+            credentials = assume_role()
+            return {
+                'access_key': credentials['AccessKeyId'],
+                'secret_key': credentials['SecretAccessKey'],
+                'token': credentials['SessionToken'],
+                'expiry_time': credentials['Expiration'].isoformat(),
+            }
+
+        credentials = RefreshableCredentials.create_from_metadata(
+            metadata=refresh(),
+            refresh_using=refresh,
+            method='sts-assume-role',
+        )
+        core_session = botocore.session.get_session()
+        core_session._credentials = credentials
+        return ClientCachingSession(botocore_session=core_session)
+
+
+remote_session_cache = RemoteSessionCache()
+
+
 class SessionHelper:
     """SessionHelpers is a class simplifying common aws boto3 session tasks and helpers"""
 
@@ -35,39 +120,43 @@ class SessionHelper:
                     If role_arn is provided, base_session should be a boto3 session on the aws accountid is defined
         """
         if role_arn:
-            external_id_secret = cls.get_external_id_secret()
-            if external_id_secret:
-                assume_role_dict = dict(
-                    RoleArn=role_arn,
-                    RoleSessionName=role_arn.split('/')[1],
-                    ExternalId=external_id_secret,
-                )
-            else:
-                assume_role_dict = dict(
-                    RoleArn=role_arn,
-                    RoleSessionName=role_arn.split('/')[1],
-                )
-            try:
-                region = os.getenv('AWS_REGION', 'eu-west-1')
-                sts = base_session.client(
-                    'sts',
-                    config=Config(user_agent_extra=f'{__pkg_name__}/{__version__}'),
-                    region_name=region,
-                    endpoint_url=f"https://sts.{region}.amazonaws.com"
-                )
-                response = sts.assume_role(**assume_role_dict)
-                return boto3.Session(
-                    aws_access_key_id=response['Credentials']['AccessKeyId'],
-                    aws_secret_access_key=response['Credentials']['SecretAccessKey'],
-                    aws_session_token=response['Credentials']['SessionToken'],
-                )
-            except ClientError as e:
-                log.error(f'Failed to assume role {role_arn} due to: {e} ')
-                raise e
-
+            credentials = cls._assume_role(base_session, role_arn, cls.get_external_id_secret())
+            return boto3.Session(
+                aws_access_key_id=credentials['AccessKeyId'],
+                aws_secret_access_key=credentials['SecretAccessKey'],
+                aws_session_token=credentials['SessionToken'],
+            )
         else:
             return boto3.Session()
 
+    @classmethod
+    def _assume_role(cls, base_session, role_arn, external_id_secret=None):
+        """Assumes the role and returns the temporary credentials"""
+        if external_id_secret:
+            assume_role_dict = dict(
+                RoleArn=role_arn,
+                RoleSessionName=role_arn.split('/')[1],
+                ExternalId=external_id_secret,
+            )
+        else:
+            assume_role_dict = dict(
+                RoleArn=role_arn,
+                RoleSessionName=role_arn.split('/')[1],
+            )
+        try:
+            region = os.getenv('AWS_REGION', 'eu-west-1')
+            sts = base_session.client(
+                'sts',
+                config=Config(user_agent_extra=f'{__pkg_name__}/{__version__}'),
+                region_name=region,
+                endpoint_url=f"https://sts.{region}.amazonaws.com"
+            )
+            response = sts.assume_role(**assume_role_dict)
+            return response['Credentials']
+        except ClientError as e:
+            log.error(f'Failed to assume role {role_arn} due to: {e} ')
+            raise e
+
     @classmethod
     def _get_parameter_value(cls, parameter_path=None):
         """
@@ -80,12 +169,11 @@ class SessionHelper:
         if not parameter_path:
             raise Exception('Parameter name is None')
         try:
-            session = SessionHelper.get_session()
-            client = session.client('ssm', region_name=region)
-            parameter_value = client.get_parameter(Name=parameter_path)['Parameter']['Value']
-            log.debug(f'Found Parameter {parameter_path}|{parameter_value}')
+            parameter_value = parameter_cache.get(parameter_path, region)
         except ClientError as e:
-            log.warning(f'Parameter {parameter_path} not found: {e}')
+            log.warning(f'Parameter {parameter_path} could not be read: {e}')
+        if parameter_value is None:
+            log.warning(f'Parameter {parameter_path} not found')
         return parameter_value
 
     @classmethod
@@ -194,22 +282,25 @@ class SessionHelper:
 
     @classmethod
     def remote_session(cls, accountid, role=None):
-        """Creates a remote boto3 session on the remote AWS account , assuming the delegation Role
+        """Creates a remote boto3 session on the remote AWS account , assuming the delegation Role.
+        Sessions are cached per (account, role, external id) and refresh their credentials before expiry
         Args:
             accountid(string) : aws account id
             role(string) : arn of the IAM role to assume in the boto3 session
         Returns :
             boto3.session.Session: boto3 Session, on the target aws accountid, assuming the delegation role or a provided role
         """
-        base_session = cls.get_session()
         if role:
             log.info(f"Remote boto3 session using role={role} for account={accountid}")
             role_arn = role
         else:
             log.info(f"Remote boto3 session using pivot role for account= {accountid}")
             role_arn = cls.get_delegation_role_arn(accountid=accountid)
-        session = SessionHelper.get_session(base_session=base_session, role_arn=role_arn)
-        return session
+        external_id_secret = cls.get_external_id_secret()
+        return remote_session_cache.get(
+            key=(accountid, role_arn, external_id_secret),
+            assume_role=lambda: cls._assume_role(cls.get_session(), role_arn, external_id_secret),
+        )
 
     @classmethod
     def get_account(cls, session=None):
@@ -1,10 +1,21 @@
 """Reads and encapsulates the configuration provided in config.json"""
 import json
-import copy
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List
 import os
 from pathlib import Path
 
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Any:
+    """Returns a read-only view of the value: dicts become mappings that can't be modified and lists become tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 
 class _Config:
     """A container of properties in the configuration file
@@ -12,28 +23,24 @@ class _Config:
 
     def __init__(self):
         self._config = _Config._read_config_file()
+        self._properties: Dict[str, Any] = {}
+        self._listeners: List[Callable[[], None]] = []
+        self.refresh()
 
     def get_property(self, key: str, default=None) -> Any:
         """
-        Retrieves a copy of the property
+        Retrieves a read-only view of the property
         Config uses dot as a separator to navigate easy to the needed property e.g.
         some.needed.parameter is equivalent of config["some"]["needed"]["parameter"]
-        It enables fast navigation for any nested parameter
+        All dotted keys are computed when the config is loaded, so a lookup is a single dict access
         """
-        res = self._config
-
-        props = key.split(".")
-
-        # going through the hierarchy of json
-        for prop in props:
-            if prop not in res:
-                if default is not None:
-                    return default
-
-                raise KeyError(f"Couldn't find a property {key} in the config")
+        value = self._properties.get(key, _MISSING)
+        if value is _MISSING:
+            if default is not None:
+                return default
 
-            res = res[prop]
-        return copy.deepcopy(res)
+            raise KeyError(f"Couldn't find a property {key} in the config")
+        return value
 
     def set_property(self, key: str, value: Any) -> None:
         """
@@ -49,6 +56,30 @@ class _Config:
             else:
                 conf[prop] = conf[prop] if prop in conf is not None else {}
                 conf = conf[prop]
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Recompiles the read-only view of the config and notifies the listeners (e.g. resolved feature flags).
+        It's called by set_property, tests that change the config in another way must call it
+        """
+        properties = {}
+
+        def compile_properties(prefix: str, value: Any):
+            properties[prefix] = _freeze(value)
+            if isinstance(value, dict):
+                for prop, item in value.items():
+                    compile_properties(f"{prefix}.{prop}", item)
+
+        for prop, item in self._config.items():
+            compile_properties(prop, item)
+        self._properties = properties
+
+        for listener in self._listeners:
+            listener()
+
+    def add_refresh_listener(self, listener: Callable[[], None]) -> None:
+        self._listeners.append(listener)
 
     @staticmethod
     def _read_config_file() -> Dict[str, Any]:
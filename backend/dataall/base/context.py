@@ -7,8 +7,8 @@ The class uses Flask's approach to handle request: ThreadLocal
 That approach should work fine for AWS Lambdas and local server that uses Flask app
 """
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Container, List, Optional, Set, Tuple
 
 from dataall.base.db.connection import Engine
 from threading import local
@@ -17,6 +17,22 @@ from threading import local
 _request_storage = local()
 
 
+class PermissionCache:
+    """
+    Request-scoped cache of the permissions granted to the groups of the user.
+    It is filled lazily by the permission checker on the first check and invalidated
+    as soon as a resource or tenant policy is changed within the same request
+    """
+
+    def __init__(self):
+        self.resource_permissions: Optional[Set[Tuple[str, str]]] = None
+        self.tenant_permissions: Optional[Container[str]] = None
+
+    def invalidate(self) -> None:
+        self.resource_permissions = None
+        self.tenant_permissions = None
+
+
 @dataclass(frozen=True)
 class RequestContext:
     """Contains API for every graphql request"""
@@ -24,6 +40,7 @@ class RequestContext:
     username: str
     groups: List[str]
     user_id: str
+    permission_cache: PermissionCache = field(default_factory=PermissionCache, compare=False, repr=False)
 
 
 def get_context() -> RequestContext:
@@ -31,11 +48,26 @@ def get_context() -> RequestContext:
     return _request_storage.context
 
 
+def find_context() -> Optional[RequestContext]:
+    """Retrieves context associated with a request, None outside of a request"""
+    return getattr(_request_storage, 'context', None)
+
+
 def set_context(context: RequestContext) -> None:
     """Retrieves context associated with a request"""
     _request_storage.context = context
 
 
 def dispose_context() -> None:
-    """Dispose context after the request completion"""
+    """Dispose context and the database session of the request after the request completion"""
+    context: Optional[RequestContext] = getattr(_request_storage, 'context', None)
+    if context and context.db_engine:
+        context.db_engine.close_session()
     _request_storage.context = None
+
+
+def invalidate_permission_cache() -> None:
+    """Drops the permissions cached for the current request (if there is one)"""
+    context: Optional[RequestContext] = getattr(_request_storage, 'context', None)
+    if context:
+        context.permission_cache.invalidate()
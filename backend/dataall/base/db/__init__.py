@@ -9,5 +9,5 @@ from .connection import (
     has_column,
     drop_schema_if_exists,
 )
-from .dbconfig import DbConfig
-from .paginator import paginate
+from .dbconfig import DbConfig, DbPoolConfig
+from .paginator import paginate, paginate_by_cursor, is_cursor_pagination
@@ -1,15 +1,18 @@
 import json
 import logging
 import os
+import threading
 from contextlib import contextmanager
 
 import sqlalchemy
+from sqlalchemy import event
 from sqlalchemy.engine import reflection
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
 
 from dataall.base.aws.secrets_manager import SecretsManager
+from dataall.base.config import config
 from dataall.base.db import Base
-from dataall.base.db.dbconfig import DbConfig
+from dataall.base.db.dbconfig import DbConfig, DbPoolConfig
 from dataall.base.utils import Parameter
 from dataall.base.aws.sts import SessionHelper
 
@@ -23,12 +26,16 @@ ENVNAME = os.getenv('envname', 'local')
 
 
 class Engine:
-    def __init__(self, dbconfig: DbConfig):
+    def __init__(self, dbconfig: DbConfig, pool_config: DbPoolConfig = None):
         self.dbconfig = dbconfig
+        self.pool_config = pool_config or DbPoolConfig()
         self.engine = sqlalchemy.create_engine(
             dbconfig.url,
             echo=False,
-            pool_size=1,
+            pool_size=self.pool_config.pool_size,
+            max_overflow=self.pool_config.max_overflow,
+            pool_pre_ping=self.pool_config.pre_ping,
+            pool_recycle=self.pool_config.recycle,
             connect_args={'options': f"-csearch_path={dbconfig.schema}"},
         )
         try:
@@ -45,20 +52,40 @@ class Engine:
         except Exception as e:
             log.error(f'Could not create schema: {e}')
 
-        self.sessions = {}
-        self._session = None
+        # one session per thread (i.e. per request), nested scoped_session blocks share it
+        self._sessions = scoped_session(
+            sessionmaker(bind=self.engine, autoflush=True, expire_on_commit=False)
+        )
+        self._local = threading.local()
 
-    def session(self):
-        if self._session is None:
-            self._session = sessionmaker(
-                bind=self.engine, autoflush=True, expire_on_commit=False
-            )()
+        self._pool_lock = threading.Lock()
+        self._checkouts = 0
+        self._max_checked_out = 0
+        event.listen(self.engine, 'checkout', self._on_checkout)
 
-        return self._session
+    def session(self):
+        return self._sessions()
 
     @contextmanager
     def scoped_session(self):
+        """
+        Provides the session of the current thread. Nested blocks (e.g. permission decorators around
+        a service method) share the session and its transaction, only the outermost block commits and closes it.
+        An exception raised in a nested block rolls back the transaction, even if the caller catches it
+        """
+        depth = getattr(self._local, 'depth', 0)
         s = self.session()
+        self._local.depth = depth + 1
+        if depth > 0:
+            try:
+                yield s
+            except Exception as e:
+                s.rollback()
+                raise e
+            finally:
+                self._local.depth = depth
+            return
+
         try:
             yield s
             s.commit()
@@ -66,9 +93,33 @@ class Engine:
             s.rollback()
             raise e
         finally:
+            self._local.depth = depth
             s.close()
 
+    def close_session(self):
+        """Closes the session of the current thread. Called when a request is completed"""
+        if self._sessions.registry.has():
+            self._sessions().close()
+        self._local.depth = 0
+        log.debug(json.dumps({'event': 'db_pool', **self.pool_metrics()}))
+
+    def pool_metrics(self) -> dict:
+        pool = self.engine.pool
+        return {
+            'pool_size': pool.size(),
+            'checked_out': pool.checkedout(),
+            'overflow': max(pool.overflow(), 0),
+            'checkouts': self._checkouts,
+            'max_checked_out': self._max_checked_out,
+        }
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._pool_lock:
+            self._checkouts += 1
+            self._max_checked_out = max(self._max_checked_out, self.engine.pool.checkedout())
+
     def dispose(self):
+        self._sessions.remove()
         self.engine.dispose()
 
 
@@ -104,6 +155,20 @@ def drop_schema_if_exists(engine, envname):
         raise e
 
 
+def get_pool_config(envname=ENVNAME) -> DbPoolConfig:
+    """
+    Reads the connection pool settings from config.json (core.db.pool).
+    In the deployed environments the settings can be overridden by the aurora/pool SSM parameter
+    """
+    params = dict(config.get_property('core.db.pool', {}))
+    if envname not in ['local', 'pytest', 'dkrcompose']:
+        try:
+            params.update(json.loads(Parameter().get_parameter(env=envname, path='aurora/pool')))
+        except Exception as e:
+            log.debug(f'Using the connection pool settings from the config: {e}')
+    return DbPoolConfig.from_dict(params)
+
+
 def get_engine(envname=ENVNAME):
     if envname not in ['local', 'pytest', 'dkrcompose']:
         param_store = Parameter()
@@ -130,7 +195,7 @@ def get_engine(envname=ENVNAME):
             'pwd': 'docker',
             'schema': envname,
         }
-    return Engine(DbConfig(**db_params))
+    return Engine(DbConfig(**db_params), get_pool_config(envname))
 
 
 def has_table(table_name, engine):
@@ -57,3 +57,34 @@ class DbConfig:
             raise ValueError(f"Can't create a database connection. The {param_name} parameter has invalid symbols."
                              f" The sanitized string length: {len(sanitized)} <  original : {len(string)}")
         return sanitized
+
+
+class DbPoolConfig:
+    """Settings of the SQLAlchemy connection pool"""
+
+    def __init__(self, pool_size: int = 5, max_overflow: int = 10, pre_ping: bool = True, recycle: int = 3600):
+        if pool_size < 1:
+            raise ValueError(f"The pool size must be positive, got: {pool_size}")
+        if max_overflow < 0:
+            raise ValueError(f"The max overflow can't be negative, got: {max_overflow}")
+
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pre_ping = pre_ping
+        self.recycle = recycle
+
+    @classmethod
+    def from_dict(cls, params: dict) -> 'DbPoolConfig':
+        defaults = cls()
+        return cls(
+            pool_size=int(params.get('pool_size', defaults.pool_size)),
+            max_overflow=int(params.get('max_overflow', defaults.max_overflow)),
+            pre_ping=bool(params.get('pre_ping', defaults.pre_ping)),
+            recycle=int(params.get('recycle', defaults.recycle)),
+        )
+
+    def __str__(self):
+        return (
+            f'DbPoolConfig(pool_size={self.pool_size}, max_overflow={self.max_overflow}, '
+            f'pre_ping={self.pre_ping}, recycle={self.recycle})'
+        )
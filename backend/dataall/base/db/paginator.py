@@ -1,4 +1,14 @@
+import base64
+import json
+import logging
 import math
+from datetime import datetime
+
+from sqlalchemy import tuple_
+
+from dataall.base.db import exceptions
+
+log = logging.getLogger(__name__)
 
 __version__ = '0.0.2'
 
@@ -42,3 +52,105 @@ def paginate(query, page, page_size):
     items = query.limit(page_size).offset((page - 1) * page_size).all()
     total = query.order_by(None).count()
     return Page(items, page, page_size, total)
+
+
+COUNT_MODES = ('exact', 'estimate', 'none')
+
+
+class CursorPage(object):
+    """
+    A page of a keyset pagination. end_cursor is the opaque position of the last item,
+    it is passed back as `after` to fetch the next page. total is None when the count is skipped
+    """
+
+    def __init__(self, items, page_size, has_next, end_cursor, total=None, has_previous=False):
+        self.items = items
+        self.page_size = page_size
+        self.has_next = has_next
+        self.end_cursor = end_cursor
+        self.total = total
+        self.has_previous = has_previous
+
+    def to_dict(self):
+        return {
+            'count': self.total,
+            'pages': int(math.ceil(self.total / float(self.page_size))) if self.total is not None else None,
+            'page': None,
+            'pageSize': self.page_size,
+            'nodes': self.items,
+            'hasNext': self.has_next,
+            'hasPrevious': self.has_previous,
+            'nextPage': None,
+            'previousPage': None,
+            'endCursor': self.end_cursor,
+        }
+
+
+def encode_cursor(values) -> str:
+    payload = [{'$dt': value.isoformat()} if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        if not isinstance(payload, list):
+            raise TypeError('the cursor is not a list')
+        return [
+            datetime.fromisoformat(value['$dt']) if isinstance(value, dict) and '$dt' in value else value
+            for value in payload
+        ]
+    except (ValueError, TypeError):
+        raise exceptions.InvalidInput('after', cursor, 'a cursor returned as endCursor')
+
+
+def is_cursor_pagination(data) -> bool:
+    """Cursor pagination is requested with the `after` argument, an empty cursor starts from the first item"""
+    return bool(data) and data.get('after') is not None
+
+
+def paginate_by_cursor(query, keys, page_size, after=None, count_mode=None):
+    """
+    Keyset pagination on the keys, e.g. (sort key, primary key), in descending order.
+    Instead of skipping OFFSET rows, the query starts after the position encoded in the `after` cursor.
+    count_mode is `none` (default, no count), `exact` (COUNT query) or `estimate` (planner estimate)
+    """
+    if page_size <= 0:
+        raise AttributeError('page_size needs to be >= 1')
+    count_mode = count_mode or 'none'
+    if count_mode not in COUNT_MODES:
+        raise exceptions.InvalidInput('countMode', count_mode, f'one of {COUNT_MODES}')
+
+    paged = query.order_by(None).order_by(*[key.desc() for key in keys])
+    if after:
+        values = decode_cursor(after)
+        if len(values) != len(keys):
+            raise exceptions.InvalidInput('after', after, 'a cursor returned as endCursor')
+        paged = paged.filter(tuple_(*keys) < tuple_(*values))
+
+    items = paged.limit(page_size + 1).all()
+    has_next = len(items) > page_size
+    items = items[:page_size]
+    end_cursor = encode_cursor([getattr(items[-1], key.key) for key in keys]) if items else after
+
+    total = None
+    if count_mode == 'exact':
+        total = query.order_by(None).count()
+    elif count_mode == 'estimate':
+        total = estimate_count(query)
+    return CursorPage(items, page_size, has_next, end_cursor, total, has_previous=bool(after))
+
+
+def estimate_count(query):
+    """Returns the number of rows estimated by the postgres planner, it doesn't execute the query"""
+    session = query.session
+    statement = query.order_by(None).statement
+    compiled = statement.compile(dialect=session.get_bind().dialect)
+    try:
+        plan = session.connection().execute(f'EXPLAIN (FORMAT JSON) {compiled}', compiled.params).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+    except Exception as e:
+        log.warning(f'Failed to estimate the number of rows due to: {e}')
+        return None
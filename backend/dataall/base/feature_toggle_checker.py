@@ -1,17 +1,42 @@
 """
 Contains decorators that check if a feature has been enabled or not
 """
+from typing import Dict, Optional
+
 from dataall.base.config import config
 from dataall.base.utils.decorator_utls import process_func
 
+# feature flags resolved when the decorators are applied, None if the property is missing in the config
+_FEATURE_FLAGS: Dict[str, Optional[bool]] = {}
+
+
+def _resolve_feature_flag(config_property: str) -> Optional[bool]:
+    try:
+        return bool(config.get_property(config_property))
+    except KeyError:
+        return None
+
+
+def refresh_feature_flags() -> None:
+    """Resolves the feature flags again, it's called every time the config is refreshed"""
+    for config_property in _FEATURE_FLAGS:
+        _FEATURE_FLAGS[config_property] = _resolve_feature_flag(config_property)
+
+
+config.add_refresh_listener(refresh_feature_flags)
+
 
 def is_feature_enabled(config_property: str):
+    _FEATURE_FLAGS[config_property] = _resolve_feature_flag(config_property)
+
     def decorator(f):
         fn, fn_decorator = process_func(f)
 
         def decorated(*args, **kwargs):
-            value = config.get_property(config_property)
-            if not value:
+            enabled = _FEATURE_FLAGS[config_property]
+            if enabled is None:
+                raise KeyError(f"Couldn't find a property {config_property} in the config")
+            if not enabled:
                 raise Exception(f"Disabled by config {config_property}")
             return fn(*args, **kwargs)
 
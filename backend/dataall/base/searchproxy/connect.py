@@ -6,6 +6,7 @@ import opensearchpy
 from requests_aws4auth import AWS4Auth
 
 from dataall.base import utils
+from dataall.base.tracing import TracingTransport
 
 CREATE_INDEX_REQUEST_BODY = {
     'mappings': {
@@ -72,6 +73,7 @@ def connect(envname='local'):
             use_ssl=True,
             verify_certs=True,
             connection_class=opensearchpy.RequestsHttpConnection,
+            transport_class=TracingTransport,
         )
 
         # Avoid calling GET /info endpoint because it is not available in OpenSearch Serverless
@@ -94,6 +96,7 @@ def connect_dev_environment(envname):
             http_auth=('admin', 'admin'),
             scheme=url.scheme,
             port='9200',
+            transport_class=TracingTransport,
         )
         if not es.indices.exists(index='dataall-index'):
             es.indices.create(index='dataall-index', body=CREATE_INDEX_REQUEST_BODY)
@@ -0,0 +1,123 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Tuple
+
+from dataall.base.services.service_provider import ServiceProvider
+
+log = logging.getLogger(__name__)
+
+
+class ServiceProviderCache:
+    """
+    Thread-safe LRU cache with TTL of the answers of an identity provider.
+    An entry older than refresh_after is still served, but it is reloaded in the background,
+    an entry older than ttl is reloaded synchronously. Failed background reloads keep the old value.
+    """
+
+    def __init__(self, ttl: int = None, max_size: int = None, refresh_after: int = None):
+        self.ttl = ttl if ttl is not None else int(os.getenv('SERVICE_PROVIDER_CACHE_TTL', 300))
+        self.max_size = max_size if max_size is not None else int(os.getenv('SERVICE_PROVIDER_CACHE_MAX_SIZE', 1024))
+        self.refresh_after = refresh_after if refresh_after is not None else self.ttl // 2
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Hashable, Tuple[float, object]]' = OrderedDict()
+        self._refreshing = set()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='service-provider-cache')
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.errors = 0
+
+    def get(self, key: Hashable, load: Callable[[], object]):
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached and now - cached[0] < self.ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                if now - cached[0] >= self.refresh_after and key not in self._refreshing:
+                    self._refreshing.add(key)
+                    self._executor.submit(self._refresh, key, load)
+                return cached[1]
+            self.misses += 1
+
+        value = load()
+        self._store(key, value)
+        return value
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """Drops the entry or the whole cache if no key is given"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'refreshes': self.refreshes,
+            'errors': self.errors,
+            'hit_rate': self.hit_rate,
+            'size': len(self._entries),
+        }
+
+    def _refresh(self, key, load):
+        try:
+            value = load()
+        except Exception as e:
+            log.warning(f'Failed to refresh {key} in the background due to: {e}')
+            with self._lock:
+                self.errors += 1
+        else:
+            self._store(key, value)
+            with self._lock:
+                self.refreshes += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _store(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+class CachingServiceProvider(ServiceProvider):
+    """
+    Decorates any ServiceProvider implementation with a ServiceProviderCache.
+    Answers are cached per method and argument (group, user or user pool), copies are returned to the callers
+    """
+
+    def __init__(self, provider: ServiceProvider, cache: ServiceProviderCache = None):
+        self.provider = provider
+        self.cache = cache or ServiceProviderCache()
+
+    def get_user_emailids_from_group(self, groupName):
+        return list(self.cache.get(
+            ('get_user_emailids_from_group', groupName),
+            lambda: self.provider.get_user_emailids_from_group(groupName),
+        ) or [])
+
+    def get_groups_for_user(self, user_id):
+        return list(self.cache.get(
+            ('get_groups_for_user', user_id),
+            lambda: self.provider.get_groups_for_user(user_id),
+        ) or [])
+
+    def list_groups(self, envname: str, region: str):
+        return list(self.cache.get(
+            ('list_groups', envname, region),
+            lambda: self.provider.list_groups(envname, region),
+        ) or [])
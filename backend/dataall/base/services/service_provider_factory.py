@@ -1,12 +1,26 @@
 import os
+import threading
 
 from dataall.base.aws.cognito import Cognito
+from dataall.base.services.caching_service_provider import CachingServiceProvider
 
 
 class ServiceProviderFactory:
+    _instance = None
+    _lock = threading.Lock()
 
     @staticmethod
     def get_service_provider_instance():
+        """Returns the service provider of the container, its answers are cached (see CachingServiceProvider)"""
+        with ServiceProviderFactory._lock:
+            if ServiceProviderFactory._instance is None:
+                ServiceProviderFactory._instance = CachingServiceProvider(
+                    ServiceProviderFactory.create_service_provider()
+                )
+            return ServiceProviderFactory._instance
+
+    @staticmethod
+    def create_service_provider():
         if (os.environ.get("custom_auth", None)):
             # Return instance of your service provider which implements the ServiceProvider interface
             # Please take a look at the "Deploy to AWS" , External IDP section for steps
@@ -0,0 +1,163 @@
+"""
+Instrumentation of GraphQL operations.
+While an operation is traced, every SQL statement, AWS API call and OpenSearch request made by the thread
+is recorded with the path of the resolver that made it. At the end of the operation a summary (counts, total
+time and slowest calls) is logged as a JSON line and can be returned in the extensions of the GraphQL response.
+Outside of a traced operation the hooks only check a thread-local.
+"""
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import local
+from typing import Any, Dict, List, Optional
+
+import boto3
+import opensearchpy
+from sqlalchemy import event
+
+log = logging.getLogger(__name__)
+
+TRACING_HEADER = 'x-dataall-tracing'
+TRACING_ENVS = ['local', 'pytest', 'dkrcompose']
+SLOWEST_CALLS = 5
+MAX_NAME_LENGTH = 300
+
+_trace_storage = local()
+
+
+@dataclass
+class Span:
+    kind: str
+    name: str
+    path: Optional[str]
+    duration: float
+
+
+@dataclass
+class OperationTrace:
+    operation_name: Optional[str]
+    started: float = field(default_factory=time.perf_counter)
+    path: Optional[str] = None
+    spans: List[Span] = field(default_factory=list)
+
+    def record(self, kind: str, name: str, duration: float) -> None:
+        self.spans.append(Span(kind, name[:MAX_NAME_LENGTH], self.path, duration))
+
+    def summary(self) -> Dict[str, Any]:
+        counts: Dict[str, int] = {}
+        durations: Dict[str, float] = {}
+        for span in self.spans:
+            counts[span.kind] = counts.get(span.kind, 0) + 1
+            durations[span.kind] = durations.get(span.kind, 0) + span.duration
+        slowest = sorted(self.spans, key=lambda span: span.duration, reverse=True)[:SLOWEST_CALLS]
+        return {
+            'operationName': self.operation_name,
+            'durationMs': round((time.perf_counter() - self.started) * 1000, 2),
+            'counts': counts,
+            'durationsMs': {kind: round(duration * 1000, 2) for kind, duration in durations.items()},
+            'slowest': [
+                {'kind': span.kind, 'name': span.name, 'path': span.path, 'durationMs': round(span.duration * 1000, 2)}
+                for span in slowest
+            ],
+        }
+
+
+def current_trace() -> Optional[OperationTrace]:
+    return getattr(_trace_storage, 'trace', None)
+
+
+@contextmanager
+def trace_operation(operation_name: Optional[str]):
+    """Traces the calls made by the thread until the block exits, the summary is logged at the end"""
+    trace = OperationTrace(operation_name)
+    _trace_storage.trace = trace
+    try:
+        yield trace
+    finally:
+        _trace_storage.trace = None
+        log.info(json.dumps({'event': 'graphql_operation', **trace.summary()}, default=str))
+
+
+def set_resolver_path(path: str) -> Optional[str]:
+    """Tags the following calls with the resolver path, returns the previous path"""
+    trace = current_trace()
+    if not trace:
+        return None
+    previous, trace.path = trace.path, path
+    return previous
+
+
+def is_tracing_requested(headers, is_tenant_admin: bool = False) -> bool:
+    """
+    Tracing is returned in the response extensions if the debug header is set.
+    The trace exposes the SQL statements, it's returned only in the local environments or to the tenant admins
+    """
+    if not headers:
+        return False
+    value = next((value for name, value in headers.items() if name.lower() == TRACING_HEADER), None)
+    if str(value).lower() not in ('1', 'true'):
+        return False
+    return is_tenant_admin or os.getenv('envname', 'local') in TRACING_ENVS
+
+
+def _record(kind: str, name: str, duration: float) -> None:
+    trace = current_trace()
+    if trace:
+        trace.record(kind, name, duration)
+
+
+def instrument_engine(engine) -> None:
+    """Registers SQLAlchemy cursor hooks on the engine"""
+    if getattr(engine, '_dataall_traced', False):
+        return
+    engine._dataall_traced = True
+
+    # the start time is kept on the execution context, it's dropped with it when the statement fails
+    @event.listens_for(engine, 'before_cursor_execute')
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context.tracing_started = time.perf_counter()
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, 'tracing_started', None)
+        if started is not None:
+            _record('sql', ' '.join(statement.split()), time.perf_counter() - started)
+
+
+def _before_aws_call(model, context, **kwargs):
+    context['tracing_started'] = time.perf_counter()
+
+
+def _after_aws_call(model, context, **kwargs):
+    started = context.get('tracing_started')
+    if started is not None:
+        _record('aws', f'{model.service_model.service_name}.{model.name}', time.perf_counter() - started)
+
+
+def instrument_boto3_session(session) -> None:
+    """Registers botocore event hooks on the session, they apply to the clients it creates"""
+    session.events.register('before-call', _before_aws_call, unique_id='dataall-tracing-before-call')
+    session.events.register('after-call', _after_aws_call, unique_id='dataall-tracing-after-call')
+
+
+def instrument(engine) -> None:
+    """Instruments the SQLAlchemy engine and the default boto3 session used by boto3.client()"""
+    instrument_engine(engine)
+    if boto3.DEFAULT_SESSION is None:
+        boto3.setup_default_session()
+    instrument_boto3_session(boto3.DEFAULT_SESSION)
+
+
+class TracingTransport(opensearchpy.Transport):
+    """OpenSearch transport that records every request"""
+
+    def perform_request(self, method, url, headers=None, params=None, body=None):
+        started = time.perf_counter()
+        try:
+            return super().perform_request(method, url, headers=headers, params=params, body=body)
+        finally:
+            _record('opensearch', f'{method} {url}', time.perf_counter() - started)
@@ -1,20 +1,122 @@
 import json
 import logging
 import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
 
 import boto3
 from botocore.exceptions import ClientError
 
 log = logging.getLogger('utils:Parameter')
 
+_NOT_FOUND = object()
+
+
+class ParameterCache:
+    """
+    Process-wide, thread-safe TTL cache of SSM parameter values of the central account.
+    Missing parameters are cached as well (negative caching), so a lookup of an absent parameter
+    does not hit SSM on every call. Paths can be prefetched with get_parameters_by_path;
+    a missing name under a fresh prefetched path is known to be absent without calling SSM.
+    """
+
+    def __init__(self, ttl: int = None, negative_ttl: int = None):
+        self.ttl = ttl if ttl is not None else int(os.getenv('SSM_CACHE_TTL', 300))
+        self.negative_ttl = negative_ttl if negative_ttl is not None else int(os.getenv('SSM_CACHE_NEGATIVE_TTL', 60))
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, str], Tuple[float, object]] = {}
+        self._paths: Dict[Tuple[str, str], float] = {}
+        self._clients = {}
+        self.hits = 0
+        self.misses = 0
+
+    def client(self, region: str):
+        """boto3 clients are thread-safe, one client per region is reused"""
+        with self._lock:
+            if region not in self._clients:
+                self._clients[region] = boto3.client('ssm', region_name=region)
+            return self._clients[region]
+
+    def get(self, name: str, region: str = None) -> Optional[str]:
+        """Returns the value of the parameter or None if the parameter does not exist"""
+        region = region or os.getenv('AWS_REGION', 'eu-west-1')
+        key = (region, name)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._values.get(key)
+            if cached and cached[0] > now:
+                self.hits += 1
+                return None if cached[1] is _NOT_FOUND else cached[1]
+            if self._is_prefetched(region, name, now):
+                self.hits += 1
+                return None
+            self.misses += 1
+
+        try:
+            value = self.client(region).get_parameter(Name=name)['Parameter']['Value']
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ParameterNotFound':
+                raise e
+            value = _NOT_FOUND
+
+        self._store(key, value)
+        return None if value is _NOT_FOUND else value
+
+    def prefetch(self, path: str, region: str = None) -> None:
+        """Loads all parameters under the path with get_parameters_by_path"""
+        region = region or os.getenv('AWS_REGION', 'eu-west-1')
+        path = path.rstrip('/')
+        paginator = self.client(region).get_paginator('get_parameters_by_path')
+        loaded = {}
+        for page in paginator.paginate(Path=path, Recursive=True):
+            for parameter in page['Parameters']:
+                loaded[parameter['Name']] = parameter['Value']
+
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            for name, value in loaded.items():
+                self._values[(region, name)] = (expires, value)
+            self._paths[(region, path)] = expires
+        log.info(f'Prefetched {len(loaded)} parameters under {path}')
+
+    def invalidate(self, name: str = None, region: str = None) -> None:
+        """Drops the parameter (e.g. after it was written) or the whole cache if no name is given"""
+        with self._lock:
+            if name is None:
+                self._values.clear()
+                self._paths.clear()
+                return
+            region = region or os.getenv('AWS_REGION', 'eu-west-1')
+            self._values.pop((region, name), None)
+            for (path_region, path) in list(self._paths):
+                if path_region == region and name.startswith(f'{path}/'):
+                    del self._paths[(path_region, path)]
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._values)}
+
+    def _store(self, key, value):
+        ttl = self.negative_ttl if value is _NOT_FOUND else self.ttl
+        with self._lock:
+            self._values[key] = (time.monotonic() + ttl, value)
+
+    def _is_prefetched(self, region, name, now):
+        return any(
+            path_region == region and name.startswith(f'{path}/') and expires > now
+            for (path_region, path), expires in self._paths.items()
+        )
+
+
+parameter_cache = ParameterCache()
+
 
 class Parameter:
     prefix = 'dataall'
 
     @classmethod
     def ssm(cls):
-        client = boto3.client('ssm', region_name=os.getenv('AWS_REGION', 'eu-west-1'))
-        return client
+        return parameter_cache.client(os.getenv('AWS_REGION', 'eu-west-1'))
 
     @classmethod
     def get_parameter_name(cls, env, path=''):
@@ -34,26 +136,24 @@ class Parameter:
             Type='String',
             Overwrite=True,
         )
+        parameter_cache.invalidate(pname)
         return Parameter.get_parameter(env, path)
 
     @classmethod
     def get_parameter(cls, env, path=''):
         pname = cls.get_parameter_name(env, path)
-        ssm = cls.ssm()
         try:
-            param_value = ssm.get_parameter(Name=pname)['Parameter']['Value']
-            return param_value
+            param_value = parameter_cache.get(pname)
         except ClientError as e:
-            if e.response['Error']['Code'] == 'ParameterNotFound':
-                log.warning(
-                    'Parameter `{}` not found for env `{}`, defaulting to None'.format(
-                        path, env
-                    )
+            log.error('Error trying to retrieve parameter from SSM')
+            raise e
+        if param_value is None:
+            log.warning(
+                'Parameter `{}` not found for env `{}`, defaulting to None'.format(
+                    path, env
                 )
-                return None
-            else:
-                log.error('Error trying to retrieve parameter from SSM')
-                raise e
+            )
+        return param_value
 
     @classmethod
     def clean_environment(cls, env):
@@ -61,6 +161,7 @@ class Parameter:
         for p in params[env]:
             pname = Parameter.get_parameter_name(env=env, path=p['Name'])
             cls.ssm().delete_parameter(Name=pname)
+        parameter_cache.invalidate()
 
     @classmethod
     def get_parameters(cls, env, prefix=None):
@@ -1,5 +1,6 @@
 from . import (
     input_types,
+    loaders,
     mutations,
     queries,
     resolvers,
@@ -7,4 +8,4 @@ from . import (
     types,
 )
 
-__all__ = ['resolvers', 'types', 'input_types', 'queries', 'mutations', "enums"]
+__all__ = ['resolvers', 'types', 'input_types', 'loaders', 'queries', 'mutations', "enums"]
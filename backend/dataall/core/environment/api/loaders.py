@@ -0,0 +1,32 @@
+from dataall.base.api.dataloader import DataLoaderDefinition, DataLoaderRegistry
+from dataall.base.context import get_context
+from dataall.core.environment.db.environment_models import Environment
+from dataall.core.environment.db.environment_repositories import EnvironmentRepository
+from dataall.core.organizations.api.loaders import ORGANIZATION_LOADER
+
+ENVIRONMENT_LOADER = 'Environment'
+ENVIRONMENT_INVITED_GROUPS_LOADER = 'EnvironmentInvitedGroups'
+
+
+def _load_environments(session, uris):
+    return {env.environmentUri: env for env in EnvironmentRepository.find_environments_by_uris(session, uris)}
+
+
+def _load_invited_environments(session, uris):
+    """Checks which environments the groups of the current user are invited to"""
+    invited = EnvironmentRepository.find_environment_uris_with_groups(session, uris, get_context().groups)
+    return {uri: uri in invited for uri in uris}
+
+
+DataLoaderRegistry.register(DataLoaderDefinition(
+    name=ENVIRONMENT_LOADER,
+    batch_load_fn=_load_environments,
+))
+
+DataLoaderRegistry.register(DataLoaderDefinition(
+    name=ENVIRONMENT_INVITED_GROUPS_LOADER,
+    batch_load_fn=_load_invited_environments,
+    sources={Environment: 'environmentUri'},
+))
+
+DataLoaderRegistry.add_source(ORGANIZATION_LOADER, Environment, 'organizationUri')
@@ -11,6 +11,7 @@ from dataall.base.aws.iam import IAM
 from dataall.base.aws.parameter_store import ParameterStoreManager
 from dataall.base.aws.sts import SessionHelper
 from dataall.base.utils import Parameter
+from dataall.core.environment.api.loaders import ENVIRONMENT_INVITED_GROUPS_LOADER
 from dataall.core.environment.db.environment_models import EnvironmentGroup
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResourceManager
 from dataall.core.environment.services.environment_service import EnvironmentService
@@ -367,20 +368,8 @@ def resolve_user_role(context: Context, source: Environment):
         return EnvironmentPermission.Owner.value
     elif source.SamlGroupName in context.groups:
         return EnvironmentPermission.Admin.value
-    else:
-        with context.engine.scoped_session() as session:
-            env_group = (
-                session.query(EnvironmentGroup)
-                .filter(
-                    and_(
-                        EnvironmentGroup.environmentUri == source.environmentUri,
-                        EnvironmentGroup.groupUri.in_(context.groups),
-                    )
-                )
-                .first()
-            )
-            if env_group:
-                return EnvironmentPermission.Invited.value
+    elif context.loaders.get(ENVIRONMENT_INVITED_GROUPS_LOADER).load(source.environmentUri):
+        return EnvironmentPermission.Invited.value
     return EnvironmentPermission.NotInvited.value
 
 
@@ -504,6 +493,7 @@ def get_environment_stack(context: Context, source: Environment, **kwargs):
     return stack_helper.get_stack_with_cfn_resources(
         targetUri=source.environmentUri,
         environmentUri=source.environmentUri,
+        loaders=context.loaders,
     )
 
 
@@ -1,4 +1,4 @@
-from dataall.core.environment.db.environment_models import EnvironmentParameter, Environment
+from dataall.core.environment.db.environment_models import EnvironmentParameter, Environment, EnvironmentGroup
 from sqlalchemy.sql import and_
 
 from dataall.base.db import exceptions
@@ -44,3 +44,27 @@ class EnvironmentRepository:
         if not environment:
             raise exceptions.ObjectNotFound(Environment.__name__, uri)
         return environment
+
+    @staticmethod
+    def find_environments_by_uris(session, uris: [str]) -> [Environment]:
+        if not uris:
+            return []
+        return session.query(Environment).filter(Environment.environmentUri.in_(uris)).all()
+
+    @staticmethod
+    def find_environment_uris_with_groups(session, uris: [str], groups: [str]) -> {str}:
+        """Returns URIs of the environments (from the given ones) that any of the groups is invited to"""
+        if not uris or not groups:
+            return set()
+        rows = (
+            session.query(EnvironmentGroup.environmentUri)
+            .filter(
+                and_(
+                    EnvironmentGroup.environmentUri.in_(uris),
+                    EnvironmentGroup.groupUri.in_(groups),
+                )
+            )
+            .distinct()
+            .all()
+        )
+        return {uri for uri, in rows}
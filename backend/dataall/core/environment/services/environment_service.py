@@ -273,7 +273,7 @@ class EnvironmentService:
         env_group_permissions = []
         for p in g_permissions:
             env_group_permissions.append(
-                Permission.find_permission_by_name(
+                Permission.lookup(
                     session=session,
                     permission_name=p,
                     permission_type=PermissionType.RESOURCE.name,
@@ -388,7 +388,7 @@ class EnvironmentService:
         group_invitation_permissions = []
         for p in permissions.ENVIRONMENT_INVITATION_REQUEST:
             group_invitation_permissions.append(
-                Permission.find_permission_by_name(
+                Permission.lookup(
                     session=session,
                     permission_name=p,
                     permission_type=PermissionType.RESOURCE.name,
@@ -1,9 +1,10 @@
 from . import (
     input_types,
+    loaders,
     mutations,
     queries,
     resolvers,
     types,
 )
 
-__all__ = ['resolvers', 'types', 'input_types', 'queries', 'mutations']
+__all__ = ['resolvers', 'types', 'input_types', 'loaders', 'queries', 'mutations']
@@ -0,0 +1,14 @@
+from dataall.base.api.dataloader import DataLoaderDefinition, DataLoaderRegistry
+from dataall.core.organizations.db.organization_repositories import Organization
+
+ORGANIZATION_LOADER = 'Organization'
+
+
+def _load_organizations(session, uris):
+    return {org.organizationUri: org for org in Organization.find_organizations_by_uris(session, uris)}
+
+
+DataLoaderRegistry.register(DataLoaderDefinition(
+    name=ORGANIZATION_LOADER,
+    batch_load_fn=_load_organizations,
+))
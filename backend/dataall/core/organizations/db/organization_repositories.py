@@ -30,6 +30,16 @@ class Organization:
     def find_organization_by_uri(session, uri) -> models.Organization:
         return session.query(models.Organization).get(uri)
 
+    @staticmethod
+    def find_organizations_by_uris(session, uris: [str]) -> [models.Organization]:
+        if not uris:
+            return []
+        return (
+            session.query(models.Organization)
+            .filter(models.Organization.organizationUri.in_(uris))
+            .all()
+        )
+
     @staticmethod
     @has_tenant_permission(permissions.MANAGE_ORGANIZATIONS)
     def create_organization(session, data=None) -> models.Organization:
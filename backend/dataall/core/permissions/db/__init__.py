@@ -1,14 +1,39 @@
+import hashlib
 import logging
 
-from dataall.core.permissions.db import permission_models
 from dataall.core.permissions.db.permission_repositories import Permission
 from dataall.core.permissions.db.tenant_repositories import Tenant
 
 log = logging.getLogger("Permissions")
 
 
-def save_permissions_with_tenant(engine, envname=None):
+def permissions_fingerprint(permission_definitions=None) -> str:
+    """
+    Computes a fingerprint of a set of (type, name, description) permission definitions.
+    If no definitions are provided the fingerprint of the permissions defined in the code is computed
+    """
+    if permission_definitions is None:
+        permission_definitions = Permission.code_permission_definitions()
+    content = '\n'.join(
+        sorted(
+            f'{permission_type}:{name}:{description}'
+            for permission_type, name, description in permission_definitions
+        )
+    )
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def save_permissions_with_tenant(engine, envname=None, fingerprint: str = None):
+    """
+    Saves the tenant and all permissions defined in the code.
+    When the fingerprint of the permissions is provided, the permissions upsert is skipped if the database
+    is up-to-date. In both cases the in-process permission catalog is reloaded
+    """
     with engine.scoped_session() as session:
-        log.info('Initiating permissions')
         Tenant.save_tenant(session, name='dataall', description='Tenant dataall')
+        if fingerprint and permissions_fingerprint(Permission.list_permission_definitions(session)) == fingerprint:
+            log.info('Permissions are up-to-date')
+            return
+
+        log.info('Initiating permissions')
         Permission.init_permissions(session)
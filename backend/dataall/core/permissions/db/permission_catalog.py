@@ -0,0 +1,90 @@
+"""
+In-process catalog of the permission table.
+
+Permissions are defined in the code and saved to the database at deployment time, after that the table
+doesn't change. Instead of querying the table for every name -> URI resolution, the table is loaded once
+into an immutable index keyed by (name, type). One catalog is kept per database engine, the catalog is
+replaced as a whole when the permissions are saved or when an unknown permission is requested.
+"""
+import logging
+import threading
+import weakref
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Optional, Tuple, Union
+
+from dataall.core.permissions.db import permission_models as models
+from dataall.core.permissions.db.permission_models import PermissionType
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PermissionEntry:
+    """Read-only copy of a row of the permission table"""
+    permissionUri: str
+    name: str
+    type: PermissionType
+    description: str
+
+
+def _type_name(permission_type: Union[str, PermissionType]) -> str:
+    return permission_type.name if isinstance(permission_type, PermissionType) else permission_type
+
+
+class PermissionCatalog:
+    """Immutable index of permissions by (name, type) and by URI"""
+
+    def __init__(self, entries: Iterable[PermissionEntry]):
+        entries = tuple(entries)
+        self._by_key = MappingProxyType({(entry.name, entry.type.name): entry for entry in entries})
+        self._by_uri = MappingProxyType({entry.permissionUri: entry for entry in entries})
+
+    @classmethod
+    def load(cls, session) -> 'PermissionCatalog':
+        rows = session.query(
+            models.Permission.permissionUri,
+            models.Permission.name,
+            models.Permission.type,
+            models.Permission.description,
+        ).all()
+        log.debug(f'Loaded {len(rows)} permissions into the catalog')
+        return cls(PermissionEntry(*row) for row in rows)
+
+    def find(self, name: str, permission_type: Union[str, PermissionType]) -> Optional[PermissionEntry]:
+        return self._by_key.get((name, _type_name(permission_type)))
+
+    def find_by_uri(self, permission_uri: str) -> Optional[PermissionEntry]:
+        return self._by_uri.get(permission_uri)
+
+    def definitions(self) -> Iterable[Tuple[str, str, str]]:
+        """Returns (type, name, description) of all permissions"""
+        return [(entry.type.name, entry.name, entry.description) for entry in self._by_key.values()]
+
+    def __len__(self):
+        return len(self._by_key)
+
+
+_CATALOGS = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def get_permission_catalog(session) -> PermissionCatalog:
+    """Returns the catalog of the database the session is bound to, loading it on the first use"""
+    catalog = _CATALOGS.get(session.get_bind())
+    if catalog is None:
+        catalog = refresh_permission_catalog(session)
+    return catalog
+
+
+def refresh_permission_catalog(session) -> PermissionCatalog:
+    """Reloads the catalog from the database and replaces the current one"""
+    catalog = PermissionCatalog.load(session)
+    with _lock:
+        _CATALOGS[session.get_bind()] = catalog
+    return catalog
+
+
+def clear_permission_catalogs():
+    with _lock:
+        _CATALOGS.clear()
@@ -1,7 +1,7 @@
 import datetime
 import enum
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as DBEnum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, UniqueConstraint, Enum as DBEnum
 from sqlalchemy.orm import relationship
 
 from dataall.base.db import Base, utils
@@ -24,6 +24,7 @@ class Permission(Base):
 
 class TenantPolicy(Base):
     __tablename__ = 'tenant_policy'
+    __table_args__ = (UniqueConstraint('tenantUri', 'principalId', name='uq_tenant_policy_principal'),)
 
     sid = Column(String, primary_key=True, default=utils.uuid('tenant_policy'))
 
@@ -94,5 +95,6 @@ class Tenant(Base):
     tenantUri = Column(String, primary_key=True, default=utils.uuid('tenant'))
     name = Column(String, nullable=False, index=True, unique=True)
     description = Column(String, default='No description provided')
+    permissionsVersion = Column(Integer, nullable=False, default=0, server_default='0')
     created = Column(DateTime, default=datetime.datetime.now)
     updated = Column(DateTime, onupdate=datetime.datetime.now)
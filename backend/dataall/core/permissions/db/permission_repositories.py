@@ -1,5 +1,11 @@
 import logging
+from typing import Dict, List, Optional, Tuple
 
+from dataall.core.permissions.db.permission_catalog import (
+    PermissionEntry,
+    get_permission_catalog,
+    refresh_permission_catalog,
+)
 from dataall.core.permissions.db.permission_models import PermissionType
 from dataall.base.db import exceptions
 from dataall.core.permissions import permissions
@@ -10,10 +16,39 @@ logger = logging.getLogger(__name__)
 
 
 class Permission:
+    @staticmethod
+    def lookup(session, permission_name: str, permission_type: str) -> Optional[PermissionEntry]:
+        """
+        Resolves a permission from the in-process catalog. The catalog is reloaded once when the permission
+        is unknown, in case it was saved by another process
+        """
+        permission = get_permission_catalog(session).find(permission_name, permission_type)
+        if not permission:
+            permission = refresh_permission_catalog(session).find(permission_name, permission_type)
+        return permission
+
+    @staticmethod
+    def lookup_by_uri(session, permission_uri: str) -> Optional[PermissionEntry]:
+        permission = get_permission_catalog(session).find_by_uri(permission_uri)
+        if not permission:
+            permission = refresh_permission_catalog(session).find_by_uri(permission_uri)
+        return permission
+
+    @staticmethod
+    def get_permission_uris_by_names(session, permission_names: List[str], permission_type: str) -> Dict[str, str]:
+        result = {}
+        for name in permission_names:
+            permission = Permission.lookup(session, name, permission_type)
+            if not permission:
+                raise exceptions.ObjectNotFound('Permission', name)
+            result[name] = permission.permissionUri
+        return result
+
     @staticmethod
     def find_permission_by_name(
         session, permission_name: str, permission_type: str
     ) -> models.Permission:
+        """Returns the permission row, used by the writes and the migrations. Reads use lookup()"""
         if permission_name:
             permission = (
                 session.query(models.Permission)
@@ -87,48 +122,46 @@ class Permission:
         return permission
 
     @staticmethod
-    def init_permissions(session):
-        perms = []
-        count_resource_permissions = (
-            session.query(models.Permission)
-            .filter(models.Permission.type == PermissionType.RESOURCE.name)
-            .count()
-        )
+    def list_permission_definitions(session) -> List[Tuple[str, str, str]]:
+        """Returns (type, name, description) of all saved permissions"""
+        return refresh_permission_catalog(session).definitions()
 
-        logger.debug(f'count_resource_permissions: {count_resource_permissions}, RESOURCES_ALL: {len(permissions.RESOURCES_ALL_WITH_DESC)}')
-
-        if count_resource_permissions < len(permissions.RESOURCES_ALL_WITH_DESC):
-            for name, desc in permissions.RESOURCES_ALL_WITH_DESC.items():
-                perms.append(
-                    Permission.save_permission(
-                        session,
-                        name=name,
-                        description=desc,
-                        permission_type=PermissionType.RESOURCE.name,
-                    )
-                )
-                logger.info(f'Saved permission {name} successfully')
-            logger.info(f'Saved {len(perms)} resource permissions successfully')
+    @staticmethod
+    def code_permission_definitions() -> List[Tuple[str, str, str]]:
+        """Returns (type, name, description) of all permissions defined in the code"""
+        return [
+            (permission_type.name, name, desc if desc else f'Allows {name}')
+            for permission_type, definitions in [
+                (PermissionType.RESOURCE, permissions.RESOURCES_ALL_WITH_DESC),
+                (PermissionType.TENANT, permissions.TENANT_ALL_WITH_DESC),
+            ]
+            for name, desc in definitions.items()
+        ]
 
-        count_tenant_permissions = (
-            session.query(models.Permission)
-            .filter(models.Permission.type == PermissionType.TENANT.name)
-            .count()
-        )
+    @staticmethod
+    def init_permissions(session) -> List[models.Permission]:
+        """
+        Saves the permissions defined in the code that are missing in the database
+        and updates the descriptions that changed. Returns the added permissions
+        """
+        catalog = refresh_permission_catalog(session)
+        perms = []
+        updated = 0
+        for permission_type, name, description in Permission.code_permission_definitions():
+            saved = catalog.find(name, permission_type)
+            if not saved:
+                perms.append(models.Permission(name=name, description=description, type=permission_type))
+            elif saved.description != description:
+                session.query(models.Permission).filter(
+                    models.Permission.permissionUri == saved.permissionUri
+                ).update({models.Permission.description: description}, synchronize_session=False)
+                updated += 1
 
-        logger.debug(f'count_tenant_permissions: {count_tenant_permissions}, TENANT_ALL: {len(permissions.TENANT_ALL_WITH_DESC)}')
-
-        if count_tenant_permissions < len(permissions.TENANT_ALL_WITH_DESC):
-            for name, desc in permissions.TENANT_ALL_WITH_DESC.items():
-                perms.append(
-                    Permission.save_permission(
-                        session,
-                        name=name,
-                        description=desc,
-                        permission_type=PermissionType.TENANT.name,
-                    )
-                )
-                logger.info(f'Saved permission {name} successfully')
-            logger.info(f'Saved {len(perms)} permissions successfully')
+        logger.debug(f'Saved permissions: {len(catalog)}, missing permissions: {len(perms)}, updated: {updated}')
+
+        if perms or updated:
+            session.add_all(perms)
             session.commit()
+            refresh_permission_catalog(session)
+            logger.info(f'Saved {len(perms)} permissions and updated {updated} descriptions successfully')
         return perms
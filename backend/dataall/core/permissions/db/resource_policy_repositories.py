@@ -1,11 +1,14 @@
 import logging
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional, Set, Tuple
 
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.sql import and_
 
+from dataall.base.context import invalidate_permission_cache
 from dataall.core.permissions.db.permission_repositories import Permission
 from dataall.core.permissions.db.permission_models import PermissionType
-from dataall.base.db import exceptions
+from dataall.base.db import exceptions, utils
 from dataall.core.permissions.db import permission_models as models
 
 logger = logging.getLogger(__name__)
@@ -40,22 +43,21 @@ class ResourcePolicy:
         if not username or not permission_name or not resource_uri:
             return None
 
+        permission = Permission.lookup(session, permission_name, PermissionType.RESOURCE.name)
+        if not permission:
+            return None
+
         policy: models.ResourcePolicy = (
             session.query(models.ResourcePolicy)
             .join(
                 models.ResourcePolicyPermission,
                 models.ResourcePolicy.sid == models.ResourcePolicyPermission.sid,
             )
-            .join(
-                models.Permission,
-                models.Permission.permissionUri
-                == models.ResourcePolicyPermission.permissionUri,
-            )
             .filter(
                 and_(
                     models.ResourcePolicy.principalId.in_(groups),
                     models.ResourcePolicy.principalType == 'GROUP',
-                    models.Permission.name == permission_name,
+                    models.ResourcePolicyPermission.permissionUri == permission.permissionUri,
                     models.ResourcePolicy.resourceUri == resource_uri,
                 )
             )
@@ -67,6 +69,33 @@ class ResourcePolicy:
         else:
             return policy
 
+    @staticmethod
+    def get_groups_resource_permissions(session, groups: [str]) -> Set[Tuple[str, str]]:
+        """Returns all (resourceUri, permission name) pairs granted to the groups in a single query"""
+        if not groups:
+            return set()
+
+        rows = (
+            session.query(models.ResourcePolicy.resourceUri, models.ResourcePolicyPermission.permissionUri)
+            .join(
+                models.ResourcePolicyPermission,
+                models.ResourcePolicy.sid == models.ResourcePolicyPermission.sid,
+            )
+            .filter(
+                and_(
+                    models.ResourcePolicy.principalId.in_(groups),
+                    models.ResourcePolicy.principalType == 'GROUP',
+                )
+            )
+            .all()
+        )
+        names = {}
+        for _, permission_uri in rows:
+            if permission_uri not in names:
+                permission = Permission.lookup_by_uri(session, permission_uri)
+                names[permission_uri] = permission.name if permission else None
+        return {(resource_uri, names[permission_uri]) for resource_uri, permission_uri in rows if names[permission_uri]}
+
     @staticmethod
     def has_group_resource_permission(
         session, group_uri: str, resource_uri: str, permission_name: str
@@ -75,22 +104,21 @@ class ResourcePolicy:
         if not group_uri or not permission_name or not resource_uri:
             return None
 
+        permission = Permission.lookup(session, permission_name, PermissionType.RESOURCE.name)
+        if not permission:
+            return None
+
         policy: models.ResourcePolicy = (
             session.query(models.ResourcePolicy)
             .join(
                 models.ResourcePolicyPermission,
                 models.ResourcePolicy.sid == models.ResourcePolicyPermission.sid,
             )
-            .join(
-                models.Permission,
-                models.Permission.permissionUri
-                == models.ResourcePolicyPermission.permissionUri,
-            )
             .filter(
                 and_(
                     models.ResourcePolicy.principalId == group_uri,
                     models.ResourcePolicy.principalType == 'GROUP',
-                    models.Permission.name == permission_name,
+                    models.ResourcePolicyPermission.permissionUri == permission.permissionUri,
                     models.ResourcePolicy.resourceUri == resource_uri,
                 )
             )
@@ -135,15 +163,150 @@ class ResourcePolicy:
             group, permissions, resource_uri, resource_type
         )
 
-        policy = ResourcePolicy.save_resource_policy(
-            session, group, resource_uri, resource_type
+        ResourcePolicy.attach_resource_policies(
+            session, [(group, resource_uri, permissions)], resource_type
         )
+        return ResourcePolicy.find_resource_policy(session, group, resource_uri)
 
-        ResourcePolicy.add_permission_to_resource_policy(
-            session, group, permissions, resource_uri, policy
+    @staticmethod
+    def attach_resource_policies(
+        session,
+        grants: List[Tuple[str, str, List[str]]],
+        resource_type: str,
+    ) -> int:
+        """
+        Grants the permissions to the groups on the resources, given as (group, resource_uri, permissions) triples.
+        Existing policies and permissions are read in one query, the missing ones are inserted with
+        one multi-row INSERT per table and committed once. Returns the number of added permissions
+        """
+        for group, resource_uri, permissions in grants:
+            ResourcePolicy.validate_attach_resource_policy_params(
+                group, permissions, resource_uri, resource_type
+            )
+        if not grants:
+            return 0
+
+        permission_uris = Permission.get_permission_uris_by_names(
+            session,
+            list({name for _, _, permissions in grants for name in permissions}),
+            permission_type=PermissionType.RESOURCE.name,
         )
+        groups = {group for group, _, _ in grants}
+        resource_uris = {resource_uri for _, resource_uri, _ in grants}
 
-        return policy
+        rows = (
+            session.query(
+                models.ResourcePolicy.principalId,
+                models.ResourcePolicy.resourceUri,
+                models.ResourcePolicy.sid,
+                models.ResourcePolicyPermission.permissionUri,
+            )
+            .outerjoin(
+                models.ResourcePolicyPermission,
+                models.ResourcePolicy.sid == models.ResourcePolicyPermission.sid,
+            )
+            .filter(
+                and_(
+                    models.ResourcePolicy.principalId.in_(groups),
+                    models.ResourcePolicy.resourceUri.in_(resource_uris),
+                )
+            )
+            .all()
+        )
+        policies = {}
+        existing = set()
+        for principal_id, resource_uri, sid, permission_uri in rows:
+            policies.setdefault((principal_id, resource_uri), sid)
+            existing.add((principal_id, resource_uri, permission_uri))
+
+        now = datetime.now()
+        new_policies = []
+        new_permissions = {}
+        for group, resource_uri, permissions in grants:
+            sid = policies.get((group, resource_uri))
+            if not sid:
+                sid = utils.uuid('resource_policy')(None)
+                policies[(group, resource_uri)] = sid
+                new_policies.append(
+                    dict(
+                        sid=sid,
+                        principalId=group,
+                        principalType='GROUP',
+                        resourceUri=resource_uri,
+                        resourceType=resource_type,
+                        created=now,
+                    )
+                )
+            for name in permissions:
+                permission_uri = permission_uris[name]
+                if (group, resource_uri, permission_uri) not in existing:
+                    new_permissions[(sid, permission_uri)] = dict(sid=sid, permissionUri=permission_uri, created=now)
+
+        if new_policies:
+            session.execute(models.ResourcePolicy.__table__.insert().values(new_policies))
+        if new_permissions:
+            session.execute(
+                insert(models.ResourcePolicyPermission.__table__)
+                .values(list(new_permissions.values()))
+                .on_conflict_do_nothing()
+            )
+        if new_policies or new_permissions:
+            ResourcePolicy._expire_policy_permissions(session, {sid for sid, _ in new_permissions})
+            session.commit()
+            invalidate_permission_cache()
+        return len(new_permissions)
+
+    @staticmethod
+    def detach_resource_policies(session, policies: List[Tuple[str, str]]) -> int:
+        """
+        Deletes the policies of the groups on the resources, given as (group, resource_uri) pairs,
+        with one DELETE per table and one commit. Returns the number of deleted policies
+        """
+        for group, resource_uri in policies:
+            ResourcePolicy.validate_delete_resource_policy_params(group, resource_uri)
+        if not policies:
+            return 0
+
+        pairs = set(policies)
+        sids = [
+            sid
+            for sid, principal_id, resource_uri in (
+                session.query(
+                    models.ResourcePolicy.sid,
+                    models.ResourcePolicy.principalId,
+                    models.ResourcePolicy.resourceUri,
+                )
+                .filter(
+                    and_(
+                        models.ResourcePolicy.principalId.in_({group for group, _ in pairs}),
+                        models.ResourcePolicy.resourceUri.in_({resource_uri for _, resource_uri in pairs}),
+                    )
+                )
+            )
+            if (principal_id, resource_uri) in pairs
+        ]
+        if not sids:
+            return 0
+
+        session.query(models.ResourcePolicyPermission).filter(
+            models.ResourcePolicyPermission.sid.in_(sids)
+        ).delete(synchronize_session=False)
+        session.query(models.ResourcePolicy).filter(
+            models.ResourcePolicy.sid.in_(sids)
+        ).delete(synchronize_session=False)
+        for obj in list(session.identity_map.values()):
+            if isinstance(obj, (models.ResourcePolicy, models.ResourcePolicyPermission)) and obj.sid in sids:
+                session.expunge(obj)
+        session.commit()
+        invalidate_permission_cache()
+        return len(sids)
+
+    @staticmethod
+    def _expire_policy_permissions(session, sids):
+        """Rows written with bulk statements bypass the session, so loaded policies must reload permissions"""
+        for obj in list(session.identity_map.values()):
+            if isinstance(obj, models.ResourcePolicy) and obj.sid in sids:
+                session.expire(obj, ['permissions'])
 
     @staticmethod
     def delete_resource_policy(
@@ -162,6 +325,7 @@ class ResourcePolicy:
                 session.delete(permission)
             session.delete(policy)
             session.commit()
+            invalidate_permission_cache()
 
         return True
 
@@ -251,9 +415,9 @@ class ResourcePolicy:
             raise exceptions.RequiredParameter(param_name='permission')
         policy_permission = models.ResourcePolicyPermission(
             sid=policy.sid,
-            permissionUri=Permission.get_permission_by_name(
-                session, permission, permission_type=PermissionType.RESOURCE.name
-            ).permissionUri,
+            permissionUri=Permission.get_permission_uris_by_names(
+                session, [permission], permission_type=PermissionType.RESOURCE.name
+            )[permission],
         )
         session.add(policy_permission)
         session.commit()
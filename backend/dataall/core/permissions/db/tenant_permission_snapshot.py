@@ -0,0 +1,103 @@
+"""
+In-process snapshot of the tenant permissions of all groups.
+
+Tenant permissions are checked on almost every mutation but change only when an admin edits the permissions
+of a team. The snapshot keeps, for each group, a bitset over the tenant permissions and is built with a single
+query. It is tagged with the permissions version of the tenant, which is bumped in the same transaction as
+every change of a tenant policy, so a snapshot is reused as long as the version stored in the database matches.
+"""
+import logging
+import threading
+import weakref
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping
+
+from dataall.core.permissions import permissions
+from dataall.core.permissions.db import permission_models as models
+from dataall.core.permissions.db.permission_repositories import Permission
+from dataall.core.permissions.db.tenant_repositories import Tenant
+
+log = logging.getLogger(__name__)
+
+
+class GroupsTenantPermissions:
+    """Tenant permissions granted to a set of groups, `permission in granted` is evaluated with a bit test"""
+
+    def __init__(self, bits: Mapping[str, int], mask: int):
+        self._bits = bits
+        self._mask = mask
+
+    def __contains__(self, permission: str) -> bool:
+        return bool(self._mask & self._bits.get(permission, 0))
+
+
+class TenantPermissionSnapshot:
+    """Immutable per-group bitsets of the tenant permissions at a given version of the tenant policies"""
+
+    def __init__(self, version: int, bits: Dict[str, int], masks: Dict[str, int]):
+        self.version = version
+        self._bits = MappingProxyType(bits)
+        self._masks = MappingProxyType(masks)
+
+    @classmethod
+    def build(cls, session, tenant_name: str, version: int) -> 'TenantPermissionSnapshot':
+        rows = (
+            session.query(models.TenantPolicy.principalId, models.TenantPolicyPermission.permissionUri)
+            .join(models.Tenant, models.Tenant.tenantUri == models.TenantPolicy.tenantUri)
+            .outerjoin(
+                models.TenantPolicyPermission,
+                models.TenantPolicy.sid == models.TenantPolicyPermission.sid,
+            )
+            .filter(models.Tenant.name == tenant_name)
+            .all()
+        )
+
+        # the known permissions come first, so that the same permission keeps the same bit across snapshots
+        bits = {name: 1 << index for index, name in enumerate(dict.fromkeys(permissions.TENANT_ALL))}
+        masks = {}
+        for group, permission_uri in rows:
+            masks.setdefault(group, 0)
+            permission = Permission.lookup_by_uri(session, permission_uri) if permission_uri else None
+            if permission:
+                bit = bits.setdefault(permission.name, 1 << len(bits))
+                masks[group] |= bit
+
+        log.debug(f'Built tenant permission snapshot of {len(masks)} groups at version {version}')
+        return cls(version, bits, masks)
+
+    def has_policy(self, group: str) -> bool:
+        return group in self._masks
+
+    def for_groups(self, groups: Iterable[str]) -> GroupsTenantPermissions:
+        mask = 0
+        for group in groups or []:
+            mask |= self._masks.get(group, 0)
+        return GroupsTenantPermissions(self._bits, mask)
+
+    def has_permission(self, groups: Iterable[str], permission: str) -> bool:
+        return permission in self.for_groups(groups)
+
+    def permission_names(self, groups: Iterable[str]) -> List[str]:
+        granted = self.for_groups(groups)
+        return [name for name in self._bits if name in granted]
+
+
+_SNAPSHOTS = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def get_tenant_permission_snapshot(session, tenant_name: str) -> TenantPermissionSnapshot:
+    """Returns the snapshot of the tenant, it is rebuilt only if the tenant policies changed since it was built"""
+    bind = session.get_bind()
+    version = Tenant.get_permissions_version(session, tenant_name)
+    snapshot = _SNAPSHOTS.get(bind, {}).get(tenant_name)
+    if snapshot is None or snapshot.version != version:
+        snapshot = TenantPermissionSnapshot.build(session, tenant_name, version)
+        with _lock:
+            _SNAPSHOTS.setdefault(bind, {})[tenant_name] = snapshot
+    return snapshot
+
+
+def clear_tenant_permission_snapshots():
+    with _lock:
+        _SNAPSHOTS.clear()
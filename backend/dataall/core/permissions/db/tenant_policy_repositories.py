@@ -1,18 +1,32 @@
 import logging
+import threading
+import weakref
+from datetime import datetime
+from typing import List
 
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.sql import and_
 
+from dataall.base.context import invalidate_permission_cache
 from dataall.core.permissions.db.permission_models import PermissionType
-from dataall.base.db import exceptions, paginate
+from dataall.base.db import exceptions, paginate, utils
 from dataall.core.permissions import permissions
 from dataall.core.permissions.db import permission_models as models
 from dataall.core.permissions.db.permission_repositories import Permission
+from dataall.core.permissions.db.tenant_permission_snapshot import (
+    GroupsTenantPermissions,
+    get_tenant_permission_snapshot,
+)
 from dataall.core.permissions.db.tenant_repositories import Tenant as TenantService
 
 logger = logging.getLogger(__name__)
 
 TENANT_NAME = 'dataall'
 
+# groups known to have a tenant policy, per database engine and tenant. Lives as long as the Lambda container
+_KNOWN_GROUPS = weakref.WeakKeyDictionary()
+_known_groups_lock = threading.Lock()
+
 
 class TenantPolicy:
     @staticmethod
@@ -56,6 +70,9 @@ class TenantPolicy:
     ):
         if not username or not permission_name:
             return False
+        permission = Permission.lookup(session, permission_name, PermissionType.TENANT.name)
+        if not permission:
+            return None
         tenant_policy: models.TenantPolicy = (
             session.query(models.TenantPolicy)
             .join(
@@ -66,20 +83,20 @@ class TenantPolicy:
                 models.Tenant,
                 models.Tenant.tenantUri == models.TenantPolicy.tenantUri,
             )
-            .join(
-                models.Permission,
-                models.Permission.permissionUri
-                == models.TenantPolicyPermission.permissionUri,
-            )
             .filter(
                 models.TenantPolicy.principalId.in_(groups),
-                models.Permission.name == permission_name,
+                models.TenantPolicyPermission.permissionUri == permission.permissionUri,
                 models.Tenant.name == tenant_name,
             )
             .first()
         )
         return tenant_policy
 
+    @staticmethod
+    def get_groups_tenant_permissions(session, groups: [str], tenant_name: str) -> GroupsTenantPermissions:
+        """Returns the tenant permissions granted to the groups, evaluated from the tenant permission snapshot"""
+        return get_tenant_permission_snapshot(session, tenant_name).for_groups(groups)
+
     @staticmethod
     def has_group_tenant_permission(
         session, group_uri: str, tenant_name: str, permission_name: str
@@ -87,6 +104,10 @@ class TenantPolicy:
         if not group_uri or not permission_name:
             return False
 
+        permission = Permission.lookup(session, permission_name, PermissionType.TENANT.name)
+        if not permission:
+            return False
+
         tenant_policy: models.TenantPolicy = (
             session.query(models.TenantPolicy)
             .join(
@@ -97,15 +118,10 @@ class TenantPolicy:
                 models.Tenant,
                 models.Tenant.tenantUri == models.TenantPolicy.tenantUri,
             )
-            .join(
-                models.Permission,
-                models.Permission.permissionUri
-                == models.TenantPolicyPermission.permissionUri,
-            )
             .filter(
                 and_(
                     models.TenantPolicy.principalId == group_uri,
-                    models.Permission.name == permission_name,
+                    models.TenantPolicyPermission.permissionUri == permission.permissionUri,
                     models.Tenant.name == tenant_name,
                 )
             )
@@ -158,9 +174,73 @@ class TenantPolicy:
         TenantPolicy.add_permission_to_group_tenant_policy(
             session, group, permissions, tenant_name, policy
         )
+        TenantService.bump_permissions_version(session, tenant_name)
+        session.commit()
 
+        invalidate_permission_cache()
         return policy
 
+    @staticmethod
+    def ensure_group_tenant_policies(
+        session,
+        groups: [str],
+        permissions: [str],
+        tenant_name: str,
+    ) -> List[str]:
+        """
+        Idempotently creates the tenant policies of the groups that have none, granting them the permissions.
+        Groups already seen by this container cost no query, the new ones are provisioned with one
+        INSERT ... ON CONFLICT per table. Returns the groups whose policy was created
+        """
+        bind = session.get_bind()
+        known = _KNOWN_GROUPS.get(bind, {}).get(tenant_name, set())
+        unknown = list(dict.fromkeys(group for group in groups if group and group not in known))
+        if not unknown:
+            return []
+
+        TenantPolicy.validate_attach_tenant_policy(unknown[0], permissions, tenant_name)
+        tenant = TenantService.get_tenant_by_name(session, tenant_name)
+        permission_uris = Permission.get_permission_uris_by_names(
+            session, permissions, PermissionType.TENANT.name
+        )
+
+        now = datetime.now()
+        created = session.execute(
+            insert(models.TenantPolicy.__table__)
+            .values([
+                dict(
+                    sid=utils.uuid('tenant_policy')(None),
+                    tenantUri=tenant.tenantUri,
+                    principalId=group,
+                    principalType='GROUP',
+                    created=now,
+                )
+                for group in unknown
+            ])
+            .on_conflict_do_nothing(constraint='uq_tenant_policy_principal')
+            .returning(models.TenantPolicy.sid, models.TenantPolicy.principalId)
+        ).fetchall()
+
+        if created:
+            session.execute(
+                insert(models.TenantPolicyPermission.__table__)
+                .values([
+                    dict(sid=sid, permissionUri=permission_uri, created=now)
+                    for sid, _ in created
+                    for permission_uri in permission_uris.values()
+                ])
+                .on_conflict_do_nothing()
+            )
+            TenantService.bump_permissions_version(session, tenant_name)
+        session.commit()
+
+        with _known_groups_lock:
+            _KNOWN_GROUPS.setdefault(bind, {}).setdefault(tenant_name, set()).update(unknown)
+        if created:
+            logger.info(f'Attached tenant policies to the groups {[group for _, group in created]}')
+            invalidate_permission_cache()
+        return [group for _, group in created]
+
     @staticmethod
     def validate_attach_tenant_policy(group, permissions, tenant_name):
         if not group:
@@ -233,9 +313,9 @@ class TenantPolicy:
     def associate_permission_to_tenant_policy(session, policy, permission):
         policy_permission = models.TenantPolicyPermission(
             sid=policy.sid,
-            permissionUri=Permission.get_permission_by_name(
-                session, permission, PermissionType.TENANT.name
-            ).permissionUri,
+            permissionUri=Permission.get_permission_uris_by_names(
+                session, [permission], PermissionType.TENANT.name
+            )[permission],
         )
         session.add(policy_permission)
         session.commit()
@@ -270,8 +350,12 @@ class TenantPolicy:
             for permission in policy.permissions:
                 session.delete(permission)
             session.delete(policy)
+            TenantService.bump_permissions_version(session, tenant_name)
             session.commit()
+            invalidate_permission_cache()
 
+        with _known_groups_lock:
+            _KNOWN_GROUPS.get(session.get_bind(), {}).get(tenant_name, set()).discard(group)
         return True
 
     @staticmethod
@@ -337,7 +421,7 @@ class TenantPolicy:
         group_invitation_permissions = []
         for p in permissions.TENANT_ALL:
             group_invitation_permissions.append(
-                Permission.find_permission_by_name(
+                Permission.lookup(
                     session=session,
                     permission_name=p,
                     permission_type=PermissionType.TENANT.name,
@@ -387,7 +471,7 @@ class TenantPolicy:
         tenant_group_permissions = []
         for p in g_permissions:
             tenant_group_permissions.append(
-                Permission.find_permission_by_name(
+                Permission.lookup(
                     session=session,
                     permission_name=p,
                     permission_type=PermissionType.TENANT.name,
@@ -40,3 +40,20 @@ class Tenant:
             session.add(tenant)
             session.commit()
         return tenant
+
+    @staticmethod
+    def get_permissions_version(session, tenant_name: str) -> int:
+        """Returns the version of the tenant policies, it changes every time a tenant policy is changed"""
+        version = (
+            session.query(models.Tenant.permissionsVersion)
+            .filter(models.Tenant.name == tenant_name)
+            .scalar()
+        )
+        return version or 0
+
+    @staticmethod
+    def bump_permissions_version(session, tenant_name: str) -> None:
+        session.query(models.Tenant).filter(models.Tenant.name == tenant_name).update(
+            {models.Tenant.permissionsVersion: models.Tenant.permissionsVersion + 1},
+            synchronize_session=False,
+        )
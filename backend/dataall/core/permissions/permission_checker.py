@@ -5,6 +5,7 @@ and interact with resources or do some actions in the app
 from typing import Protocol, Callable
 
 from dataall.base.context import RequestContext, get_context
+from dataall.base.db import exceptions
 from dataall.core.permissions.db.resource_policy_repositories import ResourcePolicy
 from dataall.core.permissions.db.tenant_policy_repositories import TenantPolicy
 from dataall.base.utils.decorator_utls import process_func
@@ -18,24 +19,40 @@ class Identifiable(Protocol):
 
 def _check_tenant_permission(session, permission):
     context: RequestContext = get_context()
-    TenantPolicy.check_user_tenant_permission(
-        session=session,
-        username=context.username,
-        groups=context.groups,
-        tenant_name='dataall',
-        permission_name=permission
-    )
+    if TenantPolicy.is_tenant_admin(context.groups):
+        return
+
+    cache = context.permission_cache
+    if cache.tenant_permissions is None:
+        cache.tenant_permissions = TenantPolicy.get_groups_tenant_permissions(
+            session=session,
+            groups=context.groups,
+            tenant_name='dataall',
+        )
+
+    if not context.username or permission not in cache.tenant_permissions:
+        raise exceptions.TenantUnauthorized(
+            username=context.username,
+            action=permission,
+            tenant_name='dataall',
+        )
 
 
 def _check_resource_permission(session, uri, permission):
     context: RequestContext = get_context()
-    ResourcePolicy.check_user_resource_permission(
-        session=session,
-        username=context.username,
-        groups=context.groups,
-        resource_uri=uri,
-        permission_name=permission,
-    )
+    cache = context.permission_cache
+    if cache.resource_permissions is None:
+        cache.resource_permissions = ResourcePolicy.get_groups_resource_permissions(
+            session=session,
+            groups=context.groups,
+        )
+
+    if not context.username or (uri, permission) not in cache.resource_permissions:
+        raise exceptions.ResourceUnauthorized(
+            username=context.username,
+            action=permission,
+            resource_uri=uri,
+        )
 
 
 def has_resource_permission(
@@ -5,6 +5,7 @@ from . import (
     resolvers,
     stack_helper,
     types,
+    loaders,
 )
 
-__all__ = ['resolvers', 'types', 'input_types', 'queries', 'mutations', 'stack_helper']
+__all__ = ['resolvers', 'types', 'input_types', 'loaders', 'queries', 'mutations', 'stack_helper']
@@ -0,0 +1,19 @@
+from dataall.base.api.dataloader import DataLoaderDefinition, DataLoaderRegistry
+from dataall.core.environment.db.environment_models import Environment
+from dataall.core.stacks.db.stack_repositories import Stack
+
+STACK_LOADER = 'Stack'
+
+
+def _load_stacks(session, target_uris):
+    stacks = {}
+    for stack in Stack.find_stacks_by_target_uris(session, target_uris):
+        stacks.setdefault(stack.targetUri, stack)
+    return stacks
+
+
+DataLoaderRegistry.register(DataLoaderDefinition(
+    name=STACK_LOADER,
+    batch_load_fn=_load_stacks,
+    sources={Environment: 'environmentUri'},
+))
@@ -3,8 +3,11 @@ import os
 import requests
 
 from dataall.core.tasks.service_handlers import Worker
+from dataall.base.api.dataloader import DataLoaders
 from dataall.base.config import config
 from dataall.base.context import get_context
+from dataall.core.environment.api.loaders import ENVIRONMENT_LOADER
+from dataall.core.stacks.api.loaders import STACK_LOADER
 from dataall.core.environment.db.environment_models import Environment
 from dataall.core.stacks.aws.ecs import Ecs
 from dataall.core.stacks.db.stack_repositories import Stack
@@ -13,13 +16,18 @@ from dataall.core.tasks.db.task_models import Task
 from dataall.base.utils import Parameter
 
 
-def get_stack_with_cfn_resources(targetUri: str, environmentUri: str):
+def get_stack_with_cfn_resources(targetUri: str, environmentUri: str, loaders: DataLoaders = None):
     context = get_context()
+    if loaders:
+        env: Environment = loaders.get(ENVIRONMENT_LOADER).load(environmentUri)
+        stack: StackModel = loaders.get(STACK_LOADER).load(targetUri)
+
     with context.db_engine.scoped_session() as session:
-        env: Environment = session.query(Environment).get(environmentUri)
-        stack: StackModel = Stack.find_stack_by_target_uri(
-            session, target_uri=targetUri
-        )
+        if not loaders:
+            env: Environment = session.query(Environment).get(environmentUri)
+            stack: StackModel = Stack.find_stack_by_target_uri(
+                session, target_uri=targetUri
+            )
         if not stack:
             stack = StackModel(
                 stack='environment',
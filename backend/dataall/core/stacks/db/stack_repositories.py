@@ -31,6 +31,16 @@ class Stack:
         )
         return stack
 
+    @staticmethod
+    def find_stacks_by_target_uris(session, target_uris: [str]) -> [models.Stack]:
+        if not target_uris:
+            return []
+        return (
+            session.query(models.Stack)
+            .filter(models.Stack.targetUri.in_(target_uris))
+            .all()
+        )
+
     @staticmethod
     def get_stack_by_uri(session, stack_uri):
         stack = Stack.find_stack_by_uri(session, stack_uri)
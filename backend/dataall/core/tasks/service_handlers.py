@@ -1,8 +1,13 @@
 import logging
 import os
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import wraps
 
+from dataall.base.context import dispose_context, find_context, set_context
 from dataall.core.tasks.db.task_models import Task
 from dataall.base.utils.json_utils import to_json
 
@@ -19,67 +24,199 @@ class WorkerHandler:
             WorkerHandler._instance = WorkerHandler()
         return WorkerHandler._instance
 
-    def __init__(self):
+    def __init__(self, max_workers: int = None):
         self.handlers = {}
+        self.limits = {}
+        self.max_workers = max_workers or int(os.getenv('WORKER_MAX_THREADS', '4'))
         self.enabled = True
+        self.sender = self._log_tasks
+        self._outbox = threading.local()
 
     def queue(self, engine, task_ids: [str]):
+        """Sends the tasks to the worker, or collects them if an outbox is open in the current thread"""
+        pending = getattr(self._outbox, 'task_ids', None)
+        if pending is not None:
+            pending.extend(task_ids)
+        else:
+            self.sender(engine, task_ids)
+
+    @contextmanager
+    def outbox(self, engine):
+        """
+        Collects the tasks queued within the block (e.g. a GraphQL request) and sends them at its end at once.
+        Tasks with the same action and target are sent once, the duplicates are marked as skipped.
+        The block has already committed when the tasks are sent, so a failure to send them is logged and not raised:
+        the tasks are persisted and stay pending
+        """
+        self._outbox.task_ids = []
+        try:
+            yield
+        finally:
+            task_ids, self._outbox.task_ids = self._outbox.task_ids, None
+            if task_ids:
+                try:
+                    self.sender(engine, WorkerHandler.deduplicate_tasks(engine, task_ids))
+                except Exception as e:
+                    log.exception(f'Failed to send the tasks {task_ids} due to: {e}')
+
+    @staticmethod
+    def deduplicate_tasks(engine, task_ids: [str]) -> [str]:
+        unique = {}
+        with engine.scoped_session() as session:
+            tasks = {task.taskUri: task for task in session.query(Task).filter(Task.taskUri.in_(task_ids))}
+            for taskid in dict.fromkeys(task_ids):
+                task = tasks.get(taskid)
+                key = (task.action, task.targetUri) if task else taskid
+                unique.setdefault(key, taskid)
+
+            duplicates = set(task_ids) - set(unique.values())
+            if duplicates:
+                log.info(f'Skipping duplicated tasks {duplicates}')
+                session.query(Task).filter(Task.taskUri.in_(duplicates)).update(
+                    {Task.status: 'skipped'}, synchronize_session=False
+                )
+                session.commit()
+        return list(unique.values())
+
+    @staticmethod
+    def _log_tasks(engine, task_ids: [str]):
         log.info(f'Queuing Task Ids: {task_ids}')
 
-    def handler(self, path):
+    def handler(self, path, max_concurrency: int = None):
+        """
+        Registers the handler of the tasks with the given action.
+        max_concurrency limits the number of tasks of this action running at the same time
+        """
         def decorator(fn):
             self.handlers[path] = fn
+            if max_concurrency:
+                self.limits[path] = threading.BoundedSemaphore(max_concurrency)
             return fn
 
         return decorator
 
-    def process(self, engine, task_ids: [str], save_response=True):
+    def process(self, engine, task_ids: [str], save_response=True, retry_failed=False):
+        """
+        Processes all tasks of the message. Tasks of different targets run concurrently on a bounded
+        thread pool, tasks of the same target run one after another in the order of the message.
+        Tasks that can't be started (unknown, not pending, no handler) are skipped, failed tasks are started
+        again only with retry_failed (e.g. when the message is received again).
+        If the status of the tasks could not be saved, they are put back to pending and the error is raised,
+        so the message can be retried
+        """
         tasks_responses = []
-        if self.enabled:
-            for taskid in task_ids:
-                try:
-                    log.info(f'Processing Task: {taskid}')
-                    handler, task = self.get_task_handler(engine, taskid)
+        if not self.enabled:
+            log.info(f'Worker disabled, tasks {task_ids} wont be processed')
+            return tasks_responses
 
-                    error, response, status = self.handle_task(engine, task, handler)
-                    if save_response:
-                        WorkerHandler.update_task(
-                            engine, taskid, error, to_json(response), status
-                        )
-
-                    else:
-                        WorkerHandler.update_task(engine, taskid, error, {}, status)
-                    tasks_responses.append(
-                        {
-                            'taskUri': taskid,
-                            'response': response,
-                            'error': error,
-                            'status': status,
-                        }
-                    )
-                    return tasks_responses
-                except Exception as e:
-                    log.exception('Error in process')
-                    log.error(f'Task processing failed {e} : {taskid}')
+        tasks = self.start_tasks(engine, task_ids, ('pending', 'failed') if retry_failed else ('pending',))
+        groups = defaultdict(list)
+        for task, handler in tasks:
+            groups[task.targetUri].append((task, handler))
+
+        if len(groups) <= 1:
+            results = [self._run_group(engine, group) for group in groups.values()]
         else:
-            log.info(f'Worker disabled, tasks {task_ids} wont be processed')
+            # the handlers may need the request context (e.g. the local server processes the tasks of a request)
+            context = find_context()
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(groups))) as executor:
+                results = list(
+                    executor.map(lambda group: self._run_group_in_context(engine, group, context), groups.values())
+                )
 
-    def get_task_handler(self, engine, taskid):
-        with engine.scoped_session() as session:
-            task = session.query(Task).get(taskid)
-            handler = self.handlers.get(task.action)
-            log.info(
-                f' found handler {handler} for task action {task.action}|{task.taskUri}'
-            )
-            if task.status != 'pending':
-                raise Exception(
-                    f'Could not start task {task.taskUri} as its status is {task.status}'
+        for group_results in results:
+            for task, error, response, status in group_results:
+                tasks_responses.append(
+                    {
+                        'taskUri': task.taskUri,
+                        'response': response,
+                        'error': error,
+                        'status': status,
+                    }
                 )
-            if not handler:
-                raise Exception(f'No handler defined for {task.action}')
-            task.status = 'started'
+
+        try:
+            WorkerHandler.update_tasks(
+                engine,
+                [
+                    {
+                        'taskUri': r['taskUri'],
+                        'error': r['error'],
+                        'response': to_json(r['response']) if save_response else {},
+                        'status': r['status'],
+                    }
+                    for r in tasks_responses
+                ],
+            )
+        except Exception as e:
+            log.error(f'Failed to save the status of the tasks {task_ids} due to: {e}')
+            WorkerHandler.reset_tasks(engine, [task.taskUri for task, _ in tasks])
+            raise e
+        return tasks_responses
+
+    def start_tasks(self, engine, task_ids: [str], statuses=('pending',)):
+        """Starts the tasks in the given statuses that have a handler with one UPDATE, returns (task, handler) pairs"""
+        started = []
+        with engine.scoped_session() as session:
+            tasks = {task.taskUri: task for task in session.query(Task).filter(Task.taskUri.in_(task_ids))}
+            for taskid in task_ids:
+                task = tasks.get(taskid)
+                if not task:
+                    log.error(f'Could not start task {taskid} as it does not exist')
+                    continue
+                handler = self.handlers.get(task.action)
+                log.info(f' found handler {handler} for task action {task.action}|{task.taskUri}')
+                if task.status not in statuses:
+                    log.error(f'Could not start task {task.taskUri} as its status is {task.status}')
+                elif not handler:
+                    log.error(f'No handler defined for {task.action}')
+                else:
+                    started.append((task, handler))
+
+            if started:
+                session.query(Task).filter(
+                    Task.taskUri.in_([task.taskUri for task, _ in started])
+                ).update({Task.status: 'started'}, synchronize_session=False)
             session.commit()
-        return handler, task
+            for task, _ in started:
+                session.expunge(task)
+                task.status = 'started'
+        return started
+
+    @staticmethod
+    def reset_tasks(engine, task_ids: [str]):
+        """Puts the started tasks back to pending, so that they are processed when the message is retried"""
+        if not task_ids:
+            return
+        try:
+            with engine.scoped_session() as session:
+                session.query(Task).filter(Task.taskUri.in_(task_ids), Task.status == 'started').update(
+                    {Task.status: 'pending'}, synchronize_session=False
+                )
+        except Exception as e:
+            log.error(f'Failed to put the tasks {task_ids} back to pending due to: {e}')
+
+    def _run_group_in_context(self, engine, group, context):
+        if context is None:
+            return self._run_group(engine, group)
+        set_context(context)
+        try:
+            return self._run_group(engine, group)
+        finally:
+            dispose_context()
+
+    def _run_group(self, engine, group):
+        results = []
+        for task, handler in group:
+            log.info(f'Processing Task: {task.taskUri}')
+            limit = self.limits.get(task.action)
+            if limit:
+                with limit:
+                    error, response, status = self.handle_task(engine, task, handler)
+            else:
+                error, response, status = self.handle_task(engine, task, handler)
+            results.append((task, error, response, status))
+        return results
 
     @staticmethod
     def handle_task(engine, task: Task, handler):
@@ -106,6 +243,15 @@ class WorkerHandler:
             session.commit()
             return task
 
+    @staticmethod
+    def update_tasks(engine, updates: [dict]):
+        """Saves status, error and response of many tasks in one batch"""
+        if not updates:
+            return
+        with engine.scoped_session() as session:
+            session.bulk_update_mappings(Task, updates)
+            session.commit()
+
     @classmethod
     def retry(cls, exception, tries=4, delay=3, backoff=2, logger=None):
         """
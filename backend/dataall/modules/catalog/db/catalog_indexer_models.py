@@ -0,0 +1,10 @@
+from sqlalchemy import Column, String, DateTime
+
+from dataall.base.db import Base
+
+
+class CatalogIndexerState(Base):
+    """High-water mark of the last successful run of a catalog indexer"""
+    __tablename__ = 'catalog_indexer_state'
+    indexer = Column(String, primary_key=True)
+    lastIndexed = Column(DateTime, nullable=False)
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Optional
+
+from dataall.modules.catalog.db.catalog_indexer_models import CatalogIndexerState
+
+
+class CatalogIndexerStateRepository:
+
+    @staticmethod
+    def get_last_indexed(session, indexer: str) -> Optional[datetime]:
+        state = session.query(CatalogIndexerState).get(indexer)
+        return state.lastIndexed if state else None
+
+    @staticmethod
+    def set_last_indexed(session, indexer: str, last_indexed: datetime):
+        state = session.query(CatalogIndexerState).get(indexer)
+        if state:
+            state.lastIndexed = last_indexed
+        else:
+            session.add(CatalogIndexerState(indexer=indexer, lastIndexed=last_indexed))
@@ -388,9 +388,15 @@ class GlossaryRepository:
         current_links = session.query(TermLink).filter(
             TermLink.targetUri == target_uri
         )
+        unlinked = False
         for current_link in current_links:
-            if current_link not in glossary_terms:
+            if current_link.nodeUri not in glossary_terms:
                 session.delete(current_link)
+                unlinked = True
+        if unlinked:
+            # removed links leave no trace for the incremental catalog indexing, the target is reindexed now
+            session.flush()
+            GlossaryRegistry.reindex(session, target_type, target_uri)
         for nodeUri in glossary_terms:
 
             term = session.query(GlossaryNode).get(nodeUri)
@@ -414,6 +420,19 @@ class GlossaryRepository:
                     session.add(new_link)
                     session.commit()
 
+    @staticmethod
+    def find_targets_linked_since(session, since, target_type=None) -> set:
+        """
+        Returns the targets whose term links were created or updated (e.g. approved) after the given time.
+        Removed links are not tracked, set_glossary_terms_links reindexes their target when it deletes them
+        """
+        q = session.query(TermLink.targetUri).filter(
+            or_(TermLink.created > since, TermLink.updated > since)
+        )
+        if target_type:
+            q = q.filter(TermLink.targetType == target_type)
+        return {row.targetUri for row in q.distinct()}
+
     @staticmethod
     def get_glossary_terms_links(session, target_uri, target_type):
         """Used in dependent modules get assigned glossary terms to resources"""
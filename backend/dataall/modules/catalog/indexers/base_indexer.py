@@ -1,8 +1,10 @@
+import json
 import logging
 import os
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from datetime import datetime
-from operator import and_
+from typing import Dict, List
 
 from sqlalchemy.orm import with_expression
 
@@ -11,6 +13,9 @@ from dataall.base.searchproxy import connect
 
 log = logging.getLogger(__name__)
 
+BULK_BATCH_SIZE = int(os.getenv('CATALOG_INDEXER_BATCH_SIZE', '500'))
+BULK_BATCH_BYTES = int(os.getenv('CATALOG_INDEXER_BATCH_BYTES', str(5 * 1024 * 1024)))
+
 
 class BaseIndexer(ABC):
     """API to work with OpenSearch"""
@@ -51,8 +56,22 @@ class BaseIndexer(ABC):
             log.error(f'ES config is missing doc {doc} for id {doc_id} was not indexed')
             return False
 
+    @classmethod
+    def _bulk(cls, body):
+        es = cls.es()
+        res = es.bulk(index=cls._INDEX, body=body)
+        log.info(f'{len(body)} bulk lines sent with errors={res.get("errors")}')
+        return res
+
     @staticmethod
     def _get_target_glossary_terms(session, target_uri):
+        return BaseIndexer._get_glossary_terms_by_target(session, [target_uri]).get(target_uri, [])
+
+    @staticmethod
+    def _get_glossary_terms_by_target(session, target_uris: List[str] = None) -> Dict[str, List[str]]:
+        """Returns the approved glossary terms of the targets, or of all targets if target_uris is None"""
+        if target_uris is not None and not target_uris:
+            return {}
         q = (
             session.query(TermLink)
             .options(
@@ -64,10 +83,68 @@ class BaseIndexer(ABC):
                 GlossaryNode, GlossaryNode.nodeUri == TermLink.nodeUri
             )
             .filter(
-                and_(
-                    TermLink.targetUri == target_uri,
-                    TermLink.approvedBySteward.is_(True),
-                )
+                TermLink.approvedBySteward.is_(True),
             )
         )
-        return [t.path for t in q]
+        if target_uris is not None:
+            q = q.filter(TermLink.targetUri.in_(target_uris))
+
+        terms = defaultdict(list)
+        for link in q:
+            terms[link.targetUri].append(link.path)
+        return terms
+
+
+class BulkIndexWriter:
+    """
+    Buffers index and delete actions and sends them to OpenSearch with the _bulk API.
+    A batch is sent when it reaches batch_size actions or batch_bytes of payload and on flush()
+    """
+
+    def __init__(self, batch_size: int = BULK_BATCH_SIZE, batch_bytes: int = BULK_BATCH_BYTES):
+        self._batch_size = batch_size
+        self._batch_bytes = batch_bytes
+        self._actions = []
+        self._bytes = 0
+        self.indexed = 0
+        self.deleted = 0
+        self.failed = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
+
+    def index(self, doc_id, doc):
+        doc['_indexed'] = datetime.now()
+        self._add([{'index': {'_id': doc_id}}, doc])
+
+    def delete(self, doc_id):
+        self._add([{'delete': {'_id': doc_id}}])
+
+    def flush(self):
+        if not self._actions:
+            return
+
+        actions, self._actions, self._bytes = self._actions, [], 0
+        response = BaseIndexer._bulk([line for action in actions for line in action])
+        failed = 0
+        for item in (response or {}).get('items', []):
+            (operation, result), = item.items()
+            if 'error' in result and not (operation == 'delete' and result.get('status') == 404):
+                failed += 1
+                log.error(f'Failed to {operation} doc {result.get("_id")}: {result["error"]}')
+
+        deleted = sum(1 for action in actions if 'delete' in action[0])
+        self.deleted += deleted
+        self.indexed += len(actions) - deleted
+        self.failed += failed
+
+    def _add(self, action):
+        size = sum(len(json.dumps(line, default=str)) + 1 for line in action)
+        if self._actions and (len(self._actions) >= self._batch_size or self._bytes + size > self._batch_bytes):
+            self.flush()
+        self._actions.append(action)
+        self._bytes += size
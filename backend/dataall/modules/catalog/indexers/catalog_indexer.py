@@ -1,5 +1,11 @@
 from abc import ABC
-from typing import List
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+
+
+class IndexingResult(NamedTuple):
+    indexed: int
+    failed: int = 0
 
 
 class CatalogIndexer(ABC):
@@ -12,5 +18,12 @@ class CatalogIndexer(ABC):
     def all():
         return CatalogIndexer._INDEXERS
 
-    def index(self, session) -> int:
+    def name(self) -> str:
+        return type(self).__name__
+
+    def index(self, session, since: Optional[datetime] = None) -> IndexingResult:
+        """
+        Indexes the objects created, updated or deleted after `since`, or all objects if `since` is None.
+        Returns the number of indexed objects and the number of documents that OpenSearch failed to index
+        """
         raise NotImplementedError("index is not implemented")
@@ -1,7 +1,9 @@
 import logging
 import os
 import sys
+from datetime import datetime
 
+from dataall.modules.catalog.db.catalog_indexer_repositories import CatalogIndexerStateRepository
 from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
 from dataall.base.db import get_engine
 from dataall.base.loader import load_modules, ImportMode
@@ -14,13 +16,31 @@ if not root.hasHandlers():
 log = logging.getLogger(__name__)
 
 
-def index_objects(engine):
+def index_objects(engine, full_rebuild=False):
+    """
+    Runs all catalog indexers. Unless full_rebuild is set, an indexer only indexes the objects
+    changed since its last successful run. If some documents failed to be indexed, the last run of the indexer
+    is not moved forward, so they are indexed again by the next run, and the task fails
+    """
     try:
         indexed_objects_counter = 0
+        failed_indexers = []
         with engine.scoped_session() as session:
             for indexer in CatalogIndexer.all():
-                indexed_objects_counter += indexer.index(session)
-
+                started = datetime.now()
+                since = None if full_rebuild else CatalogIndexerStateRepository.get_last_indexed(session, indexer.name())
+                log.info(f'Running {indexer.name()} ' + (f'for changes since {since}' if since else 'for all objects'))
+                result = indexer.index(session, since=since)
+                indexed_objects_counter += result.indexed
+                if result.failed:
+                    log.error(f'{indexer.name()} failed to index {result.failed} documents')
+                    failed_indexers.append(indexer.name())
+                    continue
+                CatalogIndexerStateRepository.set_last_indexed(session, indexer.name(), started)
+                session.commit()
+
+            if failed_indexers:
+                raise Exception(f'Failed to index documents of {failed_indexers}')
             log.info(f'Successfully indexed {indexed_objects_counter} objects')
             return indexed_objects_counter
     except Exception as e:
@@ -31,6 +51,7 @@ def index_objects(engine):
 if __name__ == '__main__':
     ENVNAME = os.environ.get('envname', 'local')
     ENGINE = get_engine(envname=ENVNAME)
+    FULL_REBUILD = os.environ.get('fullRebuild', 'False') == 'True'
 
     load_modules({ImportMode.CATALOG_INDEXER_TASK})
-    index_objects(engine=ENGINE)
+    index_objects(engine=ENGINE, full_rebuild=FULL_REBUILD)
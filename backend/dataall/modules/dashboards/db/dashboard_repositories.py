@@ -47,6 +47,14 @@ class DashboardRepository(EnvironmentResource):
         session.commit()
         return dashboard
 
+    @staticmethod
+    def find_dashboards_changed_since(session, since, dashboard_uris=None) -> [Dashboard]:
+        """Returns dashboards created or updated after the given time and the dashboards with the given URIs"""
+        changed = or_(Dashboard.created > since, Dashboard.updated > since)
+        if dashboard_uris:
+            changed = or_(changed, Dashboard.dashboardUri.in_(dashboard_uris))
+        return session.query(Dashboard).filter(changed).all()
+
     @staticmethod
     def get_dashboard_by_uri(session, uri) -> Dashboard:
         dashboard: Dashboard = session.query(Dashboard).get(uri)
@@ -1,19 +1,31 @@
 import logging
+from datetime import datetime
+from typing import Optional
 
-from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
-from dataall.modules.dashboards import Dashboard
+from dataall.modules.catalog.db.glossary_repositories import GlossaryRepository
+from dataall.modules.catalog.indexers.base_indexer import BulkIndexWriter
+from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer, IndexingResult
+from dataall.modules.dashboards import Dashboard, DashboardRepository
 from dataall.modules.dashboards.indexers.dashboard_indexer import DashboardIndexer
+from dataall.modules.vote.db.vote_repositories import VoteRepository
 
 log = logging.getLogger(__name__)
 
 
 class DashboardCatalogIndexer(CatalogIndexer):
 
-    def index(self, session) -> int:
-        all_dashboards: [Dashboard] = session.query(Dashboard).all()
-        log.info(f'Found {len(all_dashboards)} dashboards')
-        dashboard: Dashboard
-        for dashboard in all_dashboards:
-            DashboardIndexer.upsert(session=session, dashboard_uri=dashboard.dashboardUri)
+    def index(self, session, since: Optional[datetime] = None) -> IndexingResult:
+        if since is None:
+            dashboards: [Dashboard] = session.query(Dashboard).all()
+        else:
+            # a new term link or an upvote changes the document of the dashboard
+            targets = (
+                GlossaryRepository.find_targets_linked_since(session, since, target_type='Dashboard')
+                | VoteRepository.find_targets_voted_since(session, since, target_type='dashboard')
+            )
+            dashboards = DashboardRepository.find_dashboards_changed_since(session, since, list(targets))
+        log.info(f'Found {len(dashboards)} dashboards')
+        with BulkIndexWriter() as writer:
+            DashboardIndexer.upsert_many(session, dashboards, writer)
 
-        return len(all_dashboards)
+        return IndexingResult(len(dashboards), writer.failed)
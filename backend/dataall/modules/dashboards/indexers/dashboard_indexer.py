@@ -1,10 +1,10 @@
 import logging
 
-from dataall.core.environment.services.environment_service import EnvironmentService
+from dataall.core.environment.db.environment_repositories import EnvironmentRepository
 from dataall.core.organizations.db.organization_repositories import Organization
 from dataall.modules.vote.db.vote_repositories import VoteRepository
 from dataall.modules.dashboards import DashboardRepository
-from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer, BulkIndexWriter
 from dataall.modules.dashboards.db.dashboard_models import Dashboard
 
 log = logging.getLogger(__name__)
@@ -16,34 +16,52 @@ class DashboardIndexer(BaseIndexer):
         dashboard: Dashboard = DashboardRepository.get_dashboard_by_uri(session, dashboard_uri)
 
         if dashboard:
-            env = EnvironmentService.get_environment_by_uri(session, dashboard.environmentUri)
-            org = Organization.get_organization_by_uri(session, env.organizationUri)
+            cls.upsert_many(session, [dashboard], writer=None)
+        return dashboard
 
-            glossary = BaseIndexer._get_target_glossary_terms(session, dashboard_uri)
-            count_upvotes = VoteRepository.count_upvotes(
-                session, dashboard_uri, target_type='dashboard'
+    @classmethod
+    def upsert_many(cls, session, dashboards: [Dashboard], writer: BulkIndexWriter = None):
+        """Indexes the dashboards, referenced environments, organizations and terms are loaded once"""
+        dashboard_uris = [dashboard.dashboardUri for dashboard in dashboards]
+        environments = {
+            env.environmentUri: env
+            for env in EnvironmentRepository.find_environments_by_uris(
+                session, list({dashboard.environmentUri for dashboard in dashboards})
             )
-            BaseIndexer._index(
-                doc_id=dashboard_uri,
-                doc={
-                    'name': dashboard.name,
-                    'admins': dashboard.SamlGroupName,
-                    'owner': dashboard.owner,
-                    'label': dashboard.label,
-                    'resourceKind': 'dashboard',
-                    'description': dashboard.description,
-                    'tags': [f.replace('-', '') for f in dashboard.tags or []],
-                    'topics': [],
-                    'region': dashboard.region.replace('-', ''),
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': dashboard.created,
-                    'updated': dashboard.updated,
-                    'deleted': dashboard.deleted,
-                    'glossary': glossary,
-                    'upvotes': count_upvotes,
-                },
+        }
+        organizations = {
+            org.organizationUri: org
+            for org in Organization.find_organizations_by_uris(
+                session, list({env.organizationUri for env in environments.values()})
             )
-        return dashboard
+        }
+        glossary = BaseIndexer._get_glossary_terms_by_target(session, dashboard_uris)
+        upvotes = VoteRepository.count_upvotes_by_targets(session, dashboard_uris, target_type='dashboard')
+
+        for dashboard in dashboards:
+            env = environments[dashboard.environmentUri]
+            org = organizations[env.organizationUri]
+            doc = {
+                'name': dashboard.name,
+                'admins': dashboard.SamlGroupName,
+                'owner': dashboard.owner,
+                'label': dashboard.label,
+                'resourceKind': 'dashboard',
+                'description': dashboard.description,
+                'tags': [f.replace('-', '') for f in dashboard.tags or []],
+                'topics': [],
+                'region': dashboard.region.replace('-', ''),
+                'environmentUri': env.environmentUri,
+                'environmentName': env.name,
+                'organizationUri': org.organizationUri,
+                'organizationName': org.name,
+                'created': dashboard.created,
+                'updated': dashboard.updated,
+                'deleted': dashboard.deleted,
+                'glossary': glossary.get(dashboard.dashboardUri, []),
+                'upvotes': upvotes.get(dashboard.dashboardUri, 0),
+            }
+            if writer:
+                writer.index(doc_id=dashboard.dashboardUri, doc=doc)
+            else:
+                BaseIndexer._index(doc_id=dashboard.dashboardUri, doc=doc)
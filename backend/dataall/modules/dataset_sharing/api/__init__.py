@@ -1,9 +1,10 @@
 from dataall.modules.dataset_sharing.api import (
     input_types,
+    loaders,
     mutations,
     queries,
     resolvers,
     types,
 )
 
-__all__ = ['resolvers', 'types', 'input_types', 'queries', 'mutations']
+__all__ = ['resolvers', 'types', 'input_types', 'queries', 'mutations', 'loaders']
@@ -58,6 +58,8 @@ ShareObjectFilter = gql.InputType(
         gql.Argument('datasets_uris', gql.ArrayType(gql.String)),
         gql.Argument('share_requesters', gql.ArrayType(gql.String)),
         gql.Argument('share_iam_roles', gql.ArrayType(gql.String)),
+        gql.Argument('after', gql.String),
+        gql.Argument('countMode', CountMode.toGraphQLEnum()),
     ],
 )
 
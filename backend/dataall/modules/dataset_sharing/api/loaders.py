@@ -0,0 +1,18 @@
+from dataall.base.api.dataloader import DataLoaderDefinition, DataLoaderRegistry
+from dataall.modules.dataset_sharing.db.share_object_models import ShareObject
+from dataall.modules.dataset_sharing.db.share_object_repositories import ShareObjectRepository
+
+SHARE_STATISTICS_LOADER = 'ShareStatistics'
+
+
+def _load_share_statistics(session, share_uris):
+    """Counts the items of all shares of a page with a single GROUP BY query"""
+    summaries = ShareObjectRepository.get_share_items_summaries(session, share_uris)
+    return {share_uri: summary.statistics() for share_uri, summary in summaries.items()}
+
+
+DataLoaderRegistry.register(DataLoaderDefinition(
+    name=SHARE_STATISTICS_LOADER,
+    batch_load_fn=_load_share_statistics,
+    sources={ShareObject: 'shareUri'},
+))
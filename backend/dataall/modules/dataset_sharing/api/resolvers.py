@@ -7,6 +7,7 @@ from dataall.core.environment.services.environment_service import EnvironmentSer
 from dataall.core.organizations.db.organization_repositories import Organization
 from dataall.base.db.exceptions import RequiredParameter
 from dataall.modules.dataset_sharing.api.enums import ShareObjectPermission
+from dataall.modules.dataset_sharing.api.loaders import SHARE_STATISTICS_LOADER
 from dataall.modules.dataset_sharing.db.share_object_models import ShareObjectItem, ShareObject
 from dataall.modules.dataset_sharing.services.share_item_service import ShareItemService
 from dataall.modules.dataset_sharing.services.share_object_service import ShareObjectService
@@ -198,7 +199,7 @@ def resolve_consumption_data(context: Context, source: ShareObject, **kwargs):
 def resolve_share_object_statistics(context: Context, source: ShareObject, **kwargs):
     if not source:
         return None
-    return ShareObjectService.resolve_share_object_statistics(uri=source.shareUri)
+    return context.loaders.get(SHARE_STATISTICS_LOADER).load(source.shareUri)
 
 
 def resolve_existing_shared_items(context: Context, source: ShareObject, **kwargs):
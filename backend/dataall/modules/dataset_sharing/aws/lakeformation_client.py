@@ -1,5 +1,7 @@
 import logging
 import uuid
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional
 
 from botocore.exceptions import ClientError
 
@@ -8,6 +10,108 @@ from dataall.base.aws.sts import SessionHelper
 log = logging.getLogger('aws:lakeformation')
 
 
+@dataclass
+class LFPermissionResult:
+    """Outcome of one entry of a batch, key is the value given by the caller when adding the entry"""
+    key: Optional[Hashable]
+    action: str
+    entry: dict
+    error: Optional[dict] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    def to_client_error(self) -> ClientError:
+        return ClientError(
+            error_response={'Error': {'Code': self.error['ErrorCode'], 'Message': self.error['ErrorMessage']}},
+            operation_name=f'{self.action}Permissions',
+        )
+
+
+class LakeFormationBatch:
+    """
+    Collects grant and revoke entries of a catalog and sends them with BatchGrantPermissions and
+    BatchRevokePermissions, MAX_ENTRIES per call. The failures returned by Lake Formation are mapped
+    back to their entry, an error of a whole call is reported for every entry of the call.
+    Revoking a permission that is not granted is not reported as a failure
+    """
+    MAX_ENTRIES = 20
+
+    def __init__(self, client, catalog_id: str = None):
+        self._client = client
+        self._catalog_id = catalog_id
+        self._entries = {'Grant': [], 'Revoke': []}
+
+    def grant(self, principal, resource, permissions, permissions_with_grant_option=None, key=None):
+        self._add('Grant', principal, resource, permissions, permissions_with_grant_option, key)
+
+    def revoke(self, principal, resource, permissions, permissions_with_grant_option=None, key=None):
+        self._add('Revoke', principal, resource, permissions, permissions_with_grant_option, key)
+
+    def add_revoke_entry(self, entry: dict, key=None):
+        self._entries['Revoke'].append((key, {'Id': str(uuid.uuid4()), **entry}))
+
+    def _add(self, action, principal, resource, permissions, permissions_with_grant_option, key):
+        entry = {
+            'Id': str(uuid.uuid4()),
+            'Principal': {'DataLakePrincipalIdentifier': principal},
+            'Resource': resource,
+            'Permissions': permissions,
+        }
+        if permissions_with_grant_option is not None:
+            entry['PermissionsWithGrantOption'] = permissions_with_grant_option
+        self._entries[action].append((key, entry))
+
+    def execute(self) -> List[LFPermissionResult]:
+        """Sends the grants then the revokes, returns the result of every entry in the order they were added"""
+        results = []
+        for action, keyed_entries in self._entries.items():
+            for i in range(0, len(keyed_entries), self.MAX_ENTRIES):
+                results.extend(self._send(action, keyed_entries[i: i + self.MAX_ENTRIES]))
+        self._entries = {'Grant': [], 'Revoke': []}
+        return results
+
+    def _send(self, action, keyed_entries) -> List[LFPermissionResult]:
+        entries = [entry for _, entry in keyed_entries]
+        params = {'Entries': entries}
+        if self._catalog_id:
+            params['CatalogId'] = self._catalog_id
+        try:
+            if action == 'Grant':
+                response = self._client.batch_grant_permissions(**params)
+            else:
+                response = self._client.batch_revoke_permissions(**params)
+            log.info(f'Batch {action} of {len(entries)} entries, failures: {response.get("Failures")}')
+            errors = {
+                failure['RequestEntry']['Id']: failure['Error']
+                for failure in response.get('Failures') or []
+                if not (action == 'Revoke' and self.is_missing_permission_error(failure['Error']))
+            }
+        except ClientError as e:
+            log.error(f'Batch {action} of {len(entries)} entries failed due to: {e}')
+            error = {'ErrorCode': e.response['Error']['Code'], 'ErrorMessage': e.response['Error']['Message']}
+            errors = {entry['Id']: error for entry in entries}
+        return [LFPermissionResult(key, action, entry, errors.get(entry['Id'])) for key, entry in keyed_entries]
+
+    @staticmethod
+    def is_missing_permission_error(error: dict) -> bool:
+        return error['ErrorCode'] == 'InvalidInputException' and (
+            'Grantee has no permissions' in error['ErrorMessage']
+            or 'No permissions revoked' in error['ErrorMessage']
+            or 'not found' in error['ErrorMessage']
+        )
+
+    @staticmethod
+    def errors_by_key(results: List[LFPermissionResult]) -> Dict[Hashable, ClientError]:
+        """Returns the first error of every key with a failed entry"""
+        errors = {}
+        for result in results:
+            if not result.succeeded:
+                errors.setdefault(result.key, result.to_client_error())
+        return errors
+
+
 class LakeFormationClient:
     def __init__(self):
         pass
@@ -30,106 +134,25 @@ class LakeFormationClient:
         database_name,
         permissions,
     ):
+        log.info(
+            f'Granting database permissions {permissions} to {principals} on database {database_name}'
+        )
+        batch = LakeFormationBatch(client)
         for principal in principals:
-            log.info(
-                f'Granting database permissions {permissions} to {principal} on database {database_name}'
-            )
-            try:
-                client.grant_permissions(
-                    Principal={'DataLakePrincipalIdentifier': principal},
-                    Resource={
-                        'Database': {'Name': database_name},
-                    },
-                    Permissions=permissions,
-                )
+            batch.grant(principal, {'Database': {'Name': database_name}}, permissions, key=principal)
+        for result in batch.execute():
+            if result.succeeded:
                 log.info(
-                    f'Successfully granted principal {principal} permissions {permissions} '
+                    f'Successfully granted principal {result.key} permissions {permissions} '
                     f'to {database_name}'
                 )
-            except ClientError as e:
+            else:
                 log.error(
                     f'Could not grant permissions '
-                    f'principal {principal} '
-                    f'{permissions} to database {database_name} due to: {e}'
+                    f'principal {result.key} '
+                    f'{permissions} to database {database_name} due to: {result.error}'
                 )
 
-    @staticmethod
-    def grant_permissions_to_table(
-        client,
-        principal,
-        database_name,
-        table_name,
-        permissions,
-        permissions_with_grant_options=None,
-    ):
-        try:
-            grant_dict = dict(
-                Principal={'DataLakePrincipalIdentifier': principal},
-                Resource={'Table': {'DatabaseName': database_name, 'Name': table_name}},
-                Permissions=permissions,
-            )
-            if permissions_with_grant_options:
-                grant_dict[
-                    'PermissionsWithGrantOption'
-                ] = permissions_with_grant_options
-
-            response = client.grant_permissions(**grant_dict)
-
-            log.info(
-                f'Successfully granted principal {principal} permissions {permissions} '
-                f'to {database_name}.{table_name}: {response}'
-            )
-        except ClientError as e:
-            log.warning(
-                f'Could not grant principal {principal} '
-                f'permissions {permissions} to table '
-                f'{database_name}.{table_name} due to: {e}'
-            )
-            # raise e
-
-    @staticmethod
-    def revoke_iamallowedgroups_super_permission_from_table(
-        client, accountid, database, table
-    ):
-        """
-        When upgrading to LF tables can still have IAMAllowedGroups permissions
-        Unless this is revoked the table can not be shared using LakeFormation
-        :param client:
-        :param accountid:
-        :param database:
-        :param table:
-        :return:
-        """
-        try:
-            log.info(
-                f'Revoking IAMAllowedGroups Super '
-                f'permission for table {database}|{table}'
-            )
-            LakeFormationClient.batch_revoke_permissions(
-                client,
-                accountid,
-                entries=[
-                    {
-                        'Id': str(uuid.uuid4()),
-                        'Principal': {'DataLakePrincipalIdentifier': 'EVERYONE'},
-                        'Resource': {
-                            'Table': {
-                                'DatabaseName': database,
-                                'Name': table,
-                                'CatalogId': accountid,
-                            }
-                        },
-                        'Permissions': ['ALL'],
-                        'PermissionsWithGrantOption': [],
-                    }
-                ],
-            )
-        except ClientError as e:
-            log.debug(
-                f'Could not revoke IAMAllowedGroups Super '
-                f'permission on table {database}|{table} due to {e}'
-            )
-
     @staticmethod
     def batch_revoke_permissions(client, accountid, entries):
         """
@@ -141,76 +164,61 @@ class LakeFormationClient:
         :return:
         """
         log.info(f'Batch Revoking {entries}')
-        entries_chunks: list = [entries[i : i + 20] for i in range(0, len(entries), 20)]
-        failures = []
-        try:
-            for entries_chunk in entries_chunks:
-                response = client.batch_revoke_permissions(
-                    CatalogId=accountid, Entries=entries_chunk
-                )
-                log.info(f'Batch Revoke response: {response}')
-                failures.extend(response.get('Failures'))
-
-            for failure in failures:
-                if not (
-                    failure['Error']['ErrorCode'] == 'InvalidInputException'
-                    and (
-                        'Grantee has no permissions' in failure['Error']['ErrorMessage']
-                        or 'No permissions revoked' in failure['Error']['ErrorMessage']
-                        or 'not found' in failure['Error']['ErrorMessage']
-                    )
-                ):
-                    raise ClientError(
-                        error_response={
-                            'Error': {
-                                'Code': 'LakeFormationClient.batch_revoke_permissions',
-                                'Message': f'Operation ended with failures: {failures}',
-                            }
-                        },
-                        operation_name='LakeFormationClient.batch_revoke_permissions',
-                    )
-
-        except ClientError as e:
+        batch = LakeFormationBatch(client, accountid)
+        for entry in entries:
+            batch.add_revoke_entry(entry)
+        failures = [result for result in batch.execute() if not result.succeeded]
+        if failures:
             log.warning(f'Batch Revoke ended with failures: {failures}')
-            raise e
+            raise ClientError(
+                error_response={
+                    'Error': {
+                        'Code': 'LakeFormationClient.batch_revoke_permissions',
+                        'Message': f'Operation ended with failures: {failures}',
+                    }
+                },
+                operation_name='LakeFormationClient.batch_revoke_permissions',
+            )
 
     @staticmethod
     def grant_resource_link_permission_on_target(client, source, target):
+        batch = LakeFormationBatch(client)
         for principal in target['principals']:
-            try:
-                table_grant = dict(
-                    Principal={'DataLakePrincipalIdentifier': principal},
-                    Resource={
-                        'TableWithColumns': {
-                            'DatabaseName': source['database'],
-                            'Name': source['tablename'],
-                            'ColumnWildcard': {},
-                            'CatalogId': source['accountid'],
-                        }
-                    },
-                    Permissions=['DESCRIBE', 'SELECT'],
-                    PermissionsWithGrantOption=[],
-                )
-                client.grant_permissions(**table_grant)
-                log.info(
-                    f'Successfully granted permissions DESCRIBE,SELECT to {principal} on target '
-                    f'{source["accountid"]}://{source["database"]}/{source["tablename"]}'
-                )
-            except ClientError as e:
-                logging.error(
-                    f'Failed granting principal {principal} '
+            batch.grant(
+                principal,
+                {
+                    'TableWithColumns': {
+                        'DatabaseName': source['database'],
+                        'Name': source['tablename'],
+                        'ColumnWildcard': {},
+                        'CatalogId': source['accountid'],
+                    }
+                },
+                ['DESCRIBE', 'SELECT'],
+                [],
+                key=principal,
+            )
+        for result in batch.execute():
+            if not result.succeeded:
+                log.error(
+                    f'Failed granting principal {result.key} '
                     'read access to resource link on target'
                     f' {source["accountid"]}://{source["database"]}/{source["tablename"]} '
-                    f'due to: {e}'
+                    f'due to: {result.error}'
                 )
-                raise e
+                raise result.to_client_error()
+        log.info(
+            f'Successfully granted permissions DESCRIBE,SELECT to {target["principals"]} on target '
+            f'{source["accountid"]}://{source["database"]}/{source["tablename"]}'
+        )
 
     @staticmethod
     def grant_resource_link_permission(client, source, target, target_database):
+        batch = LakeFormationBatch(client)
         for principal in target['principals']:
-            resourcelink_grant = dict(
-                Principal={'DataLakePrincipalIdentifier': principal},
-                Resource={
+            batch.grant(
+                principal,
+                {
                     'Table': {
                         'DatabaseName': target_database,
                         'Name': source['tablename'],
@@ -218,21 +226,21 @@ class LakeFormationClient:
                     }
                 },
                 # Resource link only supports DESCRIBE and DROP permissions no SELECT
-                Permissions=['DESCRIBE'],
+                ['DESCRIBE'],
+                key=principal,
             )
-            try:
-                client.grant_permissions(**resourcelink_grant)
-                log.info(
-                    f'Granted resource link DESCRIBE access '
-                    f'to principal {principal} on {target["accountid"]}://{target_database}/{source["tablename"]}'
-                )
-            except ClientError as e:
-                logging.error(
-                    f'Failed granting principal {principal} '
+        for result in batch.execute():
+            if not result.succeeded:
+                log.error(
+                    f'Failed granting principal {result.key} '
                     f'read access to resource link on {target["accountid"]}://{target_database}/{source["tablename"]} '
-                    f'due to: {e}'
+                    f'due to: {result.error}'
                 )
-                raise e
+                raise result.to_client_error()
+        log.info(
+            f'Granted resource link DESCRIBE access '
+            f'to principals {target["principals"]} on {target["accountid"]}://{target_database}/{source["tablename"]}'
+        )
 
     @staticmethod
     def revoke_source_table_access(**data):
@@ -253,47 +261,44 @@ class LakeFormationClient:
         source_database = data['source_database']
         source_table = data['source_table']
         source_accountid = data['source_accountid']
+        aws_session = SessionHelper.remote_session(target_accountid)
+        lakeformation = aws_session.client('lakeformation', region_name=region)
+        batch = LakeFormationBatch(lakeformation)
         for target_principal in target_principals:
-            try:
-
-                aws_session = SessionHelper.remote_session(target_accountid)
-                lakeformation = aws_session.client('lakeformation', region_name=region)
-
-                logging.info('Revoking DESCRIBE permission...')
-                lakeformation.revoke_permissions(
-                    Principal=dict(DataLakePrincipalIdentifier=target_principal),
-                    Resource=dict(
-                        Table=dict(
-                            CatalogId=source_accountid,
-                            DatabaseName=source_database,
-                            Name=source_table,
-                        )
-                    ),
-                    Permissions=['DESCRIBE'],
-                    PermissionsWithGrantOption=[],
-                )
-                logging.info('Successfully revoked DESCRIBE permissions')
-
-                logging.info('Revoking SELECT permission...')
-                lakeformation.revoke_permissions(
-                    Principal=dict(DataLakePrincipalIdentifier=target_principal),
-                    Resource=dict(
-                        TableWithColumns=dict(
-                            CatalogId=source_accountid,
-                            DatabaseName=source_database,
-                            Name=source_table,
-                            ColumnWildcard={},
-                        )
-                    ),
-                    Permissions=['SELECT'],
-                    PermissionsWithGrantOption=[],
-                )
-                logging.info('Successfully revoked DESCRIBE permissions')
-
-            except ClientError as e:
-                logging.error(
-                    f'Failed to revoke permissions for {target_principal} '
-                    f'on source table {source_accountid}/{source_database}/{source_table} '
-                    f'due to: {e}'
-                )
-                raise e
+            batch.revoke(
+                target_principal,
+                {
+                    'Table': {
+                        'CatalogId': source_accountid,
+                        'DatabaseName': source_database,
+                        'Name': source_table,
+                    }
+                },
+                ['DESCRIBE'],
+                [],
+                key=target_principal,
+            )
+            batch.revoke(
+                target_principal,
+                {
+                    'TableWithColumns': {
+                        'CatalogId': source_accountid,
+                        'DatabaseName': source_database,
+                        'Name': source_table,
+                        'ColumnWildcard': {},
+                    }
+                },
+                ['SELECT'],
+                [],
+                key=target_principal,
+            )
+        errors = LakeFormationBatch.errors_by_key(batch.execute())
+        for target_principal, error in errors.items():
+            logging.error(
+                f'Failed to revoke permissions for {target_principal} '
+                f'on source table {source_accountid}/{source_database}/{source_table} '
+                f'due to: {error}'
+            )
+        if errors:
+            raise next(iter(errors.values()))
+        logging.info(f'Successfully revoked DESCRIBE and SELECT permissions of {target_principals}')
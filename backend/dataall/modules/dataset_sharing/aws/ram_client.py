@@ -1,5 +1,6 @@
 import logging
 import time
+from collections import defaultdict
 
 from botocore.exceptions import ClientError
 
@@ -131,6 +132,64 @@ class RamClient:
 
         return retry_share_table, failed_invitations
 
+    @staticmethod
+    def accept_ram_invitations(source: dict, target: dict, table_names: [str]) -> [str]:
+        """
+        Accepts in one pass the RAM invitations of the resource shares of the given tables of the source database.
+        Resource shares of expired or rejected invitations are deleted, the tables they contain are returned
+        to be shared again
+        """
+        if source['accountid'] == target['accountid'] or not table_names:
+            return []
+
+        source_ram = RamClient(source['accountid'], target['region'])
+        target_ram = RamClient(target['accountid'], target['region'])
+
+        resource_share_tables = defaultdict(set)
+        for table_name in table_names:
+            resource_arn = (
+                f'arn:aws:glue:{source["region"]}:{source["accountid"]}:'
+                f'table/{source["database"]}/{table_name}'
+            )
+            for association in source_ram._list_resource_share_associations(resource_arn):
+                resource_share_tables[association['resourceShareArn']].add(table_name)
+        if not resource_share_tables:
+            return []
+
+        ram_invitations = target_ram._get_resource_share_invitations(
+            list(resource_share_tables), source['accountid'], target['accountid']
+        )
+        log.info(
+            f'Found {len(ram_invitations)} RAM invitations for {len(table_names)} tables '
+            f'in {len(resource_share_tables)} resource shares'
+        )
+        accepted = False
+        retry_tables = set()
+        for invitation in ram_invitations:
+            if 'LakeFormation' not in invitation['resourceShareName']:
+                continue
+            if invitation['status'] == 'PENDING':
+                log.info(f'Invitation {invitation} is in PENDING status accepting it ...')
+                target_ram._accept_resource_share_invitation(invitation['resourceShareInvitationArn'])
+                accepted = True
+            elif invitation['status'] in ('EXPIRED', 'REJECTED'):
+                log.warning(
+                    f'Invitation {invitation} has expired or was rejected. '
+                    'Tables flagged for revoke re-share. '
+                    'Deleting the resource share to reset the invitation... '
+                )
+                retry_tables |= resource_share_tables.get(invitation['resourceShareArn'], set())
+                source_ram._delete_resource_share(resource_share_arn=invitation['resourceShareArn'])
+            elif invitation['status'] == 'ACCEPTED':
+                log.info(f'Invitation {invitation} already accepted nothing to do ...')
+            else:
+                log.warning(f'Invitation is in an unknown status {invitation["status"]}')
+
+        if accepted:
+            # Ram invitation acceptance is slow, waiting once for all invitations
+            time.sleep(5)
+        return sorted(retry_tables)
+
     def _list_resource_share_associations(self, resource_arn):
         associations = []
         try:
@@ -1,5 +1,6 @@
 import logging
-from typing import List
+from collections import Counter
+from typing import Dict, List, Tuple
 
 from sqlalchemy import and_, or_, func, case
 from sqlalchemy.orm import Query
@@ -7,7 +8,7 @@ from sqlalchemy.orm import Query
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
 from dataall.core.organizations.db.organization_models import Organization
-from dataall.base.db import exceptions, paginate
+from dataall.base.db import exceptions, paginate, paginate_by_cursor, is_cursor_pagination
 from dataall.modules.dataset_sharing.db.enums import ShareObjectActions, ShareObjectStatus, ShareItemActions, \
     ShareItemStatus, ShareableType, PrincipalType
 from dataall.modules.dataset_sharing.db.share_object_models import ShareObjectItem, ShareObject
@@ -18,14 +19,21 @@ logger = logging.getLogger(__name__)
 
 
 class Transition:
+    """Transition of an action, compiled into a lookup of the target state of every source state"""
+
     def __init__(self, name, transitions):
         self._name = name
         self._transitions = transitions
-        self._all_source_states = [*set([item for sublist in transitions.values() for item in sublist])]
-        self._all_target_states = [item for item in transitions.keys()]
+        self._targets = {}
+        for target_state, list_prev_states in transitions.items():
+            for prev_state in list_prev_states:
+                self._targets.setdefault(prev_state, target_state)
+        self._all_source_states = frozenset(self._targets)
+        self._all_target_states = list(transitions.keys())
+        self._target_states = frozenset(transitions)
 
     def validate_transition(self, prev_state):
-        if prev_state in self._all_target_states:
+        if prev_state in self._target_states:
             logger.info(f'Resource is already in target state ({prev_state}) in {self._all_target_states}')
             return False
         elif prev_state not in self._all_source_states:
@@ -39,105 +47,102 @@ class Transition:
 
     def get_transition_target(self, prev_state):
         if self.validate_transition(prev_state):
-            for target_state, list_prev_states in self._transitions.items():
-                if prev_state in list_prev_states:
-                    return target_state
-                else:
-                    pass
-        else:
-            return prev_state
+            return self._targets[prev_state]
+        return prev_state
 
 
 class ShareObjectSM:
+    # compiled once, the transitions are looked up by action and source state
+    transitionTable = {
+        ShareObjectActions.Submit.value: Transition(
+            name=ShareObjectActions.Submit.value,
+            transitions={
+                ShareObjectStatus.Submitted.value: [
+                    ShareObjectStatus.Draft.value,
+                    ShareObjectStatus.Rejected.value
+                ]
+            }
+        ),
+        ShareObjectActions.Approve.value: Transition(
+            name=ShareObjectActions.Approve.value,
+            transitions={
+                ShareObjectStatus.Approved.value: [
+                    ShareObjectStatus.Submitted.value
+                ]
+            }
+        ),
+        ShareObjectActions.Reject.value: Transition(
+            name=ShareObjectActions.Reject.value,
+            transitions={
+                ShareObjectStatus.Rejected.value: [
+                    ShareObjectStatus.Submitted.value
+                ]
+            }
+        ),
+        ShareObjectActions.RevokeItems.value: Transition(
+            name=ShareObjectActions.RevokeItems.value,
+            transitions={
+                ShareObjectStatus.Revoked.value: [
+                    ShareObjectStatus.Draft.value,
+                    ShareObjectStatus.Submitted.value,
+                    ShareObjectStatus.Rejected.value,
+                    ShareObjectStatus.Processed.value
+                ]
+            }
+        ),
+        ShareObjectActions.Start.value: Transition(
+            name=ShareObjectActions.Start.value,
+            transitions={
+                ShareObjectStatus.Share_In_Progress.value: [
+                    ShareObjectStatus.Approved.value
+                ],
+                ShareObjectStatus.Revoke_In_Progress.value: [
+                    ShareObjectStatus.Revoked.value
+                ]
+            }
+        ),
+        ShareObjectActions.Finish.value: Transition(
+            name=ShareObjectActions.Finish.value,
+            transitions={
+                ShareObjectStatus.Processed.value: [
+                    ShareObjectStatus.Share_In_Progress.value,
+                    ShareObjectStatus.Revoke_In_Progress.value
+                ],
+            }
+        ),
+        ShareObjectActions.FinishPending.value: Transition(
+            name=ShareObjectActions.FinishPending.value,
+            transitions={
+                ShareObjectStatus.Draft.value: [
+                    ShareObjectStatus.Revoke_In_Progress.value,
+                ],
+            }
+        ),
+        ShareObjectActions.Delete.value: Transition(
+            name=ShareObjectActions.Delete.value,
+            transitions={
+                ShareObjectStatus.Deleted.value: [
+                    ShareObjectStatus.Rejected.value,
+                    ShareObjectStatus.Draft.value,
+                    ShareObjectStatus.Submitted.value,
+                    ShareObjectStatus.Processed.value
+                ]
+            }
+        ),
+        ShareItemActions.AddItem.value: Transition(
+            name=ShareItemActions.AddItem.value,
+            transitions={
+                ShareObjectStatus.Draft.value: [
+                    ShareObjectStatus.Submitted.value,
+                    ShareObjectStatus.Rejected.value,
+                    ShareObjectStatus.Processed.value
+                ]
+            }
+        ),
+    }
+
     def __init__(self, state):
         self._state = state
-        self.transitionTable = {
-            ShareObjectActions.Submit.value: Transition(
-                name=ShareObjectActions.Submit.value,
-                transitions={
-                    ShareObjectStatus.Submitted.value: [
-                        ShareObjectStatus.Draft.value,
-                        ShareObjectStatus.Rejected.value
-                    ]
-                }
-            ),
-            ShareObjectActions.Approve.value: Transition(
-                name=ShareObjectActions.Approve.value,
-                transitions={
-                    ShareObjectStatus.Approved.value: [
-                        ShareObjectStatus.Submitted.value
-                    ]
-                }
-            ),
-            ShareObjectActions.Reject.value: Transition(
-                name=ShareObjectActions.Reject.value,
-                transitions={
-                    ShareObjectStatus.Rejected.value: [
-                        ShareObjectStatus.Submitted.value
-                    ]
-                }
-            ),
-            ShareObjectActions.RevokeItems.value: Transition(
-                name=ShareObjectActions.RevokeItems.value,
-                transitions={
-                    ShareObjectStatus.Revoked.value: [
-                        ShareObjectStatus.Draft.value,
-                        ShareObjectStatus.Submitted.value,
-                        ShareObjectStatus.Rejected.value,
-                        ShareObjectStatus.Processed.value
-                    ]
-                }
-            ),
-            ShareObjectActions.Start.value: Transition(
-                name=ShareObjectActions.Start.value,
-                transitions={
-                    ShareObjectStatus.Share_In_Progress.value: [
-                        ShareObjectStatus.Approved.value
-                    ],
-                    ShareObjectStatus.Revoke_In_Progress.value: [
-                        ShareObjectStatus.Revoked.value
-                    ]
-                }
-            ),
-            ShareObjectActions.Finish.value: Transition(
-                name=ShareObjectActions.Finish.value,
-                transitions={
-                    ShareObjectStatus.Processed.value: [
-                        ShareObjectStatus.Share_In_Progress.value,
-                        ShareObjectStatus.Revoke_In_Progress.value
-                    ],
-                }
-            ),
-            ShareObjectActions.FinishPending.value: Transition(
-                name=ShareObjectActions.FinishPending.value,
-                transitions={
-                    ShareObjectStatus.Draft.value: [
-                        ShareObjectStatus.Revoke_In_Progress.value,
-                    ],
-                }
-            ),
-            ShareObjectActions.Delete.value: Transition(
-                name=ShareObjectActions.Delete.value,
-                transitions={
-                    ShareObjectStatus.Deleted.value: [
-                        ShareObjectStatus.Rejected.value,
-                        ShareObjectStatus.Draft.value,
-                        ShareObjectStatus.Submitted.value,
-                        ShareObjectStatus.Processed.value
-                    ]
-                }
-            ),
-            ShareItemActions.AddItem.value: Transition(
-                name=ShareItemActions.AddItem.value,
-                transitions={
-                    ShareObjectStatus.Draft.value: [
-                        ShareObjectStatus.Submitted.value,
-                        ShareObjectStatus.Rejected.value,
-                        ShareObjectStatus.Processed.value
-                    ]
-                }
-            ),
-        }
 
     def run_transition(self, transition):
         trans = self.transitionTable[transition]
@@ -156,109 +161,110 @@ class ShareObjectSM:
 
 
 class ShareItemSM:
+    transitionTable = {
+        ShareItemActions.AddItem.value: Transition(
+            name=ShareItemActions.AddItem.value,
+            transitions={
+                ShareItemStatus.PendingApproval.value: [ShareItemStatus.Deleted.value]
+            }
+        ),
+        ShareObjectActions.Submit.value: Transition(
+            name=ShareObjectActions.Submit.value,
+            transitions={
+                ShareItemStatus.PendingApproval.value: [
+                    ShareItemStatus.Share_Rejected.value,
+                    ShareItemStatus.Share_Failed.value
+                ],
+                ShareItemStatus.Revoke_Approved.value: [ShareItemStatus.Revoke_Approved.value],
+                ShareItemStatus.Revoke_Failed.value: [ShareItemStatus.Revoke_Failed.value],
+                ShareItemStatus.Share_Approved.value: [ShareItemStatus.Share_Approved.value],
+                ShareItemStatus.Share_Succeeded.value: [ShareItemStatus.Share_Succeeded.value],
+                ShareItemStatus.Revoke_Succeeded.value: [ShareItemStatus.Revoke_Succeeded.value],
+                ShareItemStatus.Share_In_Progress.value: [ShareItemStatus.Share_In_Progress.value],
+                ShareItemStatus.Revoke_In_Progress.value: [ShareItemStatus.Revoke_In_Progress.value],
+            }
+        ),
+        ShareObjectActions.Approve.value: Transition(
+            name=ShareObjectActions.Approve.value,
+            transitions={
+                ShareItemStatus.Share_Approved.value: [ShareItemStatus.PendingApproval.value],
+                ShareItemStatus.Revoke_Approved.value: [ShareItemStatus.Revoke_Approved.value],
+                ShareItemStatus.Revoke_Failed.value: [ShareItemStatus.Revoke_Failed.value],
+                ShareItemStatus.Share_Succeeded.value: [ShareItemStatus.Share_Succeeded.value],
+                ShareItemStatus.Revoke_Succeeded.value: [ShareItemStatus.Revoke_Succeeded.value],
+                ShareItemStatus.Share_In_Progress.value: [ShareItemStatus.Share_In_Progress.value],
+                ShareItemStatus.Revoke_In_Progress.value: [ShareItemStatus.Revoke_In_Progress.value],
+            }
+        ),
+        ShareObjectActions.Reject.value: Transition(
+            name=ShareObjectActions.Reject.value,
+            transitions={
+                ShareItemStatus.Share_Rejected.value: [ShareItemStatus.PendingApproval.value],
+                ShareItemStatus.Revoke_Approved.value: [ShareItemStatus.Revoke_Approved.value],
+                ShareItemStatus.Revoke_Failed.value: [ShareItemStatus.Revoke_Failed.value],
+                ShareItemStatus.Share_Succeeded.value: [ShareItemStatus.Share_Succeeded.value],
+                ShareItemStatus.Revoke_Succeeded.value: [ShareItemStatus.Revoke_Succeeded.value],
+                ShareItemStatus.Share_In_Progress.value: [ShareItemStatus.Share_In_Progress.value],
+                ShareItemStatus.Revoke_In_Progress.value: [ShareItemStatus.Revoke_In_Progress.value],
+            }
+        ),
+        ShareObjectActions.Start.value: Transition(
+            name=ShareObjectActions.Start.value,
+            transitions={
+                ShareItemStatus.Share_In_Progress.value: [ShareItemStatus.Share_Approved.value],
+                ShareItemStatus.Revoke_In_Progress.value: [ShareItemStatus.Revoke_Approved.value],
+            }
+        ),
+        ShareItemActions.Success.value: Transition(
+            name=ShareItemActions.Success.value,
+            transitions={
+                ShareItemStatus.Share_Succeeded.value: [ShareItemStatus.Share_In_Progress.value],
+                ShareItemStatus.Revoke_Succeeded.value: [ShareItemStatus.Revoke_In_Progress.value],
+            }
+        ),
+        ShareItemActions.Failure.value: Transition(
+            name=ShareItemActions.Failure.value,
+            transitions={
+                ShareItemStatus.Share_Failed.value: [ShareItemStatus.Share_In_Progress.value],
+                ShareItemStatus.Revoke_Failed.value: [ShareItemStatus.Revoke_In_Progress.value],
+            }
+        ),
+        ShareItemActions.RemoveItem.value: Transition(
+            name=ShareItemActions.RemoveItem.value,
+            transitions={
+                ShareItemStatus.Deleted.value: [
+                    ShareItemStatus.PendingApproval.value,
+                    ShareItemStatus.Share_Rejected.value,
+                    ShareItemStatus.Share_Failed.value,
+                    ShareItemStatus.Revoke_Succeeded.value
+                ]
+            }
+        ),
+        ShareObjectActions.RevokeItems.value: Transition(
+            name=ShareObjectActions.RevokeItems.value,
+            transitions={
+                ShareItemStatus.Revoke_Approved.value: [
+                    ShareItemStatus.Share_Succeeded.value,
+                    ShareItemStatus.Revoke_Failed.value,
+                    ShareItemStatus.Revoke_Approved.value
+                ]
+            }
+        ),
+        ShareObjectActions.Delete.value: Transition(
+            name=ShareObjectActions.Delete.value,
+            transitions={
+                ShareItemStatus.Deleted.value: [
+                    ShareItemStatus.PendingApproval.value,
+                    ShareItemStatus.Share_Rejected.value,
+                    ShareItemStatus.Share_Failed.value,
+                    ShareItemStatus.Revoke_Succeeded.value
+                ]
+            }
+        )
+    }
+
     def __init__(self, state):
         self._state = state
-        self.transitionTable = {
-            ShareItemActions.AddItem.value: Transition(
-                name=ShareItemActions.AddItem.value,
-                transitions={
-                    ShareItemStatus.PendingApproval.value: [ShareItemStatus.Deleted.value]
-                }
-            ),
-            ShareObjectActions.Submit.value: Transition(
-                name=ShareObjectActions.Submit.value,
-                transitions={
-                    ShareItemStatus.PendingApproval.value: [
-                        ShareItemStatus.Share_Rejected.value,
-                        ShareItemStatus.Share_Failed.value
-                    ],
-                    ShareItemStatus.Revoke_Approved.value: [ShareItemStatus.Revoke_Approved.value],
-                    ShareItemStatus.Revoke_Failed.value: [ShareItemStatus.Revoke_Failed.value],
-                    ShareItemStatus.Share_Approved.value: [ShareItemStatus.Share_Approved.value],
-                    ShareItemStatus.Share_Succeeded.value: [ShareItemStatus.Share_Succeeded.value],
-                    ShareItemStatus.Revoke_Succeeded.value: [ShareItemStatus.Revoke_Succeeded.value],
-                    ShareItemStatus.Share_In_Progress.value: [ShareItemStatus.Share_In_Progress.value],
-                    ShareItemStatus.Revoke_In_Progress.value: [ShareItemStatus.Revoke_In_Progress.value],
-                }
-            ),
-            ShareObjectActions.Approve.value: Transition(
-                name=ShareObjectActions.Approve.value,
-                transitions={
-                    ShareItemStatus.Share_Approved.value: [ShareItemStatus.PendingApproval.value],
-                    ShareItemStatus.Revoke_Approved.value: [ShareItemStatus.Revoke_Approved.value],
-                    ShareItemStatus.Revoke_Failed.value: [ShareItemStatus.Revoke_Failed.value],
-                    ShareItemStatus.Share_Succeeded.value: [ShareItemStatus.Share_Succeeded.value],
-                    ShareItemStatus.Revoke_Succeeded.value: [ShareItemStatus.Revoke_Succeeded.value],
-                    ShareItemStatus.Share_In_Progress.value: [ShareItemStatus.Share_In_Progress.value],
-                    ShareItemStatus.Revoke_In_Progress.value: [ShareItemStatus.Revoke_In_Progress.value],
-                }
-            ),
-            ShareObjectActions.Reject.value: Transition(
-                name=ShareObjectActions.Reject.value,
-                transitions={
-                    ShareItemStatus.Share_Rejected.value: [ShareItemStatus.PendingApproval.value],
-                    ShareItemStatus.Revoke_Approved.value: [ShareItemStatus.Revoke_Approved.value],
-                    ShareItemStatus.Revoke_Failed.value: [ShareItemStatus.Revoke_Failed.value],
-                    ShareItemStatus.Share_Succeeded.value: [ShareItemStatus.Share_Succeeded.value],
-                    ShareItemStatus.Revoke_Succeeded.value: [ShareItemStatus.Revoke_Succeeded.value],
-                    ShareItemStatus.Share_In_Progress.value: [ShareItemStatus.Share_In_Progress.value],
-                    ShareItemStatus.Revoke_In_Progress.value: [ShareItemStatus.Revoke_In_Progress.value],
-                }
-            ),
-            ShareObjectActions.Start.value: Transition(
-                name=ShareObjectActions.Start.value,
-                transitions={
-                    ShareItemStatus.Share_In_Progress.value: [ShareItemStatus.Share_Approved.value],
-                    ShareItemStatus.Revoke_In_Progress.value: [ShareItemStatus.Revoke_Approved.value],
-                }
-            ),
-            ShareItemActions.Success.value: Transition(
-                name=ShareItemActions.Success.value,
-                transitions={
-                    ShareItemStatus.Share_Succeeded.value: [ShareItemStatus.Share_In_Progress.value],
-                    ShareItemStatus.Revoke_Succeeded.value: [ShareItemStatus.Revoke_In_Progress.value],
-                }
-            ),
-            ShareItemActions.Failure.value: Transition(
-                name=ShareItemActions.Failure.value,
-                transitions={
-                    ShareItemStatus.Share_Failed.value: [ShareItemStatus.Share_In_Progress.value],
-                    ShareItemStatus.Revoke_Failed.value: [ShareItemStatus.Revoke_In_Progress.value],
-                }
-            ),
-            ShareItemActions.RemoveItem.value: Transition(
-                name=ShareItemActions.RemoveItem.value,
-                transitions={
-                    ShareItemStatus.Deleted.value: [
-                        ShareItemStatus.PendingApproval.value,
-                        ShareItemStatus.Share_Rejected.value,
-                        ShareItemStatus.Share_Failed.value,
-                        ShareItemStatus.Revoke_Succeeded.value
-                    ]
-                }
-            ),
-            ShareObjectActions.RevokeItems.value: Transition(
-                name=ShareObjectActions.RevokeItems.value,
-                transitions={
-                    ShareItemStatus.Revoke_Approved.value: [
-                        ShareItemStatus.Share_Succeeded.value,
-                        ShareItemStatus.Revoke_Failed.value,
-                        ShareItemStatus.Revoke_Approved.value
-                    ]
-                }
-            ),
-            ShareObjectActions.Delete.value: Transition(
-                name=ShareObjectActions.Delete.value,
-                transitions={
-                    ShareItemStatus.Deleted.value: [
-                        ShareItemStatus.PendingApproval.value,
-                        ShareItemStatus.Share_Rejected.value,
-                        ShareItemStatus.Share_Failed.value,
-                        ShareItemStatus.Revoke_Succeeded.value
-                    ]
-                }
-            )
-        }
 
     def run_transition(self, transition):
         trans = self.transitionTable[transition]
@@ -297,6 +303,51 @@ class ShareItemSM:
         self._state = new_state
         return True
 
+    def update_state_items(self, session, share_uri, share_items, new_state):
+        """Updates the given share items from the current state to new_state with one UPDATE"""
+        if share_items:
+            logger.info(f"Updating {len(share_items)} share items in DB from {self._state} to state {new_state}")
+            ShareObjectRepository.update_share_item_status_batch(
+                session=session,
+                share_uri=share_uri,
+                old_status=self._state,
+                new_status=new_state,
+                share_item_uris=[share_item.shareItemUri for share_item in share_items],
+            )
+            session.commit()
+        self._state = new_state
+        return True
+
+    @classmethod
+    def run_transition_items(cls, session, share_uri, share_items: List[ShareObjectItem], transition) -> Dict[str, str]:
+        """
+        Runs the transition of every share item from its own state. Items that can't run the transition are logged
+        and skipped, the others are persisted with one UPDATE (or DELETE) per target state.
+        Returns the new state of each item that was not skipped
+        """
+        trans = cls.transitionTable[transition]
+        new_states = {}
+        for share_item in share_items:
+            try:
+                new_states[share_item.shareItemUri] = trans.get_transition_target(share_item.status)
+            except exceptions.UnauthorizedOperation as e:
+                logger.warning(f'Skipping share item {share_item.shareItemUri} in state {share_item.status}: {e}')
+
+        changed_items: Dict[str, List[str]] = {}
+        for share_item in share_items:
+            new_state = new_states.get(share_item.shareItemUri, share_item.status)
+            if new_state != share_item.status:
+                changed_items.setdefault(new_state, []).append(share_item.shareItemUri)
+
+        for new_state, share_item_uris in changed_items.items():
+            if new_state == ShareItemStatus.Deleted.value:
+                logger.info(f"Deleting {len(share_item_uris)} share items in DB")
+                ShareObjectRepository.delete_share_items(session, share_uri, share_item_uris)
+            else:
+                logger.info(f"Updating {len(share_item_uris)} share items in DB to state {new_state}")
+                ShareObjectRepository.update_share_items_status(session, share_uri, share_item_uris, new_state)
+        return new_states
+
     @staticmethod
     def get_share_item_shared_states():
         return [
@@ -315,6 +366,34 @@ class ShareItemSM:
         ]
 
 
+class ShareItemsSummary:
+    """Number of items of a share by (itemType, status), computed from one GROUP BY query"""
+
+    def __init__(self, counts: Dict[Tuple[str, str], int] = None):
+        self.counts = Counter(counts or {})
+
+    @property
+    def states(self) -> List[str]:
+        """Distinct statuses of the items"""
+        return list(dict.fromkeys(status for (_, status), count in self.counts.items() if count))
+
+    def count(self, item_type: str = None, states: List[str] = None) -> int:
+        return sum(
+            count for (type_, status), count in self.counts.items()
+            if (item_type is None or type_ == item_type) and (states is None or status in states)
+        )
+
+    def statistics(self) -> dict:
+        return {
+            'tables': self.count(item_type=ShareableType.Table.value),
+            'locations': self.count(item_type=ShareableType.StorageLocation.value),
+            'sharedItems': self.count(states=ShareItemSM.get_share_item_shared_states()),
+            'revokedItems': self.count(states=[ShareItemStatus.Revoke_Succeeded.value]),
+            'failedItems': self.count(states=[ShareItemStatus.Share_Failed.value, ShareItemStatus.Revoke_Failed.value]),
+            'pendingItems': self.count(states=[ShareItemStatus.PendingApproval.value]),
+        }
+
+
 class ShareEnvironmentResource(EnvironmentResource):
     @staticmethod
     def count_resources(session, environment, group_uri) -> int:
@@ -395,19 +474,6 @@ class ShareObjectRepository:
             return True
         return False
 
-    @staticmethod
-    def count_sharable_items(session, uri, share_type):
-        return (
-            session.query(ShareObjectItem)
-            .filter(
-                and_(
-                    ShareObjectItem.shareUri == uri,
-                    ShareObjectItem.itemType == share_type,
-                )
-            )
-            .count()
-        )
-
     @staticmethod
     def find_sharable_item(session, share_uri, item_uri) -> ShareObjectItem:
         return (
@@ -421,19 +487,6 @@ class ShareObjectRepository:
             .first()
         )
 
-    @staticmethod
-    def count_items_in_states(session, uri, states):
-        return (
-            session.query(ShareObjectItem)
-            .filter(
-                and_(
-                    ShareObjectItem.shareUri == uri,
-                    ShareObjectItem.status.in_(states),
-                )
-            )
-            .count()
-        )
-
     @staticmethod
     def check_existing_shared_items_of_type(session, uri, item_type):
         share: ShareObject = ShareObjectRepository.get_share_by_uri(session, uri)
@@ -571,6 +624,18 @@ class ShareObjectRepository:
 
         return paginate(query, data.get('page', 1), data.get('pageSize', 10)).to_dict()
 
+    @staticmethod
+    def _paginate_share_requests(query, data):
+        if is_cursor_pagination(data):
+            return paginate_by_cursor(
+                query,
+                keys=[ShareObject.created, ShareObject.shareUri],
+                page_size=data.get('pageSize', 10),
+                after=data.get('after'),
+                count_mode=data.get('countMode'),
+            ).to_dict()
+        return paginate(query, data.get('page', 1), data.get('pageSize', 10)).to_dict()
+
     @staticmethod
     def list_user_received_share_requests(session, username, groups, data=None):
         query = (
@@ -616,7 +681,7 @@ class ShareObjectRepository:
                 query = query.filter(
                     ShareObject.principalIAMRoleName.in_(data.get('share_iam_roles'))
                 )
-        return paginate(query, data.get('page', 1), data.get('pageSize', 10)).to_dict()
+        return ShareObjectRepository._paginate_share_requests(query, data)
 
     @staticmethod
     def list_user_sent_share_requests(session, username, groups, data=None):
@@ -665,7 +730,7 @@ class ShareObjectRepository:
                 query = query.filter(
                     ShareObject.principalIAMRoleName.in_(data.get('share_iam_roles'))
                 )
-        return paginate(query, data.get('page', 1), data.get('pageSize', 10)).to_dict()
+        return ShareObjectRepository._paginate_share_requests(query, data)
 
     @staticmethod
     def get_share_by_dataset_and_environment(session, dataset_uri, environment_uri):
@@ -726,23 +791,50 @@ class ShareObjectRepository:
         share_uri: str,
         old_status: str,
         new_status: str,
+        share_item_uris: [str] = None,
     ) -> bool:
+        """Updates the status of the items of the share in old_status, or only of the given items if any"""
+        query = session.query(ShareObjectItem).filter(
+            and_(
+                ShareObjectItem.shareUri == share_uri,
+                ShareObjectItem.status == old_status
+            )
+        )
+        if share_item_uris is not None:
+            query = query.filter(ShareObjectItem.shareItemUri.in_(share_item_uris))
+        query.update(
+            {
+                ShareObjectItem.status: new_status,
+            },
+            synchronize_session='fetch' if share_item_uris is not None else 'evaluate',
+        )
+        return True
 
+    @staticmethod
+    def update_share_items_status(session, share_uri: str, share_item_uris: [str], status: str):
         (
             session.query(ShareObjectItem)
             .filter(
                 and_(
                     ShareObjectItem.shareUri == share_uri,
-                    ShareObjectItem.status == old_status
+                    ShareObjectItem.shareItemUri.in_(share_item_uris)
                 )
             )
-            .update(
-                {
-                    ShareObjectItem.status: new_status,
-                }
+            .update({ShareObjectItem.status: status}, synchronize_session='fetch')
+        )
+
+    @staticmethod
+    def delete_share_items(session, share_uri: str, share_item_uris: [str]):
+        (
+            session.query(ShareObjectItem)
+            .filter(
+                and_(
+                    ShareObjectItem.shareUri == share_uri,
+                    ShareObjectItem.shareItemUri.in_(share_item_uris)
+                )
             )
+            .delete(synchronize_session='fetch')
         )
-        return True
 
     @staticmethod
     def get_share_data(session, share_uri):
@@ -886,21 +978,32 @@ class ShareObjectRepository:
 
     @staticmethod
     def get_share_items_states(session, share_uri, item_uris=None):
+        return ShareObjectRepository.get_share_items_summary(session, share_uri, item_uris).states
+
+    @staticmethod
+    def get_share_items_summary(session, share_uri, item_uris=None) -> ShareItemsSummary:
+        return ShareObjectRepository.get_share_items_summaries(session, [share_uri], item_uris)[share_uri]
+
+    @staticmethod
+    def get_share_items_summaries(session, share_uris, item_uris=None) -> Dict[str, ShareItemsSummary]:
+        """Counts the items of all given shares by type and status with a single query"""
         query = (
-            session.query(ShareObjectItem)
-            .join(
-                ShareObject,
-                ShareObjectItem.shareUri == ShareObject.shareUri,
-            )
-            .filter(
-                and_(
-                    ShareObject.shareUri == share_uri,
-                )
+            session.query(
+                ShareObjectItem.shareUri,
+                ShareObjectItem.itemType,
+                ShareObjectItem.status,
+                func.count(ShareObjectItem.shareItemUri),
             )
+            .filter(ShareObjectItem.shareUri.in_(share_uris))
+            .group_by(ShareObjectItem.shareUri, ShareObjectItem.itemType, ShareObjectItem.status)
         )
         if item_uris:
             query = query.filter(ShareObjectItem.shareItemUri.in_(item_uris))
-        return [item.status for item in query.distinct(ShareObjectItem.status)]
+
+        summaries = {share_uri: ShareItemsSummary() for share_uri in share_uris}
+        for share_uri, item_type, status, count in query:
+            summaries[share_uri].counts[(item_type, status)] = count
+        return summaries
 
     @staticmethod
     def has_shared_items(session, item_uri: str) -> int:
@@ -995,8 +1098,20 @@ class ShareObjectRepository:
     def paginated_user_datasets(
             session, username, groups, data=None
     ) -> dict:
+        query = ShareObjectRepository._query_user_datasets(session, username, groups, data)
+        if is_cursor_pagination(data):
+            # DISTINCT ON datasetUri doesn't allow the keyset order, the datasets are selected by URI instead
+            return paginate_by_cursor(
+                query=session.query(Dataset).filter(
+                    Dataset.datasetUri.in_(query.with_entities(Dataset.datasetUri).statement)
+                ),
+                keys=[Dataset.created, Dataset.datasetUri],
+                page_size=data.get('pageSize', 10),
+                after=data.get('after'),
+                count_mode=data.get('countMode'),
+            ).to_dict()
         return paginate(
-            query=ShareObjectRepository._query_user_datasets(session, username, groups, data),
+            query=query,
             page=data.get('page', 1),
             page_size=data.get('pageSize', 10),
         ).to_dict()
@@ -1009,6 +1124,25 @@ class ShareObjectRepository:
             .all()
         )
 
+    @staticmethod
+    def find_user_shares_of_datasets(session, dataset_uris, username, groups) -> [ShareObject]:
+        """Returns shares of the datasets owned by the user or requested for one of the user's groups"""
+        if not dataset_uris:
+            return []
+        principal_filter = ShareObject.owner == username
+        if groups:
+            principal_filter = or_(principal_filter, ShareObject.principalId.in_(groups))
+        return (
+            session.query(ShareObject)
+            .filter(
+                and_(
+                    ShareObject.datasetUri.in_(dataset_uris),
+                    principal_filter,
+                )
+            )
+            .all()
+        )
+
     @staticmethod
     def query_dataset_shares(session, dataset_uri) -> Query:
         return session.query(ShareObject).filter(
@@ -48,12 +48,10 @@ class ShareItemService:
             share_sm = ShareObjectSM(share.status)
             new_share_state = share_sm.run_transition(ShareObjectActions.RevokeItems.value)
 
+            # the items that can't be revoked are rejected before anything is updated
             for item_state in revoked_items_states:
-                item_sm = ShareItemSM(item_state)
-                new_state = item_sm.run_transition(ShareObjectActions.RevokeItems.value)
-                for item in revoked_items:
-                    if item.status == item_state:
-                        item_sm.update_state_single_item(session, item, new_state)
+                ShareItemSM(item_state).run_transition(ShareObjectActions.RevokeItems.value)
+            ShareItemSM.run_transition_items(session, uri, revoked_items, ShareObjectActions.RevokeItems.value)
 
             share_sm.update_state(session, share, new_share_state)
 
@@ -1,14 +1,17 @@
 import abc
 import logging
+import os
 import uuid
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
 
 from botocore.exceptions import ClientError
 
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.modules.dataset_sharing.aws.glue_client import GlueClient
-from dataall.modules.dataset_sharing.aws.lakeformation_client import LakeFormationClient
+from dataall.modules.dataset_sharing.aws.lakeformation_client import LakeFormationClient, LakeFormationBatch
 from dataall.base.aws.quicksight import QuicksightClient
 from dataall.base.aws.iam import IAM
 from dataall.base.aws.sts import SessionHelper
@@ -16,11 +19,16 @@ from dataall.base.db import exceptions
 from dataall.modules.datasets_base.db.dataset_models import DatasetTable, Dataset
 from dataall.modules.dataset_sharing.services.dataset_alarm_service import DatasetAlarmService
 from dataall.modules.dataset_sharing.db.share_object_models import ShareObjectItem, ShareObject
+from dataall.modules.dataset_sharing.db.share_object_repositories import ShareObjectRepository, ShareItemSM
+from dataall.modules.dataset_sharing.db.enums import ShareItemActions
 
 logger = logging.getLogger(__name__)
 
 
 class LFShareManager:
+    # Lake Formation, Glue and RAM have low API rate limits, the tables of a share are processed by a few threads
+    max_workers = int(os.getenv('LF_SHARE_MAX_WORKERS', '4'))
+
     def __init__(
         self,
         session,
@@ -51,6 +59,75 @@ class LFShareManager:
     def process_revoked_shares(self) -> [str]:
         return NotImplementedError
 
+    def find_share_items(self, tables: [DatasetTable]) -> List[Tuple[DatasetTable, ShareObjectItem]]:
+        """Returns the tables with their share item, tables without share item are skipped"""
+        items = []
+        for table in tables:
+            share_item = ShareObjectRepository.find_sharable_item(
+                self.session, self.share.shareUri, table.tableUri
+            )
+            if not share_item:
+                logger.info(
+                    f'Share Item not found for {self.share.shareUri} '
+                    f'and Dataset Table {table.GlueTableName} continuing loop...'
+                )
+                continue
+            items.append((table, share_item))
+        return items
+
+    def run_concurrently(
+        self, fn: Callable[[DatasetTable], None], tables: [DatasetTable]
+    ) -> Dict[str, Exception]:
+        """
+        Runs fn for each table on a bounded thread pool and returns the errors by table URI.
+        fn must not use the database session, it is not shared between threads
+        """
+        def run(table):
+            try:
+                fn(table)
+                return table.tableUri, None
+            except Exception as e:
+                return table.tableUri, e
+
+        if len(tables) <= 1:
+            outcomes = [run(table) for table in tables]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tables))) as executor:
+                outcomes = list(executor.map(run, tables))
+        return {table_uri: error for table_uri, error in outcomes if error is not None}
+
+    def update_items_state(self, share_items: [ShareObjectItem], state: str, action: str) -> str:
+        """Runs the transition of the share items in the given state with one UPDATE, returns the new state"""
+        item_sm = ShareItemSM(state)
+        new_state = item_sm.run_transition(action)
+        item_sm.update_state_items(self.session, self.share.shareUri, share_items, new_state)
+        return new_state
+
+    def complete_items(
+        self,
+        items: List[Tuple[DatasetTable, ShareObjectItem]],
+        state: str,
+        errors: Dict[str, Exception],
+        handle_failure: Callable[[DatasetTable, ShareObjectItem, Exception], bool],
+    ) -> bool:
+        """
+        Transitions the succeeded and the failed items with one UPDATE each, then handles the failures.
+        Returns True if no item failed
+        """
+        failed = [(table, share_item) for table, share_item in items if table.tableUri in errors]
+        self.update_items_state(
+            [share_item for table, share_item in items if table.tableUri not in errors],
+            state,
+            ShareItemActions.Success.value,
+        )
+        # must run first to ensure state transitions to failed
+        self.update_items_state([share_item for _, share_item in failed], state, ShareItemActions.Failure.value)
+
+        for table, share_item in failed:
+            # statements which can throw exceptions but are not critical
+            handle_failure(table=table, share_item=share_item, error=errors[table.tableUri])
+        return not failed
+
     def get_share_principals(self) -> [str]:
         """
         Builds list of principals of the share request
@@ -290,35 +367,34 @@ class LFShareManager:
             )
             return True
 
-        for principal in principals:
-            logger.info(
-                f'Revoking resource link access '
-                f'on {self.target_environment.AwsAccountId}/{self.shared_db_name}/{table.GlueTableName} '
-                f'for principal {principal}'
-
-            )
-            LakeFormationClient.batch_revoke_permissions(
-                SessionHelper.remote_session(self.target_environment.AwsAccountId).client(
-                    'lakeformation', region_name=self.target_environment.region
-                ),
-                self.target_environment.AwsAccountId,
-                [
-                    {
-                        'Id': str(uuid.uuid4()),
-                        'Principal': {
-                            'DataLakePrincipalIdentifier': principal
-                        },
-                        'Resource': {
-                            'Table': {
-                                'DatabaseName': self.shared_db_name,
-                                'Name': table.GlueTableName,
-                                'CatalogId': self.target_environment.AwsAccountId,
-                            }
-                        },
-                        'Permissions': ['DESCRIBE'],
-                    }
-                ],
-            )
+        logger.info(
+            f'Revoking resource link access '
+            f'on {self.target_environment.AwsAccountId}/{self.shared_db_name}/{table.GlueTableName} '
+            f'for principals {principals}'
+        )
+        LakeFormationClient.batch_revoke_permissions(
+            SessionHelper.remote_session(self.target_environment.AwsAccountId).client(
+                'lakeformation', region_name=self.target_environment.region
+            ),
+            self.target_environment.AwsAccountId,
+            [
+                {
+                    'Id': str(uuid.uuid4()),
+                    'Principal': {
+                        'DataLakePrincipalIdentifier': principal
+                    },
+                    'Resource': {
+                        'Table': {
+                            'DatabaseName': self.shared_db_name,
+                            'Name': table.GlueTableName,
+                            'CatalogId': self.target_environment.AwsAccountId,
+                        }
+                    },
+                    'Permissions': ['DESCRIBE'],
+                }
+                for principal in principals
+            ],
+        )
         return True
 
     def revoke_source_table_access(self, table, principals: [str]):
@@ -366,58 +442,69 @@ class LFShareManager:
         glue_client.delete_table(table.GlueTableName)
         return True
 
-    @classmethod
-    def share_table_with_target_account(cls, **data):
+    def share_tables_with_target_account(self, tables: [DatasetTable]) -> None:
         """
-        Shares tables using Lake Formation
+        Shares the tables with the target account using Lake Formation, with one batch of
+        IAMAllowedGroups revokes and one batch of grants for all tables.
+        A grant that fails is logged as a warning and doesn't fail the share item.
         Sharing feature may take some extra seconds
-        :param data:
-        :return:
         """
-        source_accountid = data['source']['accountid']
-        source_region = data['source']['region']
+        if not tables:
+            return
+        source_accountid = self.source_environment.AwsAccountId
+        source_region = self.source_environment.region
+        target_accountid = self.target_environment.AwsAccountId
 
-        target_accountid = data['target']['accountid']
-        target_region = data['target']['region']
-
-        source_session = SessionHelper.remote_session(accountid=source_accountid)
-        source_lf_client = source_session.client(
+        source_lf_client = SessionHelper.remote_session(accountid=source_accountid).client(
             'lakeformation', region_name=source_region
         )
-        try:
 
-            LakeFormationClient.revoke_iamallowedgroups_super_permission_from_table(
-                source_lf_client,
-                source_accountid,
-                data['source']['database'],
-                data['source']['tablename'],
+        # When upgrading to LF tables can still have IAMAllowedGroups permissions,
+        # unless this is revoked the table can not be shared using LakeFormation
+        revokes = LakeFormationBatch(source_lf_client, source_accountid)
+        for table in tables:
+            revokes.revoke(
+                'EVERYONE',
+                {
+                    'Table': {
+                        'DatabaseName': table.GlueDatabaseName,
+                        'Name': table.GlueTableName,
+                        'CatalogId': source_accountid,
+                    }
+                },
+                ['ALL'],
+                [],
+                key=table.tableUri,
             )
-            time.sleep(1)
-
-            LakeFormationClient.grant_permissions_to_table(
-                source_lf_client,
+        for result in revokes.execute():
+            if not result.succeeded:
+                logger.debug(
+                    f'Could not revoke IAMAllowedGroups Super permission on table {result.key} due to {result.error}'
+                )
+        time.sleep(1)
+
+        grants = LakeFormationBatch(source_lf_client, source_accountid)
+        for table in tables:
+            grants.grant(
                 target_accountid,
-                data['source']['database'],
-                data['source']['tablename'],
+                {'Table': {'DatabaseName': table.GlueDatabaseName, 'Name': table.GlueTableName}},
                 ['DESCRIBE', 'SELECT'],
                 ['DESCRIBE', 'SELECT'],
+                key=table.tableUri,
             )
-            time.sleep(2)
-
-            logger.info(
-                f"Granted access to table {data['source']['tablename']} "
-                f'to external account {target_accountid} '
-            )
-            return True
-
-        except ClientError as e:
-            logging.error(
-                f'Failed granting access to table {data["source"]["tablename"]} '
-                f'from {source_accountid} / {source_region} '
-                f'to external account{target_accountid}/{target_region}'
-                f'due to: {e}'
-            )
-            raise e
+        errors = LakeFormationBatch.errors_by_key(grants.execute())
+        time.sleep(2)
+
+        for table in tables:
+            if table.tableUri in errors:
+                logger.warning(
+                    f'Could not grant access to table {table.GlueTableName} '
+                    f'from {source_accountid} / {source_region} '
+                    f'to external account {target_accountid} '
+                    f'due to: {errors[table.tableUri]}'
+                )
+            else:
+                logger.info(f'Granted access to table {table.GlueTableName} to external account {target_accountid}')
 
     def revoke_external_account_access_on_source_account(self, db_name, table_name) -> [dict]:
         """
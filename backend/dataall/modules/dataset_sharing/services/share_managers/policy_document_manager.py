@@ -0,0 +1,120 @@
+"""
+Policy documents (bucket, access point and KMS key policies) edited during a share run.
+
+Every folder of a share edits the same bucket, access point and key policies. Instead of fetching and writing
+each policy once per folder, a PolicyDocumentManager is shared by the folders of the run: every policy is fetched
+once, the folders apply their grants and revokes in memory and the policies are written once at the end.
+A policy is written only if its rendered JSON changed. Before writing, the policy is fetched again and if it was
+changed by someone else in the meantime, the edits of the run are replayed on the new version.
+"""
+import hashlib
+import json
+import logging
+from typing import Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_WRITE_ATTEMPTS = 3
+
+PolicyEdit = Callable[[Optional[dict]], Optional[dict]]
+
+
+class PolicyConflictError(Exception):
+    def __init__(self, name: str):
+        super().__init__(
+            f'Policy {name} kept changing while it was being updated, giving up after {MAX_WRITE_ATTEMPTS} attempts'
+        )
+
+
+def policy_hash(policy: Optional[dict]) -> Optional[str]:
+    if policy is None:
+        return None
+    return hashlib.sha256(json.dumps(policy, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class PolicyDocument:
+    """A policy fetched once, edited in memory and written back if it changed"""
+
+    def __init__(self, name: str, read: Callable[[], Optional[str]], write: Callable[[str], None]):
+        self.name = name
+        self._read = read
+        self._write = write
+        self._edits: List[PolicyEdit] = []
+        self._loaded = False
+        self._base_hash = None
+        self.policy: Optional[dict] = None
+
+    def _fetch(self) -> Optional[dict]:
+        policy = self._read()
+        return json.loads(policy) if policy else None
+
+    def load(self) -> Optional[dict]:
+        if not self._loaded:
+            self.policy = self._fetch()
+            self._base_hash = policy_hash(self.policy)
+            self._loaded = True
+        return self.policy
+
+    def update(self, edit: PolicyEdit) -> Optional[dict]:
+        """Applies the edit to the policy (None if there is no policy yet), the edit returns the new policy"""
+        self.policy = edit(self.load())
+        self._edits.append(edit)
+        return self.policy
+
+    @property
+    def changed(self) -> bool:
+        return self._loaded and self.policy is not None and policy_hash(self.policy) != self._base_hash
+
+    def flush(self) -> bool:
+        """Writes the policy if it changed, returns True if it was written"""
+        for _ in range(MAX_WRITE_ATTEMPTS):
+            if not self.changed:
+                logger.info(f'Policy {self.name} is unchanged, skipping the update')
+                return False
+
+            current = self._fetch()
+            if policy_hash(current) == self._base_hash:
+                self._write(json.dumps(self.policy))
+                self._base_hash = policy_hash(self.policy)
+                return True
+
+            logger.warning(f'Policy {self.name} was changed since it was read, applying the edits again')
+            self._base_hash = policy_hash(current)
+            self.policy = current
+            for edit in self._edits:
+                self.policy = edit(self.policy)
+
+        raise PolicyConflictError(self.name)
+
+
+class PolicyDocumentManager:
+    """Policy documents and AWS clients shared by the share managers of the folders of a share run"""
+
+    def __init__(self):
+        self._documents: Dict[Hashable, PolicyDocument] = {}
+        self._cache: Dict[Hashable, object] = {}
+
+    def cached(self, key: Hashable, load: Callable[[], object]):
+        """Loads a value (a client, a key id, an access point ARN) once per run"""
+        if key not in self._cache:
+            self._cache[key] = load()
+        return self._cache[key]
+
+    def client(self, client_class, account_id: str, region: str):
+        return self.cached((client_class, account_id, region), lambda: client_class(account_id, region))
+
+    def document(self, name: str, read: Callable[[], Optional[str]], write: Callable[[str], None]) -> PolicyDocument:
+        if name not in self._documents:
+            self._documents[name] = PolicyDocument(name, read, write)
+        return self._documents[name]
+
+    def flush(self) -> Dict[str, Exception]:
+        """Writes every changed policy, returns the errors by policy name"""
+        errors = {}
+        for name, document in self._documents.items():
+            try:
+                document.flush()
+            except Exception as e:
+                logger.error(f'Failed to update policy {name} due to: {e}')
+                errors[name] = e
+        return errors
@@ -2,6 +2,7 @@ import abc
 import logging
 import json
 import time
+from contextlib import contextmanager
 from itertools import count
 
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
@@ -13,6 +14,10 @@ from dataall.base.aws.iam import IAM
 from dataall.modules.dataset_sharing.db.share_object_models import ShareObject
 from dataall.modules.dataset_sharing.services.dataset_alarm_service import DatasetAlarmService
 from dataall.modules.dataset_sharing.db.share_object_repositories import ShareObjectRepository
+from dataall.modules.dataset_sharing.services.share_managers.policy_document_manager import (
+    PolicyDocumentManager,
+    PolicyEdit,
+)
 from dataall.modules.dataset_sharing.services.share_managers.share_manager_utils import ShareManagerUtils
 
 from dataall.modules.datasets_base.db.dataset_models import DatasetStorageLocation, Dataset
@@ -37,8 +42,11 @@ class S3AccessPointShareManager:
         target_environment: Environment,
         source_env_group: EnvironmentGroup,
         env_group: EnvironmentGroup,
+        policy_documents: PolicyDocumentManager = None,
     ):
         self.session = session
+        self.policy_documents = policy_documents
+        self.edited_policies = []
         self.source_env_group = source_env_group
         self.env_group = env_group
         self.dataset = dataset
@@ -84,6 +92,69 @@ class S3AccessPointShareManager:
         logger.info(f"S3AccessPointName={S3AccessPointName}")
         return S3AccessPointName
 
+    @contextmanager
+    def _policy_documents(self):
+        """
+        Policies edited in the block are written when the share run flushes the shared PolicyDocumentManager,
+        or when the block exits if the manager is used on its own
+        """
+        if self.policy_documents:
+            yield self.policy_documents
+            return
+
+        documents = PolicyDocumentManager()
+        yield documents
+        errors = documents.flush()
+        if errors:
+            raise next(iter(errors.values()))
+
+    def _edit_policy(self, documents: PolicyDocumentManager, name: str, read, write, edit: PolicyEdit):
+        if name not in self.edited_policies:
+            self.edited_policies.append(name)
+        documents.document(name, read, write).update(edit)
+
+    def _edit_bucket_policy(self, documents: PolicyDocumentManager, edit: PolicyEdit):
+        s3_client = documents.client(S3Client, self.source_account_id, self.source_environment.region)
+        self._edit_policy(
+            documents,
+            f'bucket/{self.bucket_name}',
+            lambda: s3_client.get_bucket_policy(self.bucket_name),
+            lambda policy: s3_client.create_bucket_policy(self.bucket_name, policy),
+            edit,
+        )
+
+    def _edit_access_point_policy(self, documents: PolicyDocumentManager, edit: PolicyEdit):
+        s3_client = documents.client(S3ControlClient, self.source_account_id, self.source_environment.region)
+        self._edit_policy(
+            documents,
+            f'accesspoint/{self.source_account_id}/{self.access_point_name}',
+            lambda: s3_client.get_access_point_policy(self.access_point_name),
+            lambda policy: s3_client.attach_access_point_policy(
+                access_point_name=self.access_point_name, policy=policy
+            ),
+            edit,
+        )
+
+    def _edit_key_policy(self, documents: PolicyDocumentManager, kms_client, kms_key_id: str, edit: PolicyEdit):
+        self._edit_policy(
+            documents,
+            f'key/{kms_key_id}',
+            lambda: kms_client.get_key_policy(kms_key_id),
+            lambda policy: kms_client.put_key_policy(kms_key_id, policy),
+            edit,
+        )
+
+    def _get_owner_role_ids(self, documents: PolicyDocumentManager):
+        return documents.cached(('owner_role_ids', self.source_account_id), lambda: [
+            f'{item}:*' for item in SessionHelper.get_role_ids(
+                self.source_account_id,
+                [
+                    self.dataset_admin, self.source_env_admin,
+                    SessionHelper.get_delegation_role_arn(self.source_account_id)
+                ]
+            )
+        ])
+
     def manage_bucket_policy(self):
         """
         This function will manage bucket policy by grant admin access to dataset admin, pivot role
@@ -94,49 +165,47 @@ class S3AccessPointShareManager:
             f'Manage Bucket policy for {self.bucket_name}'
         )
 
-        s3_client = S3Client(self.source_account_id, self.source_environment.region)
-        bucket_policy = json.loads(s3_client.get_bucket_policy(self.bucket_name))
-        for statement in bucket_policy["Statement"]:
-            if statement.get("Sid") in ["DelegateAccessToAccessPoint"]:
-                return
-        exceptions_roleId = [f'{item}:*' for item in SessionHelper.get_role_ids(
-            self.source_account_id,
-            [self.dataset_admin, self.source_env_admin, SessionHelper.get_delegation_role_arn(self.source_account_id)]
-        )]
-        allow_owner_access = {
-            "Sid": DATAALL_ALLOW_OWNER_SID,
-            "Effect": "Allow",
-            "Principal": "*",
-            "Action": "s3:*",
-            "Resource": [
-                f"arn:aws:s3:::{self.bucket_name}",
-                f"arn:aws:s3:::{self.bucket_name}/*"
-            ],
-            "Condition": {
-                "StringLike": {
-                    "aws:userId": exceptions_roleId
+        with self._policy_documents() as documents:
+            def delegate_access_to_access_point(bucket_policy):
+                bucket_policy = bucket_policy or {"Version": "2012-10-17", "Statement": []}
+                for statement in bucket_policy["Statement"]:
+                    if statement.get("Sid") in ["DelegateAccessToAccessPoint"]:
+                        return bucket_policy
+                allow_owner_access = {
+                    "Sid": DATAALL_ALLOW_OWNER_SID,
+                    "Effect": "Allow",
+                    "Principal": "*",
+                    "Action": "s3:*",
+                    "Resource": [
+                        f"arn:aws:s3:::{self.bucket_name}",
+                        f"arn:aws:s3:::{self.bucket_name}/*"
+                    ],
+                    "Condition": {
+                        "StringLike": {
+                            "aws:userId": self._get_owner_role_ids(documents)
+                        }
+                    }
                 }
-            }
-        }
-        delegated_to_accesspoint = {
-            "Sid": "DelegateAccessToAccessPoint",
-            "Effect": "Allow",
-            "Principal": "*",
-            "Action": "s3:*",
-            "Resource": [
-                f"arn:aws:s3:::{self.bucket_name}",
-                f"arn:aws:s3:::{self.bucket_name}/*"
-            ],
-            "Condition": {
-                "StringEquals": {
-                    "s3:DataAccessPointAccount": f"{self.source_account_id}"
+                delegated_to_accesspoint = {
+                    "Sid": "DelegateAccessToAccessPoint",
+                    "Effect": "Allow",
+                    "Principal": "*",
+                    "Action": "s3:*",
+                    "Resource": [
+                        f"arn:aws:s3:::{self.bucket_name}",
+                        f"arn:aws:s3:::{self.bucket_name}/*"
+                    ],
+                    "Condition": {
+                        "StringEquals": {
+                            "s3:DataAccessPointAccount": f"{self.source_account_id}"
+                        }
+                    }
                 }
-            }
-        }
-        bucket_policy["Statement"].append(allow_owner_access)
-        bucket_policy["Statement"].append(delegated_to_accesspoint)
-        s3_client = S3Client(self.source_account_id, self.source_environment.region)
-        s3_client.create_bucket_policy(self.bucket_name, json.dumps(bucket_policy))
+                bucket_policy["Statement"].append(allow_owner_access)
+                bucket_policy["Statement"].append(delegated_to_accesspoint)
+                return bucket_policy
+
+            self._edit_bucket_policy(documents, delegate_access_to_access_point)
 
     def grant_target_role_access_policy(self):
         """
@@ -243,8 +312,75 @@ class S3AccessPointShareManager:
         """
         :return:
         """
+        with self._policy_documents() as documents:
+            access_point_arn = documents.cached(
+                ('access_point_arn', self.source_account_id, self.access_point_name),
+                lambda: self._get_or_create_access_point(documents),
+            )
+            # requester will use this role to access resources
+            target_requester_id = documents.cached(
+                ('role_id', self.target_account_id, self.target_requester_IAMRoleName),
+                lambda: SessionHelper.get_role_id(self.target_account_id, self.target_requester_IAMRoleName),
+            )
+
+            def grant_folder_access(existing_policy):
+                if existing_policy:
+                    # Update existing access point policy
+                    logger.info(
+                        f'There is already an existing access point {access_point_arn} with an existing policy, updating policy...'
+                    )
+                    statements = {item["Sid"]: item for item in existing_policy["Statement"]}
+                    if f"{target_requester_id}0" in statements.keys():
+                        prefix_list = statements[f"{target_requester_id}0"]["Condition"]["StringLike"]["s3:prefix"]
+                        if isinstance(prefix_list, str):
+                            prefix_list = [prefix_list]
+                        if f"{self.s3_prefix}/*" not in prefix_list:
+                            prefix_list.append(f"{self.s3_prefix}/*")
+                            statements[f"{target_requester_id}0"]["Condition"]["StringLike"]["s3:prefix"] = prefix_list
+                        resource_list = statements[f"{target_requester_id}1"]["Resource"]
+                        if isinstance(resource_list, str):
+                            resource_list = [resource_list]
+                        if f"{access_point_arn}/object/{self.s3_prefix}/*" not in resource_list:
+                            resource_list.append(f"{access_point_arn}/object/{self.s3_prefix}/*")
+                            statements[f"{target_requester_id}1"]["Resource"] = resource_list
+                        existing_policy["Statement"] = list(statements.values())
+                    else:
+                        additional_policy = S3ControlClient.generate_access_point_policy_template(
+                            target_requester_id,
+                            access_point_arn,
+                            self.s3_prefix,
+                        )
+                        existing_policy["Statement"].extend(additional_policy["Statement"])
+                    return existing_policy
+
+                # First time to create access point policy
+                logger.info(
+                    f'Access point policy for access point {access_point_arn} does not exists, creating policy...'
+                )
+                access_point_policy = S3ControlClient.generate_access_point_policy_template(
+                    target_requester_id,
+                    access_point_arn,
+                    self.s3_prefix,
+                )
+                admin_statement = {
+                    "Sid": DATAALL_ALLOW_OWNER_SID,
+                    "Effect": "Allow",
+                    "Principal": "*",
+                    "Action": "s3:*",
+                    "Resource": f"{access_point_arn}",
+                    "Condition": {
+                        "StringLike": {
+                            "aws:userId": self._get_owner_role_ids(documents)
+                        }
+                    }
+                }
+                access_point_policy["Statement"].append(admin_statement)
+                return access_point_policy
+
+            self._edit_access_point_policy(documents, grant_folder_access)
 
-        s3_client = S3ControlClient(self.source_account_id, self.source_environment.region)
+    def _get_or_create_access_point(self, documents: PolicyDocumentManager):
+        s3_client = documents.client(S3ControlClient, self.source_account_id, self.source_environment.region)
         access_point_arn = s3_client.get_bucket_access_point_arn(self.access_point_name)
         if not access_point_arn:
             logger.info(
@@ -260,148 +396,92 @@ class S3AccessPointShareManager:
                 )
                 time.sleep(ACCESS_POINT_CREATION_TIME)
                 retries += 1
-        existing_policy = s3_client.get_access_point_policy(self.access_point_name)
-        # requester will use this role to access resources
-        target_requester_id = SessionHelper.get_role_id(self.target_account_id, self.target_requester_IAMRoleName)
-        if existing_policy:
-            # Update existing access point policy
-            logger.info(
-                f'There is already an existing access point {access_point_arn} with an existing policy, updating policy...'
-            )
-            existing_policy = json.loads(existing_policy)
-            statements = {item["Sid"]: item for item in existing_policy["Statement"]}
-            if f"{target_requester_id}0" in statements.keys():
-                prefix_list = statements[f"{target_requester_id}0"]["Condition"]["StringLike"]["s3:prefix"]
-                if isinstance(prefix_list, str):
-                    prefix_list = [prefix_list]
-                if f"{self.s3_prefix}/*" not in prefix_list:
-                    prefix_list.append(f"{self.s3_prefix}/*")
-                    statements[f"{target_requester_id}0"]["Condition"]["StringLike"]["s3:prefix"] = prefix_list
-                resource_list = statements[f"{target_requester_id}1"]["Resource"]
-                if isinstance(resource_list, str):
-                    resource_list = [resource_list]
-                if f"{access_point_arn}/object/{self.s3_prefix}/*" not in resource_list:
-                    resource_list.append(f"{access_point_arn}/object/{self.s3_prefix}/*")
-                    statements[f"{target_requester_id}1"]["Resource"] = resource_list
-                existing_policy["Statement"] = list(statements.values())
-            else:
-                additional_policy = S3ControlClient.generate_access_point_policy_template(
-                    target_requester_id,
-                    access_point_arn,
-                    self.s3_prefix,
-                )
-                existing_policy["Statement"].extend(additional_policy["Statement"])
-            access_point_policy = existing_policy
-        else:
-            # First time to create access point policy
-            logger.info(
-                f'Access point policy for access point {access_point_arn} does not exists, creating policy...'
-            )
-            access_point_policy = S3ControlClient.generate_access_point_policy_template(
-                target_requester_id,
-                access_point_arn,
-                self.s3_prefix,
-            )
-            exceptions_roleId = [f'{item}:*' for item in SessionHelper.get_role_ids(
-                self.source_account_id,
-                [
-                    self.dataset_admin, self.source_env_admin,
-                    SessionHelper.get_delegation_role_arn(self.source_account_id)
-                ]
-            )]
-            admin_statement = {
-                "Sid": DATAALL_ALLOW_OWNER_SID,
-                "Effect": "Allow",
-                "Principal": "*",
-                "Action": "s3:*",
-                "Resource": f"{access_point_arn}",
-                "Condition": {
-                    "StringLike": {
-                        "aws:userId": exceptions_roleId
-                    }
-                }
-            }
-            access_point_policy["Statement"].append(admin_statement)
-        s3_client.attach_access_point_policy(
-            access_point_name=self.access_point_name, policy=json.dumps(access_point_policy)
-        )
+        return access_point_arn
 
     def update_dataset_bucket_key_policy(self):
         logger.info(
             'Updating dataset Bucket KMS key policy...'
         )
-        key_alias = f"alias/{self.dataset.KmsAlias}"
-        kms_client = KmsClient(self.source_account_id, self.source_environment.region)
-        kms_key_id = kms_client.get_key_id(key_alias)
-        existing_policy = kms_client.get_key_policy(kms_key_id)
-        target_requester_arn = IAM.get_role_arn_by_name(self.target_account_id, self.target_requester_IAMRoleName)
-        pivot_role_name = SessionHelper.get_delegation_role_name()
-
-        if existing_policy:
-            existing_policy = json.loads(existing_policy)
-            counter = count()
-            statements = {item.get("Sid", next(counter)): item for item in existing_policy.get("Statement", {})}
-
-            if DATAALL_KMS_PIVOT_ROLE_PERMISSIONS_SID in statements.keys():
-                logger.info(
-                    f'KMS key policy already contains share statement {DATAALL_KMS_PIVOT_ROLE_PERMISSIONS_SID}')
-            else:
-                logger.info(
-                    f'KMS key policy does not contain statement {DATAALL_KMS_PIVOT_ROLE_PERMISSIONS_SID}, generating a new one')
-                statements[DATAALL_KMS_PIVOT_ROLE_PERMISSIONS_SID] \
-                    = self.generate_enable_pivot_role_permissions_policy_statement(pivot_role_name, self.dataset_account_id)
-
-            if DATAALL_ACCESS_POINT_KMS_DECRYPT_SID in statements.keys():
-                logger.info(
-                    f'KMS key policy contains share statement {DATAALL_ACCESS_POINT_KMS_DECRYPT_SID}, '
-                    f'updating the current one')
-                statements[DATAALL_ACCESS_POINT_KMS_DECRYPT_SID] = (self.add_target_arn_to_statement_principal
-                                                                    (statements[DATAALL_ACCESS_POINT_KMS_DECRYPT_SID],
-                                                                     target_requester_arn))
-            else:
-                logger.info(
-                    f'KMS key does not contain share statement {DATAALL_ACCESS_POINT_KMS_DECRYPT_SID}, '
-                    f'generating a new one')
-                statements[DATAALL_ACCESS_POINT_KMS_DECRYPT_SID] = (self.generate_default_kms_decrypt_policy_statement
-                                                                    (target_requester_arn))
-            existing_policy["Statement"] = list(statements.values())
+        with self._policy_documents() as documents:
+            key_alias = f"alias/{self.dataset.KmsAlias}"
+            kms_client = documents.client(KmsClient, self.source_account_id, self.source_environment.region)
+            kms_key_id = documents.cached(('kms_key_id', key_alias), lambda: kms_client.get_key_id(key_alias))
+            target_requester_arn = documents.cached(
+                ('role_arn', self.target_account_id, self.target_requester_IAMRoleName),
+                lambda: IAM.get_role_arn_by_name(self.target_account_id, self.target_requester_IAMRoleName),
+            )
+            pivot_role_name = SessionHelper.get_delegation_role_name()
+
+            def grant_decrypt(existing_policy):
+                if existing_policy:
+                    counter = count()
+                    statements = {item.get("Sid", next(counter)): item for item in existing_policy.get("Statement", {})}
+
+                    if DATAALL_KMS_PIVOT_ROLE_PERMISSIONS_SID in statements.keys():
+                        logger.info(
+                            f'KMS key policy already contains share statement {DATAALL_KMS_PIVOT_ROLE_PERMISSIONS_SID}')
+                    else:
+                        logger.info(
+                            f'KMS key policy does not contain statement {DATAALL_KMS_PIVOT_ROLE_PERMISSIONS_SID}, generating a new one')
+                        statements[DATAALL_KMS_PIVOT_ROLE_PERMISSIONS_SID] \
+                            = self.generate_enable_pivot_role_permissions_policy_statement(pivot_role_name, self.dataset_account_id)
+
+                    if DATAALL_ACCESS_POINT_KMS_DECRYPT_SID in statements.keys():
+                        logger.info(
+                            f'KMS key policy contains share statement {DATAALL_ACCESS_POINT_KMS_DECRYPT_SID}, '
+                            f'updating the current one')
+                        statements[DATAALL_ACCESS_POINT_KMS_DECRYPT_SID] = (self.add_target_arn_to_statement_principal
+                                                                            (statements[DATAALL_ACCESS_POINT_KMS_DECRYPT_SID],
+                                                                             target_requester_arn))
+                    else:
+                        logger.info(
+                            f'KMS key does not contain share statement {DATAALL_ACCESS_POINT_KMS_DECRYPT_SID}, '
+                            f'generating a new one')
+                        statements[DATAALL_ACCESS_POINT_KMS_DECRYPT_SID] = (self.generate_default_kms_decrypt_policy_statement
+                                                                            (target_requester_arn))
+                    existing_policy["Statement"] = list(statements.values())
+                    return existing_policy
+
+                logger.info('KMS key policy does not contain any statements, generating a new one')
+                return {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        self.generate_default_kms_decrypt_policy_statement(target_requester_arn),
+                        self.generate_enable_pivot_role_permissions_policy_statement(pivot_role_name, self.dataset_account_id)
+                    ]
+                }
 
-        else:
-            logger.info('KMS key policy does not contain any statements, generating a new one')
-            existing_policy = {
-                "Version": "2012-10-17",
-                "Statement": [
-                    self.generate_default_kms_decrypt_policy_statement(target_requester_arn),
-                    self.generate_enable_pivot_role_permissions_policy_statement(pivot_role_name, self.dataset_account_id)
-                ]
-            }
-        kms_client.put_key_policy(
-            kms_key_id,
-            json.dumps(existing_policy)
-        )
+            self._edit_key_policy(documents, kms_client, kms_key_id, grant_decrypt)
 
     def delete_access_point_policy(self):
         logger.info(
             f'Deleting access point policy for access point {self.access_point_name}...'
         )
-        s3_client = S3ControlClient(self.source_account_id, self.source_environment.region)
-        access_point_policy = json.loads(s3_client.get_access_point_policy(self.access_point_name))
-        access_point_arn = s3_client.get_bucket_access_point_arn(self.access_point_name)
-        target_requester_id = SessionHelper.get_role_id(self.target_account_id, self.target_requester_IAMRoleName)
-        statements = {item["Sid"]: item for item in access_point_policy["Statement"]}
-        if f"{target_requester_id}0" in statements.keys():
-            prefix_list = statements[f"{target_requester_id}0"]["Condition"]["StringLike"]["s3:prefix"]
-            if isinstance(prefix_list, list) and f"{self.s3_prefix}/*" in prefix_list:
-                prefix_list.remove(f"{self.s3_prefix}/*")
-                statements[f"{target_requester_id}1"]["Resource"].remove(f"{access_point_arn}/object/{self.s3_prefix}/*")
-                access_point_policy["Statement"] = list(statements.values())
-            else:
-                access_point_policy["Statement"].remove(statements[f"{target_requester_id}0"])
-                access_point_policy["Statement"].remove(statements[f"{target_requester_id}1"])
-        s3_client.attach_access_point_policy(
-            access_point_name=self.access_point_name,
-            policy=json.dumps(access_point_policy)
-        )
+        with self._policy_documents() as documents:
+            s3_client = documents.client(S3ControlClient, self.source_account_id, self.source_environment.region)
+            access_point_arn = documents.cached(
+                ('access_point_arn', self.source_account_id, self.access_point_name),
+                lambda: s3_client.get_bucket_access_point_arn(self.access_point_name),
+            )
+            target_requester_id = documents.cached(
+                ('role_id', self.target_account_id, self.target_requester_IAMRoleName),
+                lambda: SessionHelper.get_role_id(self.target_account_id, self.target_requester_IAMRoleName),
+            )
+
+            def revoke_folder_access(access_point_policy):
+                statements = {item["Sid"]: item for item in access_point_policy["Statement"]}
+                if f"{target_requester_id}0" in statements.keys():
+                    prefix_list = statements[f"{target_requester_id}0"]["Condition"]["StringLike"]["s3:prefix"]
+                    if isinstance(prefix_list, list) and f"{self.s3_prefix}/*" in prefix_list:
+                        prefix_list.remove(f"{self.s3_prefix}/*")
+                        statements[f"{target_requester_id}1"]["Resource"].remove(f"{access_point_arn}/object/{self.s3_prefix}/*")
+                        access_point_policy["Statement"] = list(statements.values())
+                    else:
+                        access_point_policy["Statement"].remove(statements[f"{target_requester_id}0"])
+                        access_point_policy["Statement"].remove(statements[f"{target_requester_id}1"])
+                return access_point_policy
+
+            self._edit_access_point_policy(documents, revoke_folder_access)
 
     @staticmethod
     def delete_access_point(
@@ -319,30 +319,6 @@ class ShareObjectService:
 
             return True
 
-    @staticmethod
-    def resolve_share_object_statistics(uri):
-        with get_context().db_engine.scoped_session() as session:
-            tables = ShareObjectRepository.count_sharable_items(session, uri, 'DatasetTable')
-            locations = ShareObjectRepository.count_sharable_items(session, uri, 'DatasetStorageLocation')
-            shared_items = ShareObjectRepository.count_items_in_states(
-                session, uri, ShareItemSM.get_share_item_shared_states()
-            )
-            revoked_items = ShareObjectRepository.count_items_in_states(
-                session, uri, [ShareItemStatus.Revoke_Succeeded.value]
-            )
-            failed_states = [
-                ShareItemStatus.Share_Failed.value,
-                ShareItemStatus.Revoke_Failed.value
-            ]
-            failed_items = ShareObjectRepository.count_items_in_states(
-                session, uri, failed_states
-            )
-            pending_items = ShareObjectRepository.count_items_in_states(
-                session, uri, [ShareItemStatus.PendingApproval.value]
-            )
-            return {'tables': tables, 'locations': locations, 'sharedItems': shared_items, 'revokedItems': revoked_items,
-                    'failedItems': failed_items, 'pendingItems': pending_items}
-
     @staticmethod
     def list_shares_in_my_inbox(filter: dict):
         context = get_context()
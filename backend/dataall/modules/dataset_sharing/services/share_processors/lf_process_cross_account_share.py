@@ -1,12 +1,12 @@
 import logging
 
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
-from dataall.modules.dataset_sharing.db.enums import ShareItemStatus, ShareObjectActions, ShareItemActions
+from dataall.modules.dataset_sharing.db.enums import ShareItemStatus, ShareObjectActions
 from ..share_managers import LFShareManager
 from dataall.modules.dataset_sharing.aws.ram_client import RamClient
 from dataall.modules.datasets_base.db.dataset_models import DatasetTable, Dataset
 from dataall.modules.dataset_sharing.db.share_object_models import ShareObject
-from dataall.modules.dataset_sharing.db.share_object_repositories import ShareObjectRepository, ShareItemSM
+from dataall.modules.dataset_sharing.db.share_object_repositories import ShareObjectRepository
 
 log = logging.getLogger(__name__)
 
@@ -39,15 +39,18 @@ class ProcessLFCrossAccountShare(LFShareManager):
         1) Grant ALL permissions to pivotRole for source database in source account
         2) Get share principals (requester IAM role and QS groups) and build shared db name
         3) Create the shared database in target account if it doesn't exist
-        4) For each shared table:
-            a) update its status to SHARE_IN_PROGRESS with Action Start
-            b) check if share item exists on glue catalog raise error if not and flag share item status to failed
-            c) grant external account (target account) access to table -> create RAM invitation and revoke_iamallowedgroups_super_permission_from_table
-            d) accept pending RAM invitation
-            e) create resource link for table in target account
-            f) grant permission to table for requester team IAM role in source account
-            g) grant permission to resource link table for requester team IAM role in target account
-            h) update share item status to SHARE_SUCCESSFUL with Action Success
+        4) Update the status of the shared tables to SHARE_IN_PROGRESS with Action Start
+        5) For each shared table, concurrently check if share item exists on glue catalog raise error if not
+           and flag share item status to failed
+        6) Grant external account (target account) access to all tables with batches -> create RAM invitations
+           and revoke IAMAllowedGroups super permission from the tables
+        7) Accept the pending RAM invitations of all tables at once, share again the tables of expired invitations
+        8) For each shared table, concurrently:
+            a) create resource link for table in target account
+            b) grant permission to table for requester team IAM role in source account
+            c) grant permission to resource link table for requester team IAM role in target account
+        9) Update the status of the succeeded tables to SHARE_SUCCESSFUL with Action Success
+           and of the failed tables to SHARE_FAILED with Action Failure
 
         Returns
         -------
@@ -58,78 +61,73 @@ class ProcessLFCrossAccountShare(LFShareManager):
         log.info(
             '##### Starting Sharing tables cross account #######'
         )
-        success = True
         if not self.shared_tables:
             log.info("No tables to share. Skipping...")
-        else:
-            self.grant_pivot_role_all_database_permissions()
+            return True
 
-            shared_db_name = self.build_shared_db_name()
-            principals = self.get_share_principals()
+        self.grant_pivot_role_all_database_permissions()
 
-            self.create_shared_database(
-                self.target_environment, self.dataset, shared_db_name, principals
-            )
-
-            for table in self.shared_tables:
-                log.info(f"Sharing table {table.GlueTableName}...")
-
-                share_item = ShareObjectRepository.find_sharable_item(
-                    self.session, self.share.shareUri, table.tableUri
-                )
-
-                if not share_item:
-                    log.info(
-                        f'Share Item not found for {self.share.shareUri} '
-                        f'and Dataset Table {table.GlueTableName} continuing loop...'
-                    )
-                    continue
-
-                shared_item_SM = ShareItemSM(ShareItemStatus.Share_Approved.value)
-                new_state = shared_item_SM.run_transition(ShareObjectActions.Start.value)
-                shared_item_SM.update_state_single_item(self.session, share_item, new_state)
-
-                try:
-
-                    self.check_share_item_exists_on_glue_catalog(share_item, table)
-
-                    data = self.build_share_data(table)
-                    self.share_table_with_target_account(**data)
+        shared_db_name = self.build_shared_db_name()
+        principals = self.get_share_principals()
 
-                    (
-                        retry_share_table,
-                        failed_invitations,
-                    ) = RamClient.accept_ram_invitation(**data)
+        self.create_shared_database(
+            self.target_environment, self.dataset, shared_db_name, principals
+        )
 
-                    if retry_share_table:
-                        self.share_table_with_target_account(**data)
-                        RamClient.accept_ram_invitation(**data)
+        items = self.find_share_items(self.shared_tables)
+        in_progress = self.update_items_state(
+            [share_item for _, share_item in items],
+            ShareItemStatus.Share_Approved.value,
+            ShareObjectActions.Start.value,
+        )
+        share_items = {table.tableUri: share_item for table, share_item in items}
+        tables = [table for table, _ in items]
 
-                    self.create_resource_link(**data)
+        def check_table(table):
+            log.info(f"Sharing table {table.GlueTableName}...")
+            self.check_share_item_exists_on_glue_catalog(share_items[table.tableUri], table)
 
-                    new_state = shared_item_SM.run_transition(ShareItemActions.Success.value)
-                    shared_item_SM.update_state_single_item(self.session, share_item, new_state)
+        def create_resource_link(table):
+            self.create_resource_link(**self.build_share_data(table))
 
-                except Exception as e:
-                    # must run first to ensure state transitions to failed
-                    new_state = shared_item_SM.run_transition(ShareItemActions.Failure.value)
-                    shared_item_SM.update_state_single_item(self.session, share_item, new_state)
-                    success = False
+        errors = self.run_concurrently(check_table, tables)
+        self.share_tables_with_target_account([t for t in tables if t.tableUri not in errors])
+        retry_tables = self.accept_ram_invitations([t for t in tables if t.tableUri not in errors], errors)
+        if retry_tables:
+            self.share_tables_with_target_account(retry_tables)
+            self.accept_ram_invitations([t for t in retry_tables if t.tableUri not in errors], errors)
 
-                    # statements which can throw exceptions but are not critical
-                    self.handle_share_failure(table=table, share_item=share_item, error=e)
+        errors.update(self.run_concurrently(create_resource_link, [t for t in tables if t.tableUri not in errors]))
+        return self.complete_items(items, in_progress, errors, self.handle_share_failure)
 
-        return success
+    def accept_ram_invitations(self, tables: [DatasetTable], errors: dict) -> [DatasetTable]:
+        """
+        Accepts the RAM invitations of the tables in one pass, returns the tables to share again.
+        If the invitations can't be processed, the error is recorded for all tables
+        """
+        if not tables:
+            return []
+        data = self.build_share_data(tables[0])
+        try:
+            retry_names = RamClient.accept_ram_invitations(
+                data['source'], data['target'], [table.GlueTableName for table in tables]
+            )
+        except Exception as e:
+            errors.update({table.tableUri: e for table in tables})
+            return []
+        return [table for table in tables if table.GlueTableName in retry_names]
 
     def process_revoked_shares(self) -> bool:
         """
-        For each revoked request item:
-            a) update its status to REVOKE_IN_PROGRESS with Action Start
-            b) check if item exists on glue catalog raise error if not and flag item status to failed
-            c) revoke table resource link: undo grant permission to resource link table for team role in target account
-            d) revoke source table access: undo grant permission to table for team role in source account (and for QS Group if no other shares present for table)
-            e) delete resource link table
-            h) update share item status to REVOKE_SUCCESSFUL with Action Success
+        1) Update the status of the revoked tables to REVOKE_IN_PROGRESS with Action Start
+        2) For each revoked table, concurrently:
+            a) check if item exists on glue catalog raise error if not and flag item status to failed
+            b) revoke table resource link: undo grant permission to resource link table for team role in target account
+            c) revoke source table access: undo grant permission to table for team role in source account (and for QS Group if no other shares present for table)
+            d) delete resource link table
+            e) revoke the external account access to the table if no other shares present for table
+        3) Update the status of the succeeded tables to REVOKE_SUCCESSFUL with Action Success
+           and of the failed tables to REVOKE_FAILED with Action Failure
 
         Returns
         -------
@@ -139,54 +137,46 @@ class ProcessLFCrossAccountShare(LFShareManager):
         log.info(
             '##### Starting Revoking tables cross account #######'
         )
-        success = True
         shared_db_name = self.build_shared_db_name()
         principals = self.get_share_principals()
-        for table in self.revoked_tables:
-            share_item = ShareObjectRepository.find_sharable_item(
-                self.session, self.share.shareUri, table.tableUri
-            )
-
-            revoked_item_SM = ShareItemSM(ShareItemStatus.Revoke_Approved.value)
-            new_state = revoked_item_SM.run_transition(ShareObjectActions.Start.value)
-            revoked_item_SM.update_state_single_item(self.session, share_item, new_state)
-
-            try:
-
-                self.check_share_item_exists_on_glue_catalog(share_item, table)
 
-                log.info(f'Starting revoke access for table: {table.GlueTableName} in database {shared_db_name} '
-                         f'For principals {principals}')
-
-                self.revoke_table_resource_link_access(table, principals)
-
-                other_table_shares_in_env = False
-                if ShareObjectRepository.other_approved_share_item_table_exists(
+        items = self.find_share_items(self.revoked_tables)
+        in_progress = self.update_items_state(
+            [share_item for _, share_item in items],
+            ShareItemStatus.Revoke_Approved.value,
+            ShareObjectActions.Start.value,
+        )
+        share_items = {table.tableUri: share_item for table, share_item in items}
+        other_table_shares_in_env = {
+            table.tableUri: bool(
+                ShareObjectRepository.other_approved_share_item_table_exists(
                     self.session,
                     self.target_environment.environmentUri,
                     share_item.itemUri,
                     share_item.shareItemUri
-                ):
-                    other_table_shares_in_env = True
-                    principals = [p for p in principals if "arn:aws:quicksight" not in p]
+                )
+            )
+            for table, share_item in items
+        }
+
+        def revoke_table(table):
+            self.check_share_item_exists_on_glue_catalog(share_items[table.tableUri], table)
 
-                self.revoke_source_table_access(table, principals)
+            log.info(f'Starting revoke access for table: {table.GlueTableName} in database {shared_db_name} '
+                     f'For principals {principals}')
 
-                self.delete_resource_link_table(table)
+            self.revoke_table_resource_link_access(table, principals)
 
-                if not other_table_shares_in_env:
-                    self.revoke_external_account_access_on_source_account(table.GlueDatabaseName, table.GlueTableName)
+            table_principals = principals
+            if other_table_shares_in_env[table.tableUri]:
+                table_principals = [p for p in principals if "arn:aws:quicksight" not in p]
 
-                new_state = revoked_item_SM.run_transition(ShareItemActions.Success.value)
-                revoked_item_SM.update_state_single_item(self.session, share_item, new_state)
+            self.revoke_source_table_access(table, table_principals)
 
-            except Exception as e:
-                # must run first to ensure state transitions to failed
-                new_state = revoked_item_SM.run_transition(ShareItemActions.Failure.value)
-                revoked_item_SM.update_state_single_item(self.session, share_item, new_state)
-                success = False
+            self.delete_resource_link_table(table)
 
-                # statements which can throw exceptions but are not critical
-                self.handle_revoke_failure(share_item=share_item, table=table, error=e)
+            if not other_table_shares_in_env[table.tableUri]:
+                self.revoke_external_account_access_on_source_account(table.GlueDatabaseName, table.GlueTableName)
 
-        return success
+        errors = self.run_concurrently(revoke_table, [table for table, _ in items])
+        return self.complete_items(items, in_progress, errors, self.handle_revoke_failure)
@@ -1,9 +1,8 @@
 import logging
 
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
-from dataall.modules.dataset_sharing.db.enums import ShareItemStatus, ShareObjectActions, ShareItemActions
+from dataall.modules.dataset_sharing.db.enums import ShareItemStatus, ShareObjectActions
 from dataall.modules.dataset_sharing.db.share_object_models import ShareObject
-from dataall.modules.dataset_sharing.db.share_object_repositories import ShareObjectRepository, ShareItemSM
 from ..share_managers import LFShareManager
 from dataall.modules.datasets_base.db.dataset_models import DatasetTable, Dataset
 
@@ -38,13 +37,14 @@ class ProcessLFSameAccountShare(LFShareManager):
         1) Grant ALL permissions to pivotRole for source database in source account
         2) Get share principals (requester IAM role and QS groups) and build shared db name
         3) Create the shared database in target account if it doesn't exist
-        4) For each shared table:
-            a) update its status to SHARE_IN_PROGRESS with Action Start
-            b) check if share item exists on glue catalog raise error if not and flag share item status to failed
-            c) create resource link in account
-            d) grant permission to table for requester team IAM role in account
-            e) grant permission to resource link table for requester team IAM role in account
-            f) update share item status to SHARE_SUCCESSFUL with Action Success
+        4) Update the status of the shared tables to SHARE_IN_PROGRESS with Action Start
+        5) For each shared table, concurrently:
+            a) check if share item exists on glue catalog raise error if not and flag share item status to failed
+            b) create resource link in account
+            c) grant permission to table for requester team IAM role in account
+            d) grant permission to resource link table for requester team IAM role in account
+        6) Update the status of the succeeded tables to SHARE_SUCCESSFUL with Action Success
+           and of the failed tables to SHARE_FAILED with Action Failure
 
         Returns
         -------
@@ -54,112 +54,75 @@ class ProcessLFSameAccountShare(LFShareManager):
             '##### Starting Sharing tables same account #######'
         )
 
-        success = True
         if not self.shared_tables:
             log.info("No tables to share. Skipping...")
+            return True
 
-        else:
-            self.grant_pivot_role_all_database_permissions()
+        self.grant_pivot_role_all_database_permissions()
 
-            shared_db_name = self.build_shared_db_name()
-            principals = self.get_share_principals()
-
-            self.create_shared_database(
-                self.target_environment, self.dataset, shared_db_name, principals
-            )
-
-        for table in self.shared_tables:
-
-            share_item = ShareObjectRepository.find_sharable_item(
-                self.session, self.share.shareUri, table.tableUri
-            )
-
-            if not share_item:
-                log.info(
-                    f'Share Item not found for {self.share.shareUri} '
-                    f'and Dataset Table {table.GlueTableName} continuing loop...'
-                )
-                continue
-            shared_item_SM = ShareItemSM(ShareItemStatus.Share_Approved.value)
-            new_state = shared_item_SM.run_transition(ShareObjectActions.Start.value)
-            shared_item_SM.update_state_single_item(self.session, share_item, new_state)
-
-            try:
-                log.info(f'Starting sharing access for table: {table.GlueTableName}')
-                self.check_share_item_exists_on_glue_catalog(share_item, table)
+        shared_db_name = self.build_shared_db_name()
+        principals = self.get_share_principals()
 
-                data = self.build_share_data(table)
-                self.create_resource_link(**data)
+        self.create_shared_database(
+            self.target_environment, self.dataset, shared_db_name, principals
+        )
 
-                new_state = shared_item_SM.run_transition(ShareItemActions.Success.value)
-                shared_item_SM.update_state_single_item(self.session, share_item, new_state)
+        items = self.find_share_items(self.shared_tables)
+        in_progress = self.update_items_state(
+            [share_item for _, share_item in items],
+            ShareItemStatus.Share_Approved.value,
+            ShareObjectActions.Start.value,
+        )
+        share_items = {table.tableUri: share_item for table, share_item in items}
 
-            except Exception as e:
-                # must run first to ensure state transitions to failed
-                new_state = shared_item_SM.run_transition(ShareItemActions.Failure.value)
-                shared_item_SM.update_state_single_item(self.session, share_item, new_state)
-                success = False
+        def share_table(table):
+            log.info(f'Starting sharing access for table: {table.GlueTableName}')
+            self.check_share_item_exists_on_glue_catalog(share_items[table.tableUri], table)
 
-                # statements which can throw exceptions but are not critical
-                self.handle_share_failure(table, share_item, e)
+            data = self.build_share_data(table)
+            self.create_resource_link(**data)
 
-        return success
+        errors = self.run_concurrently(share_table, [table for table, _ in items])
+        return self.complete_items(items, in_progress, errors, self.handle_share_failure)
 
     def process_revoked_shares(self) -> bool:
         """
-        For each revoked request item:
-            a) update its status to REVOKE_IN_PROGRESS with Action Start
-            b) check if item exists on glue catalog raise error if not and flag item status to failed
-            c) revoke table resource link: undo grant permission to resource link table for team role in account
-            d) revoke source table access: undo grant permission to table for team role in account
-            e) delete resource link table
-            h) update share item status to REVOKE_SUCCESSFUL with Action Success
+        1) Update the status of the revoked tables to REVOKE_IN_PROGRESS with Action Start
+        2) For each revoked table, concurrently:
+            a) check if item exists on glue catalog raise error if not and flag item status to failed
+            b) revoke table resource link: undo grant permission to resource link table for team role in account
+            c) revoke source table access: undo grant permission to table for team role in account
+            d) delete resource link table
+        3) Update the status of the succeeded tables to REVOKE_SUCCESSFUL with Action Success
+           and of the failed tables to REVOKE_FAILED with Action Failure
 
         Returns
         -------
         True if share is revoked successfully
         False if revoke fails
         """
-        success = True
         shared_db_name = self.build_shared_db_name()
         principals = self.get_share_principals()
-        for table in self.revoked_tables:
-            share_item = ShareObjectRepository.find_sharable_item(
-                self.session, self.share.shareUri, table.tableUri
-            )
-            if not share_item:
-                log.info(
-                    f'Share Item not found for {self.share.shareUri} '
-                    f'and Dataset Table {table.GlueTableName} continuing loop...'
-                )
-                continue
-
-            revoked_item_SM = ShareItemSM(ShareItemStatus.Revoke_Approved.value)
-            new_state = revoked_item_SM.run_transition(ShareObjectActions.Start.value)
-            revoked_item_SM.update_state_single_item(self.session, share_item, new_state)
 
-            try:
-                self.check_share_item_exists_on_glue_catalog(share_item, table)
-
-                log.info(f'Starting revoke access for table: {table.GlueTableName} in database {shared_db_name} '
-                         f'For principals {principals}')
-
-                self.revoke_table_resource_link_access(table, principals)
+        items = self.find_share_items(self.revoked_tables)
+        in_progress = self.update_items_state(
+            [share_item for _, share_item in items],
+            ShareItemStatus.Revoke_Approved.value,
+            ShareObjectActions.Start.value,
+        )
+        share_items = {table.tableUri: share_item for table, share_item in items}
 
-                self.revoke_source_table_access(table, principals)
+        def revoke_table(table):
+            self.check_share_item_exists_on_glue_catalog(share_items[table.tableUri], table)
 
-                self.delete_resource_link_table(table)
+            log.info(f'Starting revoke access for table: {table.GlueTableName} in database {shared_db_name} '
+                     f'For principals {principals}')
 
-                new_state = revoked_item_SM.run_transition(ShareItemActions.Success.value)
-                revoked_item_SM.update_state_single_item(self.session, share_item, new_state)
+            self.revoke_table_resource_link_access(table, principals)
 
-            except Exception as e:
-                # must run first to ensure state transitions to failed
-                new_state = revoked_item_SM.run_transition(ShareItemActions.Failure.value)
-                revoked_item_SM.update_state_single_item(self.session, share_item, new_state)
-                success = False
+            self.revoke_source_table_access(table, principals)
 
-                # statements which can throw exceptions but are not critical
-                self.handle_revoke_failure(share_item, table, e)
+            self.delete_resource_link_table(table)
 
-        return success
+        errors = self.run_concurrently(revoke_table, [table for table, _ in items])
+        return self.complete_items(items, in_progress, errors, self.handle_revoke_failure)
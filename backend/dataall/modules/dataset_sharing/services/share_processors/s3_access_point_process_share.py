@@ -2,6 +2,7 @@ import logging
 
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
 from dataall.modules.dataset_sharing.services.share_managers import S3AccessPointShareManager
+from dataall.modules.dataset_sharing.services.share_managers.policy_document_manager import PolicyDocumentManager
 from dataall.modules.datasets_base.db.dataset_models import DatasetStorageLocation, Dataset
 from dataall.modules.dataset_sharing.db.enums import ShareItemStatus, ShareObjectActions, ShareItemActions
 from dataall.modules.dataset_sharing.db.share_object_models import ShareObject
@@ -21,8 +22,8 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
         target_environment: Environment,
         source_env_group: EnvironmentGroup,
         env_group: EnvironmentGroup,
-        existing_shared_buckets: bool = False
-
+        existing_shared_buckets: bool = False,
+        policy_documents: PolicyDocumentManager = None,
     ):
 
         super().__init__(
@@ -34,6 +35,7 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
             target_environment,
             source_env_group,
             env_group,
+            policy_documents=policy_documents,
         )
 
     @classmethod
@@ -54,7 +56,8 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
         3) grant_target_role_access_policy
         4) manage_access_point_and_policy
         5) update_dataset_bucket_key_policy
-        6) update_share_item_status with Finish action
+        6) writes the bucket, access point and key policies edited by all folders once
+        7) update_share_item_status with Finish action
 
         Returns
         -------
@@ -64,6 +67,8 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
             '##### Starting Sharing folders #######'
         )
         success = True
+        policy_documents = PolicyDocumentManager()
+        pending = []
         for folder in share_folders:
             log.info(f'sharing folder: {folder}')
             sharing_item = ShareObjectRepository.find_sharable_item(
@@ -84,6 +89,7 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
                 target_environment,
                 source_env_group,
                 env_group,
+                policy_documents=policy_documents,
             )
 
             try:
@@ -92,9 +98,7 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
                 sharing_folder.manage_access_point_and_policy()
                 if not dataset.imported or dataset.importedKmsKey:
                     sharing_folder.update_dataset_bucket_key_policy()
-
-                new_state = shared_item_SM.run_transition(ShareItemActions.Success.value)
-                shared_item_SM.update_state_single_item(session, sharing_item, new_state)
+                pending.append((sharing_folder, sharing_item, shared_item_SM))
 
             except Exception as e:
                 # must run first to ensure state transitions to failed
@@ -105,7 +109,7 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
                 # statements which can throw exceptions but are not critical
                 sharing_folder.handle_share_failure(e)
 
-        return success
+        return cls._complete_folders(session, policy_documents, pending, success, cls.handle_share_failure)
 
     @classmethod
     def process_revoked_shares(
@@ -122,7 +126,8 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
         """
         1) update_share_item_status with Start action
         2) delete_access_point_policy for folder
-        3) update_share_item_status with Finish action
+        3) writes the access point policy edited by all folders once
+        4) update_share_item_status with Finish action
 
         Returns
         -------
@@ -133,6 +138,8 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
             '##### Starting Revoking folders #######'
         )
         success = True
+        policy_documents = PolicyDocumentManager()
+        pending = []
         for folder in revoke_folders:
             log.info(f'revoking access to folder: {folder}')
             removing_item = ShareObjectRepository.find_sharable_item(
@@ -154,13 +161,12 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
                 target_environment,
                 source_env_group,
                 env_group,
+                policy_documents=policy_documents,
             )
 
             try:
                 removing_folder.delete_access_point_policy()
-
-                new_state = revoked_item_SM.run_transition(ShareItemActions.Success.value)
-                revoked_item_SM.update_state_single_item(session, removing_item, new_state)
+                pending.append((removing_folder, removing_item, revoked_item_SM))
 
             except Exception as e:
                 # must run first to ensure state transitions to failed
@@ -171,6 +177,31 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
                 # statements which can throw exceptions but are not critical
                 removing_folder.handle_revoke_failure(e)
 
+        return cls._complete_folders(session, policy_documents, pending, success, cls.handle_revoke_failure)
+
+    @staticmethod
+    def _complete_folders(
+        session, policy_documents: PolicyDocumentManager, pending, success: bool, handle_failure
+    ) -> bool:
+        """
+        Writes the policies edited by the folders, then transitions every folder to succeeded,
+        or to failed if one of the policies it edited could not be written
+        """
+        errors = policy_documents.flush()
+        for folder, share_item, item_SM in pending:
+            error = next((errors[name] for name in folder.edited_policies if name in errors), None)
+            if error is None:
+                new_state = item_SM.run_transition(ShareItemActions.Success.value)
+                item_SM.update_state_single_item(session, share_item, new_state)
+                continue
+
+            # must run first to ensure state transitions to failed
+            new_state = item_SM.run_transition(ShareItemActions.Failure.value)
+            item_SM.update_state_single_item(session, share_item, new_state)
+            success = False
+
+            # statements which can throw exceptions but are not critical
+            handle_failure(folder, error)
         return success
 
     @classmethod
@@ -1,5 +1,6 @@
 from dataall.modules.datasets.api.dataset import (
     input_types,
+    loaders,
     mutations,
     queries,
     resolvers,
@@ -7,4 +8,4 @@ from dataall.modules.datasets.api.dataset import (
     enums
 )
 
-__all__ = ['resolvers', 'types', 'input_types', 'queries', 'mutations', 'enums']
+__all__ = ['resolvers', 'types', 'input_types', 'loaders', 'queries', 'mutations', 'enums']
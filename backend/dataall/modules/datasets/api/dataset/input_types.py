@@ -1,5 +1,5 @@
 from dataall.base.api import gql
-from dataall.base.api.constants import SortDirection
+from dataall.base.api.constants import CountMode, SortDirection
 from dataall.modules.datasets.api.dataset.enums import DatasetSortField
 
 
@@ -65,6 +65,8 @@ DatasetFilter = gql.InputType(
         gql.Argument('sort', gql.ArrayType(DatasetSortCriteria)),
         gql.Argument('page', gql.Integer),
         gql.Argument('pageSize', gql.Integer),
+        gql.Argument('after', gql.String),
+        gql.Argument('countMode', CountMode.toGraphQLEnum()),
     ],
 )
 
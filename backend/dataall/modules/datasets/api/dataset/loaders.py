@@ -0,0 +1,29 @@
+from dataall.base.api.dataloader import DataLoaderDefinition, DataLoaderRegistry
+from dataall.base.context import get_context
+from dataall.core.environment.api.loaders import ENVIRONMENT_LOADER
+from dataall.core.organizations.api.loaders import ORGANIZATION_LOADER
+from dataall.core.stacks.api.loaders import STACK_LOADER
+from dataall.modules.dataset_sharing.db.share_object_repositories import ShareObjectRepository
+from dataall.modules.datasets_base.db.dataset_models import Dataset
+
+DATASET_USER_SHARE_LOADER = 'DatasetUserShare'
+
+
+def _load_user_shares(session, dataset_uris):
+    """Finds a share of every dataset that is owned by the current user or requested for one of the user's groups"""
+    context = get_context()
+    shares = ShareObjectRepository.find_user_shares_of_datasets(
+        session, dataset_uris, context.username, context.groups
+    )
+    return {share.datasetUri: share for share in shares}
+
+
+DataLoaderRegistry.register(DataLoaderDefinition(
+    name=DATASET_USER_SHARE_LOADER,
+    batch_load_fn=_load_user_shares,
+    sources={Dataset: 'datasetUri'},
+))
+
+DataLoaderRegistry.add_source(ENVIRONMENT_LOADER, Dataset, 'environmentUri')
+DataLoaderRegistry.add_source(ORGANIZATION_LOADER, Dataset, 'organizationUri')
+DataLoaderRegistry.add_source(STACK_LOADER, Dataset, 'datasetUri')
@@ -4,10 +4,10 @@ from dataall.core.stacks.api import stack_helper
 from dataall.base.api.context import Context
 from dataall.base.feature_toggle_checker import is_feature_enabled
 from dataall.modules.catalog.db.glossary_repositories import GlossaryRepository
-from dataall.core.environment.services.environment_service import EnvironmentService
-from dataall.core.organizations.db.organization_repositories import Organization
-from dataall.base.db.exceptions import RequiredParameter, InvalidInput
-from dataall.modules.dataset_sharing.db.share_object_models import ShareObject
+from dataall.core.environment.api.loaders import ENVIRONMENT_LOADER
+from dataall.core.organizations.api.loaders import ORGANIZATION_LOADER
+from dataall.base.db.exceptions import RequiredParameter, InvalidInput, ObjectNotFound
+from dataall.modules.datasets.api.dataset.loaders import DATASET_USER_SHARE_LOADER
 from dataall.modules.datasets_base.db.dataset_models import Dataset
 from dataall.modules.datasets.api.dataset.enums import DatasetRole
 from dataall.modules.datasets.services.dataset_service import DatasetService
@@ -44,17 +44,8 @@ def resolve_user_role(context: Context, source: Dataset, **kwargs):
         return DatasetRole.Admin.value
     elif source.stewards in context.groups:
         return DatasetRole.DataSteward.value
-    else:
-        with context.engine.scoped_session() as session:
-            share = (
-                session.query(ShareObject)
-                .filter(ShareObject.datasetUri == source.datasetUri)
-                .first()
-            )
-            if share and (
-                share.owner == context.username or share.principalId in context.groups
-            ):
-                return DatasetRole.Shared.value
+    elif context.loaders.get(DATASET_USER_SHARE_LOADER).load(source.datasetUri):
+        return DatasetRole.Shared.value
     return DatasetRole.NoPermission.value
 
 
@@ -96,15 +87,19 @@ def list_tables(context, source: Dataset, filter: dict = None):
 def get_dataset_organization(context, source: Dataset, **kwargs):
     if not source:
         return None
-    with context.engine.scoped_session() as session:
-        return Organization.get_organization_by_uri(session, source.organizationUri)
+    organization = context.loaders.get(ORGANIZATION_LOADER).load(source.organizationUri)
+    if not organization:
+        raise ObjectNotFound('Organization', source.organizationUri)
+    return organization
 
 
 def get_dataset_environment(context, source: Dataset, **kwargs):
     if not source:
         return None
-    with context.engine.scoped_session() as session:
-        return EnvironmentService.get_environment_by_uri(session, source.environmentUri)
+    environment = context.loaders.get(ENVIRONMENT_LOADER).load(source.environmentUri)
+    if not environment:
+        raise ObjectNotFound('Environment', source.environmentUri)
+    return environment
 
 
 def get_dataset_owners_group(context, source: Dataset, **kwargs):
@@ -158,6 +153,7 @@ def get_dataset_stack(context: Context, source: Dataset, **kwargs):
     return stack_helper.get_stack_with_cfn_resources(
         targetUri=source.datasetUri,
         environmentUri=source.environmentUri,
+        loaders=context.loaders,
     )
 
 
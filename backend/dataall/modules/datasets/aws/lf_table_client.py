@@ -2,6 +2,7 @@ import logging
 from botocore.exceptions import ClientError
 
 from dataall.base.aws.sts import SessionHelper
+from dataall.modules.dataset_sharing.aws.lakeformation_client import LakeFormationBatch
 from dataall.modules.datasets_base.db.dataset_models import DatasetTable
 
 log = logging.getLogger(__name__)
@@ -25,19 +26,32 @@ class LakeFormationTableClient:
         principal = SessionHelper.get_delegation_role_arn(table.AWSAccountId)
         self._grant_permissions_to_table(principal, ['SELECT', 'ALTER', 'DROP', 'INSERT'])
 
-    def grant_principals_all_table_permissions(self, principals: [str]):
+    @staticmethod
+    def grant_principals_all_tables_permissions(tables: [DatasetTable], principals: [str], aws_session=None):
         """
-        Update the table permissions on Lake Formation
-        for tables managed by data.all
-        :param principals:
-        :return:
+        Grants ALL permissions on the tables to the principals with batches of requests.
+        The tables must be in the same account and region. Returns the errors by table URI
         """
-
-        for principal in principals:
-            try:
-                self._grant_permissions_to_table(principal, ['ALL'])
-            except ClientError:
-                pass  # ignore the error to continue with other requests
+        if not tables:
+            return {}
+        account_id, region = tables[0].AWSAccountId, tables[0].region
+        if not aws_session:
+            aws_session = SessionHelper.remote_session(account_id)
+        batch = LakeFormationBatch(aws_session.client('lakeformation', region_name=region))
+        for table in tables:
+            for principal in principals:
+                batch.grant(
+                    principal,
+                    {'Table': {'DatabaseName': table.GlueDatabaseName, 'Name': table.name}},
+                    ['ALL'],
+                    key=table.tableUri,
+                )
+        errors = LakeFormationBatch.errors_by_key(batch.execute())
+        log.info(
+            f'Granted principals {principals} all permissions on {len(tables) - len(errors)} tables '
+            f'of aws://{account_id}/{region}, failed tables: {list(errors)}'
+        )
+        return errors
 
     def _grant_permissions_to_table(self, principal, permissions):
         table = self._table
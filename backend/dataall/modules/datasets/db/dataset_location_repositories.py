@@ -1,6 +1,6 @@
 import logging
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, func
 
 from dataall.base.db import paginate, exceptions
 from dataall.modules.datasets_base.db.dataset_models import DatasetStorageLocation, Dataset
@@ -104,6 +104,26 @@ class DatasetLocationRepository:
             .count()
         )
 
+    @staticmethod
+    def count_locations_by_datasets(session, dataset_uris) -> dict:
+        """Returns the number of folders of each dataset, datasets without folders are omitted"""
+        if not dataset_uris:
+            return {}
+        rows = (
+            session.query(DatasetStorageLocation.datasetUri, func.count(DatasetStorageLocation.locationUri))
+            .filter(DatasetStorageLocation.datasetUri.in_(dataset_uris))
+            .group_by(DatasetStorageLocation.datasetUri)
+        )
+        return {dataset_uri: count for dataset_uri, count in rows}
+
+    @staticmethod
+    def find_locations_changed_since(session, since, location_uris=None):
+        """Returns folders created or updated after the given time and the folders with the given URIs"""
+        changed = or_(DatasetStorageLocation.created > since, DatasetStorageLocation.updated > since)
+        if location_uris:
+            changed = or_(changed, DatasetStorageLocation.locationUri.in_(location_uris))
+        return session.query(DatasetStorageLocation).filter(changed).all()
+
     @staticmethod
     def delete_dataset_locations(session, dataset_uri) -> bool:
         locations = (
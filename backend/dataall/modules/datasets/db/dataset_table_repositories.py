@@ -1,3 +1,5 @@
+import hashlib
+import json
 import logging
 from datetime import datetime
 
@@ -33,6 +35,7 @@ class DatasetTableRepository:
             S3Prefix=table.get('StorageDescriptor', {}).get('Location'),
             GlueTableName=table['Name'],
             LastGlueTableStatus='InSync',
+            LastGlueTableUpdateTime=table.get('UpdateTime'),
             GlueTableProperties=json_utils.to_json(
                 table.get('Parameters', {})
             ),
@@ -96,6 +99,23 @@ class DatasetTableRepository:
                     f'Table {existing_table.GlueTableName} status set to Deleted from Glue.'
                 )
 
+    @staticmethod
+    def is_in_sync(existing_tables, glue_tables) -> bool:
+        """
+        True if the active tables of the dataset are exactly the Glue tables and no Glue table was updated
+        since it was last synced. Tables without a Glue UpdateTime are always considered changed
+        """
+        active_tables = {
+            table.GlueTableName: table for table in existing_tables if table.LastGlueTableStatus != 'Deleted'
+        }
+        if set(active_tables) != {table['Name'] for table in glue_tables}:
+            return False
+        return all(
+            table.get('UpdateTime') is not None
+            and table['UpdateTime'] == active_tables[table['Name']].LastGlueTableUpdateTime
+            for table in glue_tables
+        )
+
     @staticmethod
     def find_all_active_tables(session, dataset_uri):
         return (
@@ -109,6 +129,14 @@ class DatasetTableRepository:
             .all()
         )
 
+    @staticmethod
+    def find_tables_changed_since(session, since, table_uris=None):
+        """Returns tables created or updated after the given time and the tables with the given URIs"""
+        changed = or_(DatasetTable.created > since, DatasetTable.updated > since)
+        if table_uris:
+            changed = or_(changed, DatasetTable.tableUri.in_(table_uris))
+        return session.query(DatasetTable).filter(changed).all()
+
     @staticmethod
     def find_all_deleted_tables(session, dataset_uri):
         return (
@@ -124,9 +152,11 @@ class DatasetTableRepository:
 
     @staticmethod
     def sync_table_columns(session, dataset_table, glue_table):
-
-        DatasetTableRepository.delete_all_table_columns(session, dataset_table)
-
+        """
+        Applies the differences between the Glue columns and partitions of the table and the saved columns,
+        matched by (name, columnType). Matched columns keep their URI, description is replaced only by a
+        non-empty Glue comment. Nothing is done if the Glue columns didn't change since the last sync
+        """
         columns = [
             {**item, **{'columnType': 'column'}}
             for item in glue_table.get('StorageDescriptor', {}).get('Columns', [])
@@ -139,22 +169,69 @@ class DatasetTableRepository:
         logger.debug(f'Found columns {columns} for table {dataset_table}')
         logger.debug(f'Found partitions {partitions} for table {dataset_table}')
 
+        columns_hash = DatasetTableRepository._columns_hash(columns + partitions)
+        if dataset_table.LastGlueColumnsHash == columns_hash:
+            logger.debug(f'Columns of table {dataset_table.GlueTableName} did not change since the last sync')
+            return
+
+        existing = {
+            (column.name, column.columnType): column
+            for column in session.query(
+                DatasetTableColumn.columnUri,
+                DatasetTableColumn.name,
+                DatasetTableColumn.columnType,
+                DatasetTableColumn.typeName,
+                DatasetTableColumn.description,
+            ).filter(DatasetTableColumn.tableUri == dataset_table.tableUri)
+        }
+
+        inserts, updates = [], []
         for col in columns + partitions:
-            table_col = DatasetTableColumn(
-                name=col['Name'],
-                description=col.get('Comment', 'No description provided'),
-                label=col['Name'],
-                owner=dataset_table.owner,
-                datasetUri=dataset_table.datasetUri,
-                tableUri=dataset_table.tableUri,
-                AWSAccountId=dataset_table.AWSAccountId,
-                GlueDatabaseName=dataset_table.GlueDatabaseName,
-                GlueTableName=dataset_table.GlueTableName,
-                region=dataset_table.region,
-                typeName=col['Type'],
-                columnType=col['columnType'],
+            current = existing.pop((col['Name'], col['columnType']), None)
+            if not current:
+                inserts.append(
+                    dict(
+                        name=col['Name'],
+                        description=col.get('Comment', 'No description provided'),
+                        label=col['Name'],
+                        owner=dataset_table.owner,
+                        datasetUri=dataset_table.datasetUri,
+                        tableUri=dataset_table.tableUri,
+                        AWSAccountId=dataset_table.AWSAccountId,
+                        GlueDatabaseName=dataset_table.GlueDatabaseName,
+                        GlueTableName=dataset_table.GlueTableName,
+                        region=dataset_table.region,
+                        typeName=col['Type'],
+                        columnType=col['columnType'],
+                    )
+                )
+                continue
+            description = col.get('Comment') or current.description
+            if current.typeName != col['Type'] or current.description != description:
+                updates.append(dict(columnUri=current.columnUri, typeName=col['Type'], description=description))
+        deletes = [column.columnUri for column in existing.values()]
+
+        logger.info(
+            f'Syncing columns of table {dataset_table.GlueTableName}: '
+            f'{len(inserts)} new, {len(updates)} updated, {len(deletes)} deleted'
+        )
+        if deletes:
+            session.query(DatasetTableColumn).filter(DatasetTableColumn.columnUri.in_(deletes)).delete(
+                synchronize_session=False
             )
-            session.add(table_col)
+        if updates:
+            session.bulk_update_mappings(DatasetTableColumn, updates)
+        if inserts:
+            session.bulk_insert_mappings(DatasetTableColumn, inserts)
+        dataset_table.LastGlueColumnsHash = columns_hash
+
+    @staticmethod
+    def _columns_hash(columns) -> str:
+        return hashlib.sha256(
+            json.dumps(
+                [(col['Name'], col['Type'], col['columnType'], col.get('Comment')) for col in columns]
+            ).encode('utf-8')
+        ).hexdigest()
 
     @staticmethod
     def delete_all_table_columns(session, dataset_table):
@@ -1,10 +1,20 @@
+"""Contains dataset related indexers for OpenSearch"""
 import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Optional
 
+from dataall.modules.catalog.db.glossary_repositories import GlossaryRepository
+from dataall.modules.catalog.indexers.base_indexer import BulkIndexWriter
+from dataall.modules.datasets.db.dataset_location_repositories import DatasetLocationRepository
+from dataall.modules.datasets.db.dataset_table_repositories import DatasetTableRepository
+from dataall.modules.datasets.indexers.dataset_indexer import DatasetIndexer, DatasetIndexContext
 from dataall.modules.datasets.indexers.location_indexer import DatasetLocationIndexer
 from dataall.modules.datasets.indexers.table_indexer import DatasetTableIndexer
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetRepository
 from dataall.modules.datasets_base.db.dataset_models import Dataset
-from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
+from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer, IndexingResult
+from dataall.modules.vote.db.vote_repositories import VoteRepository
 
 log = logging.getLogger(__name__)
 
@@ -15,12 +25,72 @@ class DatasetCatalogIndexer(CatalogIndexer):
        Register automatically itself when CatalogIndexer instance is created
     """
 
-    def index(self, session) -> int:
+    def index(self, session, since: Optional[datetime] = None) -> IndexingResult:
+        if since is None:
+            return self._index_all(session)
+        return self._index_changes(session, since)
+
+    @staticmethod
+    def _index_all(session) -> IndexingResult:
         all_datasets: [Dataset] = DatasetRepository.list_all_active_datasets(session)
         log.info(f'Found {len(all_datasets)} datasets')
+        context = DatasetIndexContext.load(session, all_datasets)
         indexed = 0
-        for dataset in all_datasets:
-            tables = DatasetTableIndexer.upsert_all(session, dataset.datasetUri)
-            folders = DatasetLocationIndexer.upsert_all(session, dataset_uri=dataset.datasetUri)
-            indexed += len(tables) + len(folders) + 1
-        return indexed
+        with BulkIndexWriter() as writer:
+            for dataset in all_datasets:
+                tables = DatasetTableRepository.find_all_active_tables(session, dataset.datasetUri)
+                folders = DatasetLocationRepository.get_dataset_folders(session, dataset.datasetUri)
+                DatasetTableIndexer.index(writer, dataset, tables, context)
+                DatasetLocationIndexer.index(writer, dataset, folders, context)
+                DatasetIndexer.index(writer, dataset, context)
+                indexed += len(tables) + len(folders) + 1
+        return IndexingResult(indexed, writer.failed)
+
+    @staticmethod
+    def _index_changes(session, since: datetime) -> IndexingResult:
+        """
+        Indexes datasets, tables and folders changed after `since`. Changes of a dataset are propagated
+        to all its tables and folders, since their documents contain fields of the dataset.
+        A new term link or an upvote of a target counts as a change of the target
+        """
+        linked = GlossaryRepository.find_targets_linked_since(session, since)
+        voted = VoteRepository.find_targets_voted_since(session, since, target_type='dataset')
+        changed_datasets = {dataset.datasetUri for dataset in DatasetRepository.find_datasets_changed_since(session, since)}
+
+        tables = defaultdict(list)
+        deleted_tables = []
+        for table in DatasetTableRepository.find_tables_changed_since(session, since, table_uris=list(linked)):
+            if table.LastGlueTableStatus == 'Deleted':
+                deleted_tables.append(table)
+            else:
+                tables[table.datasetUri].append(table)
+
+        folders = defaultdict(list)
+        for folder in DatasetLocationRepository.find_locations_changed_since(session, since, location_uris=list(linked)):
+            folders[folder.datasetUri].append(folder)
+
+        for dataset_uri in changed_datasets:
+            tables[dataset_uri] = DatasetTableRepository.find_all_active_tables(session, dataset_uri)
+            folders[dataset_uri] = DatasetLocationRepository.get_dataset_folders(session, dataset_uri)
+
+        datasets = DatasetRepository.find_active_datasets_by_uris(
+            session,
+            list(changed_datasets | set(tables) | set(folders) | {table.datasetUri for table in deleted_tables} | linked | voted),
+        )
+        log.info(f'Found {len(datasets)} datasets changed since {since}')
+        target_uris = [t.tableUri for ts in tables.values() for t in ts] + [f.locationUri for fs in folders.values() for f in fs]
+        context = DatasetIndexContext.load(session, datasets, target_uris=target_uris)
+
+        indexed = 0
+        with BulkIndexWriter() as writer:
+            for table in deleted_tables:
+                writer.delete(doc_id=table.tableUri)
+
+            for dataset in datasets:
+                dataset_tables = tables.get(dataset.datasetUri, [])
+                dataset_folders = folders.get(dataset.datasetUri, [])
+                DatasetTableIndexer.index(writer, dataset, dataset_tables, context)
+                DatasetLocationIndexer.index(writer, dataset, dataset_folders, context)
+                DatasetIndexer.index(writer, dataset, context)
+                indexed += len(dataset_tables) + len(dataset_folders) + 1
+        return IndexingResult(indexed, writer.failed)
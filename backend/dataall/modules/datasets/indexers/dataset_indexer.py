@@ -1,10 +1,51 @@
 """Indexes Datasets in OpenSearch"""
-from dataall.core.environment.services.environment_service import EnvironmentService
-from dataall.core.organizations.db.organization_repositories import Organization
+from dataclasses import dataclass
+from typing import Dict, List
+
+from dataall.core.environment.db.environment_models import Environment
+from dataall.core.environment.db.environment_repositories import EnvironmentRepository
+from dataall.core.organizations.db.organization_models import Organization
+from dataall.core.organizations.db.organization_repositories import Organization as OrganizationRepository
 from dataall.modules.vote.db.vote_repositories import VoteRepository
+from dataall.modules.datasets_base.db.dataset_models import Dataset
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetRepository
 from dataall.modules.datasets.db.dataset_location_repositories import DatasetLocationRepository
-from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer, BulkIndexWriter
+
+
+@dataclass
+class DatasetIndexContext:
+    """Entities that documents of datasets, tables and folders refer to, loaded once for many documents"""
+    environments: Dict[str, Environment]
+    organizations: Dict[str, Organization]
+    glossary: Dict[str, List[str]]
+    table_counts: Dict[str, int]
+    folder_counts: Dict[str, int]
+    upvotes: Dict[str, int]
+
+    @classmethod
+    def load(cls, session, datasets: List[Dataset], target_uris: List[str] = None):
+        """
+        Loads the context for the datasets. Glossary terms are loaded for the datasets and the given target_uris
+        (tables, folders), or for all targets if target_uris is None
+        """
+        dataset_uris = [dataset.datasetUri for dataset in datasets]
+        environments = EnvironmentRepository.find_environments_by_uris(
+            session, list({dataset.environmentUri for dataset in datasets})
+        )
+        organizations = OrganizationRepository.find_organizations_by_uris(
+            session, list({dataset.organizationUri for dataset in datasets})
+        )
+        return cls(
+            environments={env.environmentUri: env for env in environments},
+            organizations={org.organizationUri: org for org in organizations},
+            glossary=BaseIndexer._get_glossary_terms_by_target(
+                session, None if target_uris is None else dataset_uris + list(target_uris)
+            ),
+            table_counts=DatasetRepository.count_tables_by_datasets(session, dataset_uris),
+            folder_counts=DatasetLocationRepository.count_locations_by_datasets(session, dataset_uris),
+            upvotes=VoteRepository.count_upvotes_by_targets(session, dataset_uris, target_type='dataset'),
+        )
 
 
 class DatasetIndexer(BaseIndexer):
@@ -12,43 +53,42 @@ class DatasetIndexer(BaseIndexer):
     @classmethod
     def upsert(cls, session, dataset_uri: str):
         dataset = DatasetRepository.get_dataset_by_uri(session, dataset_uri)
-        env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri)
-        org = Organization.get_organization_by_uri(session, dataset.organizationUri)
-
-        count_tables = DatasetRepository.count_dataset_tables(session, dataset_uri)
-        count_folders = DatasetLocationRepository.count_dataset_locations(session, dataset_uri)
-        count_upvotes = VoteRepository.count_upvotes(
-            session, dataset_uri, target_type='dataset'
-        )
 
         if dataset:
-            glossary = BaseIndexer._get_target_glossary_terms(session, dataset_uri)
-            BaseIndexer._index(
-                doc_id=dataset_uri,
-                doc={
-                    'name': dataset.name,
-                    'owner': dataset.owner,
-                    'label': dataset.label,
-                    'admins': dataset.SamlAdminGroupName,
-                    'database': dataset.GlueDatabaseName,
-                    'source': dataset.S3BucketName,
-                    'resourceKind': 'dataset',
-                    'description': dataset.description,
-                    'classification': dataset.confidentiality,
-                    'tags': [t.replace('-', '') for t in dataset.tags or []],
-                    'topics': dataset.topics,
-                    'region': dataset.region.replace('-', ''),
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': dataset.created,
-                    'updated': dataset.updated,
-                    'deleted': dataset.deleted,
-                    'glossary': glossary,
-                    'tables': count_tables,
-                    'folders': count_folders,
-                    'upvotes': count_upvotes,
-                },
-            )
+            context = DatasetIndexContext.load(session, [dataset], target_uris=[])
+            BaseIndexer._index(doc_id=dataset_uri, doc=cls.build_doc(dataset, context))
         return dataset
+
+    @classmethod
+    def index(cls, writer: BulkIndexWriter, dataset: Dataset, context: DatasetIndexContext):
+        writer.index(doc_id=dataset.datasetUri, doc=cls.build_doc(dataset, context))
+
+    @staticmethod
+    def build_doc(dataset: Dataset, context: DatasetIndexContext) -> dict:
+        env = context.environments[dataset.environmentUri]
+        org = context.organizations[dataset.organizationUri]
+        return {
+            'name': dataset.name,
+            'owner': dataset.owner,
+            'label': dataset.label,
+            'admins': dataset.SamlAdminGroupName,
+            'database': dataset.GlueDatabaseName,
+            'source': dataset.S3BucketName,
+            'resourceKind': 'dataset',
+            'description': dataset.description,
+            'classification': dataset.confidentiality,
+            'tags': [t.replace('-', '') for t in dataset.tags or []],
+            'topics': dataset.topics,
+            'region': dataset.region.replace('-', ''),
+            'environmentUri': env.environmentUri,
+            'environmentName': env.name,
+            'organizationUri': org.organizationUri,
+            'organizationName': org.name,
+            'created': dataset.created,
+            'updated': dataset.updated,
+            'deleted': dataset.deleted,
+            'glossary': context.glossary.get(dataset.datasetUri, []),
+            'tables': context.table_counts.get(dataset.datasetUri, 0),
+            'folders': context.folder_counts.get(dataset.datasetUri, 0),
+            'upvotes': context.upvotes.get(dataset.datasetUri, 0),
+        }
@@ -1,10 +1,9 @@
 """Indexes DatasetStorageLocation in OpenSearch"""
-from dataall.core.environment.services.environment_service import EnvironmentService
-from dataall.core.organizations.db.organization_repositories import Organization
 from dataall.modules.datasets.db.dataset_location_repositories import DatasetLocationRepository
+from dataall.modules.datasets_base.db.dataset_models import Dataset, DatasetStorageLocation
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetRepository
-from dataall.modules.datasets.indexers.dataset_indexer import DatasetIndexer
-from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
+from dataall.modules.datasets.indexers.dataset_indexer import DatasetIndexer, DatasetIndexContext
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer, BulkIndexWriter
 
 
 class DatasetLocationIndexer(BaseIndexer):
@@ -15,41 +14,53 @@ class DatasetLocationIndexer(BaseIndexer):
 
         if folder:
             dataset = DatasetRepository.get_dataset_by_uri(session, folder.datasetUri)
-            env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri)
-            org = Organization.get_organization_by_uri(session, dataset.organizationUri)
-            glossary = BaseIndexer._get_target_glossary_terms(session, folder_uri)
-
-            BaseIndexer._index(
-                doc_id=folder_uri,
-                doc={
-                    'name': folder.name,
-                    'admins': dataset.SamlAdminGroupName,
-                    'owner': folder.owner,
-                    'label': folder.label,
-                    'resourceKind': 'folder',
-                    'description': folder.description,
-                    'source': dataset.S3BucketName,
-                    'classification': dataset.confidentiality,
-                    'tags': [f.replace('-', '') for f in folder.tags or []],
-                    'topics': dataset.topics,
-                    'region': folder.region.replace('-', ''),
-                    'datasetUri': folder.datasetUri,
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': folder.created,
-                    'updated': folder.updated,
-                    'deleted': folder.deleted,
-                    'glossary': glossary,
-                },
-            )
-            DatasetIndexer.upsert(session=session, dataset_uri=folder.datasetUri)
+            context = DatasetIndexContext.load(session, [dataset], target_uris=[folder_uri])
+            BaseIndexer._index(doc_id=folder_uri, doc=cls.build_doc(folder, dataset, context))
+            DatasetIndexer._index(doc_id=dataset.datasetUri, doc=DatasetIndexer.build_doc(dataset, context))
         return folder
 
     @classmethod
     def upsert_all(cls, session, dataset_uri: str):
+        """Indexes all folders of the dataset with bulk requests, the dataset is indexed once"""
         folders = DatasetLocationRepository.get_dataset_folders(session, dataset_uri)
-        for folder in folders:
-            DatasetLocationIndexer.upsert(session=session, folder_uri=folder.locationUri)
+        if folders:
+            dataset = DatasetRepository.get_dataset_by_uri(session, dataset_uri)
+            context = DatasetIndexContext.load(
+                session, [dataset], target_uris=[folder.locationUri for folder in folders]
+            )
+            with BulkIndexWriter() as writer:
+                cls.index(writer, dataset, folders, context)
+                DatasetIndexer.index(writer, dataset, context)
         return folders
+
+    @classmethod
+    def index(cls, writer: BulkIndexWriter, dataset: Dataset, folders, context: DatasetIndexContext):
+        for folder in folders:
+            writer.index(doc_id=folder.locationUri, doc=cls.build_doc(folder, dataset, context))
+
+    @staticmethod
+    def build_doc(folder: DatasetStorageLocation, dataset: Dataset, context: DatasetIndexContext) -> dict:
+        env = context.environments[dataset.environmentUri]
+        org = context.organizations[dataset.organizationUri]
+        return {
+            'name': folder.name,
+            'admins': dataset.SamlAdminGroupName,
+            'owner': folder.owner,
+            'label': folder.label,
+            'resourceKind': 'folder',
+            'description': folder.description,
+            'source': dataset.S3BucketName,
+            'classification': dataset.confidentiality,
+            'tags': [f.replace('-', '') for f in folder.tags or []],
+            'topics': dataset.topics,
+            'region': folder.region.replace('-', ''),
+            'datasetUri': folder.datasetUri,
+            'environmentUri': env.environmentUri,
+            'environmentName': env.name,
+            'organizationUri': org.organizationUri,
+            'organizationName': org.name,
+            'created': folder.created,
+            'updated': folder.updated,
+            'deleted': folder.deleted,
+            'glossary': context.glossary.get(folder.locationUri, []),
+        }
@@ -1,11 +1,10 @@
 """Indexes DatasetTable in OpenSearch"""
 
-from dataall.core.environment.services.environment_service import EnvironmentService
-from dataall.core.organizations.db.organization_repositories import Organization
 from dataall.modules.datasets.db.dataset_table_repositories import DatasetTableRepository
+from dataall.modules.datasets_base.db.dataset_models import Dataset, DatasetTable
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetRepository
-from dataall.modules.datasets.indexers.dataset_indexer import DatasetIndexer
-from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
+from dataall.modules.datasets.indexers.dataset_indexer import DatasetIndexer, DatasetIndexContext
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer, BulkIndexWriter
 
 
 class DatasetTableIndexer(BaseIndexer):
@@ -16,50 +15,60 @@ class DatasetTableIndexer(BaseIndexer):
 
         if table:
             dataset = DatasetRepository.get_dataset_by_uri(session, table.datasetUri)
-            env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri)
-            org = Organization.get_organization_by_uri(session, dataset.organizationUri)
-            glossary = BaseIndexer._get_target_glossary_terms(session, table_uri)
-
-            tags = table.tags if table.tags else []
-            BaseIndexer._index(
-                doc_id=table_uri,
-                doc={
-                    'name': table.name,
-                    'admins': dataset.SamlAdminGroupName,
-                    'owner': table.owner,
-                    'label': table.label,
-                    'resourceKind': 'table',
-                    'description': table.description,
-                    'database': table.GlueDatabaseName,
-                    'source': table.S3BucketName,
-                    'classification': dataset.confidentiality,
-                    'tags': [t.replace('-', '') for t in tags or []],
-                    'topics': dataset.topics,
-                    'region': dataset.region.replace('-', ''),
-                    'datasetUri': table.datasetUri,
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': table.created,
-                    'updated': table.updated,
-                    'deleted': table.deleted,
-                    'glossary': glossary,
-                },
-            )
-            DatasetIndexer.upsert(session=session, dataset_uri=table.datasetUri)
+            context = DatasetIndexContext.load(session, [dataset], target_uris=[table_uri])
+            BaseIndexer._index(doc_id=table_uri, doc=cls.build_doc(table, dataset, context))
+            DatasetIndexer._index(doc_id=dataset.datasetUri, doc=DatasetIndexer.build_doc(dataset, context))
         return table
 
     @classmethod
     def upsert_all(cls, session, dataset_uri: str):
+        """Indexes all active tables of the dataset with bulk requests, the dataset is indexed once"""
         tables = DatasetTableRepository.find_all_active_tables(session, dataset_uri)
-        for table in tables:
-            DatasetTableIndexer.upsert(session=session, table_uri=table.tableUri)
+        if tables:
+            dataset = DatasetRepository.get_dataset_by_uri(session, dataset_uri)
+            context = DatasetIndexContext.load(session, [dataset], target_uris=[table.tableUri for table in tables])
+            with BulkIndexWriter() as writer:
+                cls.index(writer, dataset, tables, context)
+                DatasetIndexer.index(writer, dataset, context)
         return tables
 
+    @classmethod
+    def index(cls, writer: BulkIndexWriter, dataset: Dataset, tables, context: DatasetIndexContext):
+        for table in tables:
+            writer.index(doc_id=table.tableUri, doc=cls.build_doc(table, dataset, context))
+
     @classmethod
     def remove_all_deleted(cls, session, dataset_uri: str):
         tables = DatasetTableRepository.find_all_deleted_tables(session, dataset_uri)
         for table in tables:
             cls.delete_doc(doc_id=table.tableUri)
         return tables
+
+    @staticmethod
+    def build_doc(table: DatasetTable, dataset: Dataset, context: DatasetIndexContext) -> dict:
+        env = context.environments[dataset.environmentUri]
+        org = context.organizations[dataset.organizationUri]
+        tags = table.tags if table.tags else []
+        return {
+            'name': table.name,
+            'admins': dataset.SamlAdminGroupName,
+            'owner': table.owner,
+            'label': table.label,
+            'resourceKind': 'table',
+            'description': table.description,
+            'database': table.GlueDatabaseName,
+            'source': table.S3BucketName,
+            'classification': dataset.confidentiality,
+            'tags': [t.replace('-', '') for t in tags or []],
+            'topics': dataset.topics,
+            'region': dataset.region.replace('-', ''),
+            'datasetUri': table.datasetUri,
+            'environmentUri': env.environmentUri,
+            'environmentName': env.name,
+            'organizationUri': org.organizationUri,
+            'organizationName': org.name,
+            'created': table.created,
+            'updated': table.updated,
+            'deleted': table.deleted,
+            'glossary': context.glossary.get(table.tableUri, []),
+        }
@@ -146,13 +146,14 @@ class DatasetTableService:
             log.info(
                 f'existing_tables={glue_tables}'
             )
+            new_table_uris = []
             for table in glue_tables:
                 if table['Name'] not in existing_table_names:
                     log.info(
                         f'Storing new table: {table} for dataset db {dataset.GlueDatabaseName}'
                     )
                     updated_table = DatasetTableRepository.create_synced_table(session, dataset, table)
-                    DatasetTableService._attach_dataset_table_permission(session, dataset, updated_table.tableUri)
+                    new_table_uris.append(updated_table.tableUri)
                 else:
                     log.info(
                         f'Updating table: {table} for dataset db {dataset.GlueDatabaseName}'
@@ -163,22 +164,24 @@ class DatasetTableService:
                     updated_table.GlueTableProperties = json_utils.to_json(
                         table.get('Parameters', {})
                     )
+                    updated_table.LastGlueTableUpdateTime = table.get('UpdateTime')
 
                 DatasetTableRepository.sync_table_columns(session, updated_table, table)
 
+            DatasetTableService._attach_dataset_table_permission(session, dataset, new_table_uris)
+
         return True
 
     @staticmethod
-    def _attach_dataset_table_permission(session, dataset: Dataset, table_uri):
+    def _attach_dataset_table_permission(session, dataset: Dataset, table_uris: [str]):
         # ADD DATASET TABLE PERMISSIONS
+        if not table_uris:
+            return
         env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri)
         permission_group = {dataset.SamlAdminGroupName, env.SamlGroupName,
                             dataset.stewards if dataset.stewards is not None else dataset.SamlAdminGroupName}
-        for group in permission_group:
-            ResourcePolicy.attach_resource_policy(
-                session=session,
-                group=group,
-                permissions=DATASET_TABLE_READ,
-                resource_uri=table_uri,
-                resource_type=DatasetTable.__name__,
-            )
+        ResourcePolicy.attach_resource_policies(
+            session,
+            [(group, table_uri, DATASET_TABLE_READ) for group in permission_group for table_uri in table_uris],
+            resource_type=DatasetTable.__name__,
+        )
@@ -1,7 +1,12 @@
 import logging
 import os
 import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from operator import and_
+from typing import List, Optional
 
 from dataall.base.aws.sts import SessionHelper
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
@@ -9,6 +14,7 @@ from dataall.core.environment.services.environment_service import EnvironmentSer
 from dataall.base.db import get_engine
 from dataall.modules.datasets.aws.glue_dataset_client import DatasetCrawler
 from dataall.modules.datasets.aws.lf_table_client import LakeFormationTableClient
+from dataall.modules.datasets.db.dataset_table_repositories import DatasetTableRepository
 from dataall.modules.datasets.services.dataset_table_service import DatasetTableService
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetRepository
 from dataall.modules.datasets_base.db.dataset_models import DatasetTable, Dataset
@@ -22,77 +28,152 @@ if not root.hasHandlers():
 log = logging.getLogger(__name__)
 
 
-def sync_tables(engine):
+@dataclass
+class DatasetSyncResult:
+    datasetUri: str
+    tables: List[DatasetTable] = field(default_factory=list)
+    duration: float = 0
+    skipped: bool = False
+    error: Optional[str] = None
+
+
+def sync_tables(engine, max_workers: int = None, skip_unchanged: bool = False):
+    """
+    Synchronizes the tables of all active datasets from Glue.
+    Datasets are grouped by (account, region), the groups are processed concurrently on a bounded thread pool
+    and the datasets of a group one after another, each in its own database session.
+    With skip_unchanged, datasets whose Glue tables were not updated since the last sync are skipped
+    """
+    max_workers = max_workers or int(os.getenv('TABLES_SYNC_MAX_WORKERS', '8'))
     with engine.scoped_session() as session:
-        processed_tables = []
         all_datasets: [Dataset] = DatasetRepository.list_all_active_datasets(
             session
         )
-        log.info(f'Found {len(all_datasets)} datasets for tables sync')
-        dataset: Dataset
+        groups = defaultdict(list)
         for dataset in all_datasets:
-            log.info(
-                f'Synchronizing dataset {dataset.name}|{dataset.datasetUri} tables'
-            )
-            env: Environment = (
-                session.query(Environment)
-                .filter(
-                    and_(
-                        Environment.environmentUri == dataset.environmentUri,
-                        Environment.deleted.is_(None),
-                    )
-                )
-                .first()
-            )
-            env_group: EnvironmentGroup = (
-                EnvironmentService.get_environment_group(
-                    session, dataset.SamlAdminGroupName, env.environmentUri
-                )
+            groups[(dataset.AwsAccountId, dataset.region)].append(dataset.datasetUri)
+    log.info(f'Found {len(all_datasets)} datasets in {len(groups)} accounts/regions for tables sync')
+
+    if len(groups) <= 1:
+        results = [_sync_group(engine, uris, skip_unchanged) for uris in groups.values()]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+            results = list(executor.map(lambda uris: _sync_group(engine, uris, skip_unchanged), groups.values()))
+
+    all_results = [result for group_results in results for result in group_results]
+    failed = [result.datasetUri for result in all_results if result.error]
+    skipped = [result.datasetUri for result in all_results if result.skipped]
+    log.info(
+        f'Synchronized tables of {len(all_results) - len(failed)} datasets ({len(skipped)} unchanged), '
+        f'failed datasets: {failed}'
+    )
+    processed_tables = [table for result in all_results for table in result.tables]
+    return processed_tables
+
+
+def _sync_group(engine, dataset_uris: List[str], skip_unchanged: bool) -> List[DatasetSyncResult]:
+    """Synchronizes the datasets of one account and region, the pivot role is checked once per environment"""
+    assumable = {}
+    results = []
+    for dataset_uri in dataset_uris:
+        started = time.perf_counter()
+        try:
+            with engine.scoped_session() as session:
+                result = _sync_dataset(session, dataset_uri, skip_unchanged, assumable)
+        except Exception as e:
+            log.error(f'Failed to save the tables of dataset {dataset_uri} due to: {e}')
+            result = DatasetSyncResult(dataset_uri, error=str(e))
+        result.duration = time.perf_counter() - started
+        log.info(
+            f'Dataset {dataset_uri} tables sync '
+            f'{"failed" if result.error else "skipped" if result.skipped else "completed"} '
+            f'in {result.duration:.2f}s'
+        )
+        results.append(result)
+    return results
+
+
+def _sync_dataset(session, dataset_uri: str, skip_unchanged: bool, assumable: dict) -> DatasetSyncResult:
+    """
+    Synchronizes the tables of one dataset in the session of the dataset. On a failure, including a database error,
+    the session is rolled back so that it's usable again and the other datasets are still synchronized
+    """
+    result = DatasetSyncResult(dataset_uri)
+    dataset: Optional[Dataset] = None
+    try:
+        dataset = DatasetRepository.get_dataset_by_uri(session, dataset_uri)
+        _sync_dataset_tables(session, dataset, skip_unchanged, assumable, result)
+    except Exception as e:
+        log.error(
+            f'Failed to sync tables for dataset '
+            f'{f"{dataset.AwsAccountId}/{dataset.GlueDatabaseName}" if dataset else dataset_uri} '
+            f'due to: {e}'
+        )
+        session.rollback()
+        result.tables = []
+        result.error = str(e)
+        if dataset:
+            DatasetAlarmService().trigger_dataset_sync_failure_alarm(dataset, str(e))
+    return result
+
+
+def _sync_dataset_tables(session, dataset: Dataset, skip_unchanged: bool, assumable: dict, result: DatasetSyncResult):
+    log.info(
+        f'Synchronizing dataset {dataset.name}|{dataset.datasetUri} tables'
+    )
+    env: Environment = (
+        session.query(Environment)
+        .filter(
+            and_(
+                Environment.environmentUri == dataset.environmentUri,
+                Environment.deleted.is_(None),
             )
-            try:
-                if not env or not is_assumable_pivot_role(env):
-                    log.info(
-                        f'Dataset {dataset.GlueDatabaseName} has an invalid environment'
-                    )
-                else:
-
-                    tables = DatasetCrawler(dataset).list_glue_database_tables(dataset.S3BucketName)
-
-                    log.info(
-                        f'Found {len(tables)} tables on Glue database {dataset.GlueDatabaseName}'
-                    )
-
-                    DatasetTableService.sync_existing_tables(
-                        session, dataset.datasetUri, glue_tables=tables
-                    )
-
-                    tables = (
-                        session.query(DatasetTable)
-                        .filter(DatasetTable.datasetUri == dataset.datasetUri)
-                        .all()
-                    )
-
-                    log.info('Updating tables permissions on Lake Formation...')
-
-                    for table in tables:
-                        LakeFormationTableClient(table).grant_principals_all_table_permissions(
-                            principals=[
-                                SessionHelper.get_delegation_role_arn(env.AwsAccountId),
-                                env_group.environmentIAMRoleArn,
-                            ],
-                        )
-
-                    processed_tables.extend(tables)
-
-                    DatasetTableIndexer.upsert_all(session, dataset_uri=dataset.datasetUri)
-            except Exception as e:
-                log.error(
-                    f'Failed to sync tables for dataset '
-                    f'{dataset.AwsAccountId}/{dataset.GlueDatabaseName} '
-                    f'due to: {e}'
-                )
-                DatasetAlarmService().trigger_dataset_sync_failure_alarm(dataset, str(e))
-        return processed_tables
+        )
+        .first()
+    )
+    if env and env.environmentUri not in assumable:
+        assumable[env.environmentUri] = is_assumable_pivot_role(env)
+    if not env or not assumable[env.environmentUri]:
+        log.info(
+            f'Dataset {dataset.GlueDatabaseName} has an invalid environment'
+        )
+        return
+
+    env_group: EnvironmentGroup = (
+        EnvironmentService.get_environment_group(
+            session, dataset.SamlAdminGroupName, env.environmentUri
+        )
+    )
+
+    glue_tables = DatasetCrawler(dataset).list_glue_database_tables(dataset.S3BucketName)
+
+    log.info(
+        f'Found {len(glue_tables)} tables on Glue database {dataset.GlueDatabaseName}'
+    )
+
+    tables = DatasetTableRepository.find_dataset_tables(session, dataset.datasetUri)
+    if skip_unchanged and DatasetTableRepository.is_in_sync(tables, glue_tables):
+        log.info(f'Tables of dataset {dataset.GlueDatabaseName} did not change since the last sync')
+        result.skipped = True
+        return
+
+    DatasetTableService.sync_existing_tables(
+        session, dataset.datasetUri, glue_tables=glue_tables
+    )
+
+    tables = DatasetTableRepository.find_dataset_tables(session, dataset.datasetUri)
+
+    log.info('Updating tables permissions on Lake Formation...')
+
+    principals = [
+        SessionHelper.get_delegation_role_arn(env.AwsAccountId),
+        env_group.environmentIAMRoleArn,
+    ]
+    LakeFormationTableClient.grant_principals_all_tables_permissions(tables, principals=principals)
+
+    result.tables = tables
+
+    DatasetTableIndexer.upsert_all(session, dataset_uri=dataset.datasetUri)
 
 
 def is_assumable_pivot_role(env: Environment):
@@ -108,4 +189,4 @@ def is_assumable_pivot_role(env: Environment):
 if __name__ == '__main__':
     ENVNAME = os.environ.get('envname', 'local')
     ENGINE = get_engine(envname=ENVNAME)
-    sync_tables(engine=ENGINE)
+    sync_tables(engine=ENGINE, skip_unchanged=os.environ.get('skip_unchanged_datasets', 'false').lower() == 'true')
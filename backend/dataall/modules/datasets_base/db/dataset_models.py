@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, String, Text, ForeignKey
+from sqlalchemy import Boolean, Column, DateTime, String, Text, ForeignKey
 from sqlalchemy.dialects.postgresql import JSON, ARRAY
 from sqlalchemy.orm import query_expression
 from dataall.base.db import Base, Resource, utils
@@ -71,6 +71,8 @@ class DatasetTable(Resource, Base):
     GlueTableConfig = Column(Text)
     GlueTableProperties = Column(JSON, default={})
     LastGlueTableStatus = Column(String, default='InSync')
+    LastGlueTableUpdateTime = Column(DateTime(timezone=True), nullable=True)
+    LastGlueColumnsHash = Column(String, nullable=True)
     region = Column(String, default='eu-west-1')
     # LastGeneratedPreviewDate= Column(DateTime, default=None)
     confidentiality = Column(String, nullable=True)
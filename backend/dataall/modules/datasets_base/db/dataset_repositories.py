@@ -1,12 +1,12 @@
 import logging
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, func
 from sqlalchemy.orm import Query
 from dataall.core.activity.db.activity_models import Activity
 from dataall.core.environment.db.environment_models import Environment
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.core.organizations.db.organization_repositories import Organization
-from dataall.base.db import paginate
+from dataall.base.db import paginate, paginate_by_cursor, is_cursor_pagination
 from dataall.base.db.exceptions import ObjectNotFound
 from dataall.modules.datasets_base.db.enums import ConfidentialityClassification, Language
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
@@ -230,6 +230,30 @@ class DatasetRepository(EnvironmentResource):
             session.query(Dataset).filter(Dataset.deleted.is_(None)).all()
         )
 
+    @staticmethod
+    def find_active_datasets_by_uris(session, dataset_uris) -> [Dataset]:
+        if not dataset_uris:
+            return []
+        return (
+            session.query(Dataset)
+            .filter(and_(Dataset.datasetUri.in_(dataset_uris), Dataset.deleted.is_(None)))
+            .all()
+        )
+
+    @staticmethod
+    def find_datasets_changed_since(session, since) -> [Dataset]:
+        """Returns active datasets created or updated after the given time"""
+        return (
+            session.query(Dataset)
+            .filter(
+                and_(
+                    Dataset.deleted.is_(None),
+                    or_(Dataset.created > since, Dataset.updated > since),
+                )
+            )
+            .all()
+        )
+
     @staticmethod
     def get_dataset_by_bucket_name(session, bucket) -> [Dataset]:
         return (
@@ -246,6 +270,18 @@ class DatasetRepository(EnvironmentResource):
             .count()
         )
 
+    @staticmethod
+    def count_tables_by_datasets(session, dataset_uris) -> dict:
+        """Returns the number of tables of each dataset, datasets without tables are omitted"""
+        if not dataset_uris:
+            return {}
+        rows = (
+            session.query(DatasetTable.datasetUri, func.count(DatasetTable.tableUri))
+            .filter(DatasetTable.datasetUri.in_(dataset_uris))
+            .group_by(DatasetTable.datasetUri)
+        )
+        return {dataset_uri: count for dataset_uri, count in rows}
+
     @staticmethod
     def query_environment_group_datasets(session, env_uri, group_uri, filter) -> Query:
         query = session.query(Dataset).filter(
@@ -349,8 +385,17 @@ class DatasetRepository(EnvironmentResource):
     def paginated_user_datasets(
             session, username, groups, data=None
     ) -> dict:
+        query = DatasetRepository._query_user_datasets(session, username, groups, data)
+        if is_cursor_pagination(data):
+            return paginate_by_cursor(
+                query=query,
+                keys=[Dataset.created, Dataset.datasetUri],
+                page_size=data.get('pageSize', 10),
+                after=data.get('after'),
+                count_mode=data.get('countMode'),
+            ).to_dict()
         return paginate(
-            query=DatasetRepository._query_user_datasets(session, username, groups, data),
+            query=query.distinct(Dataset.datasetUri),
             page=data.get('page', 1),
             page_size=data.get('pageSize', 10),
         ).to_dict()
@@ -374,7 +419,7 @@ class DatasetRepository(EnvironmentResource):
                     Dataset.label.ilike(filter.get('term') + '%%'),
                 )
             )
-        return query.distinct(Dataset.datasetUri)
+        return query
 
     @staticmethod
     def _set_import_data(dataset, data):
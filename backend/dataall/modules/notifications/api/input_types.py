@@ -1,4 +1,5 @@
 from dataall.base.api import gql
+from dataall.base.api.constants import CountMode
 
 NotificationFilter = gql.InputType(
     name='NotificationFilter',
@@ -10,5 +11,7 @@ NotificationFilter = gql.InputType(
         gql.Argument(name='type', type=gql.String),
         gql.Argument(name='page', type=gql.Integer),
         gql.Argument(name='pageSize', type=gql.Integer),
+        gql.Argument(name='after', type=gql.String),
+        gql.Argument(name='countMode', type=CountMode.toGraphQLEnum()),
     ],
 )
@@ -3,7 +3,7 @@ from datetime import datetime
 from sqlalchemy import func, and_, or_
 
 from dataall.modules.notifications.db import notification_models as models
-from dataall.base.db import paginate
+from dataall.base.db import paginate, paginate_by_cursor, is_cursor_pagination
 
 
 class NotificationRepository:
@@ -52,6 +52,14 @@ class NotificationRepository:
             )
         if filter.get('archived'):
             q = q.filter(models.Notification.deleted.isnot(None))
+        if is_cursor_pagination(filter):
+            return paginate_by_cursor(
+                q,
+                keys=[models.Notification.created, models.Notification.notificationUri],
+                page_size=filter.get('pageSize', 20),
+                after=filter.get('after'),
+                count_mode=filter.get('countMode'),
+            ).to_dict()
         return paginate(
             q, page=filter.get('page', 1), page_size=filter.get('pageSize', 20)
         ).to_dict()
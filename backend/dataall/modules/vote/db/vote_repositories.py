@@ -1,6 +1,8 @@
 import logging
 from datetime import datetime
 
+from sqlalchemy import func, or_
+
 from dataall.modules.vote.db import vote_models as models
 from dataall.base.context import get_context
 
@@ -58,6 +60,34 @@ class VoteRepository:
             .count()
         )
 
+    @staticmethod
+    def count_upvotes_by_targets(session, target_uris, target_type) -> dict:
+        """Returns the number of upvotes of each target, targets without upvotes are omitted"""
+        if not target_uris:
+            return {}
+        rows = (
+            session.query(models.Vote.targetUri, func.count(models.Vote.voteUri))
+            .filter(
+                models.Vote.targetUri.in_(target_uris),
+                models.Vote.targetType == target_type,
+                models.Vote.upvote == True,
+            )
+            .group_by(models.Vote.targetUri)
+        )
+        return {target_uri: count for target_uri, count in rows}
+
+    @staticmethod
+    def find_targets_voted_since(session, since, target_type) -> set:
+        rows = (
+            session.query(models.Vote.targetUri)
+            .filter(
+                models.Vote.targetType == target_type,
+                or_(models.Vote.created > since, models.Vote.updated > since),
+            )
+            .distinct()
+        )
+        return {row.targetUri for row in rows}
+
     @staticmethod
     def delete_votes(session, target_uri, target_type) -> [models.Vote]:
         return (
@@ -17,6 +17,7 @@ from dataall.base.searchproxy import connect, run_query
 from dataall.base.loader import load_modules, ImportMode
 from dataall.base.config import config
 from dataall.base.context import set_context, dispose_context, RequestContext
+from dataall.base.tracing import instrument, is_tracing_requested, trace_operation
 
 import logging
 
@@ -24,10 +25,11 @@ logger = logging.getLogger('graphql')
 logger.propagate = False
 logger.setLevel(logging.INFO)
 
-Worker.queue = Worker.process
+Worker.sender = Worker.process
 ENVNAME = os.getenv('envname', 'local')
 logger.warning(f'Connecting to database `{ENVNAME}`')
 engine = get_engine(envname=ENVNAME)
+instrument(engine.engine)
 es = connect(envname=ENVNAME)
 logger.info('Connected')
 # create_schema_and_tables(engine, envname=ENVNAME)
@@ -78,14 +80,13 @@ def request_context(headers, mock=False):
             logger.error(str(e))
             raise e
 
-    for group in groups:
-        with engine.scoped_session() as session:
-            TenantPolicy.attach_group_tenant_policy(
-                session=session,
-                group=group,
-                permissions=permissions.TENANT_ALL,
-                tenant_name='dataall',
-            )
+    with engine.scoped_session() as session:
+        TenantPolicy.ensure_group_tenant_policies(
+            session=session,
+            groups=groups,
+            permissions=permissions.TENANT_ALL,
+            tenant_name='dataall',
+        )
 
     set_context(RequestContext(db_engine=engine, username=username, groups=groups, user_id=username))
 
@@ -147,14 +148,18 @@ def graphql_server():
 
     # Note: Passing the request to the context is optional.
     # In Flask, the current request is always accessible as flask.request
-    success, result = graphql_sync(
-        schema,
-        data,
-        context_value=context,
-        debug=app.debug,
-    )
-
-    dispose_context()
+    try:
+        with trace_operation(data.get('operationName')) as trace, Worker.outbox(engine):
+            success, result = graphql_sync(
+                schema,
+                data,
+                context_value=context,
+                debug=app.debug,
+            )
+        if is_tracing_requested(request.headers, TenantPolicy.is_tenant_admin(context['groups'])):
+            result.setdefault('extensions', {})['tracing'] = trace.summary()
+    finally:
+        dispose_context()
     status_code = 200 if success else 400
     return jsonify(result), status_code
 
@@ -163,7 +168,7 @@ if __name__ == '__main__':
     logger.info('Starting dataall flask local application')
     app.run(
         debug=True,  # nosec
-        threaded=False,
+        threaded=True,
         host='0.0.0.0',
         port=5000,
     )
@@ -0,0 +1,29 @@
+"""catalog indexer state
+
+Revision ID: 3f0d8b7c1a2e
+Revises: 71a5f5de322f
+Create Date: 2026-10-18 09:12:41.512733
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f0d8b7c1a2e'
+down_revision = '71a5f5de322f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'catalog_indexer_state',
+        sa.Column('indexer', sa.String(), nullable=False),
+        sa.Column('lastIndexed', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('indexer'),
+    )
+
+
+def downgrade():
+    op.drop_table('catalog_indexer_state')
@@ -0,0 +1,27 @@
+"""dataset table glue update time
+
+Revision ID: 5d7a0e3f9b41
+Revises: c2b7a4e91d53
+Create Date: 2026-10-18 15:42:08.613209
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d7a0e3f9b41'
+down_revision = 'c2b7a4e91d53'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'dataset_table',
+        sa.Column('LastGlueTableUpdateTime', sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column('dataset_table', 'LastGlueTableUpdateTime')
@@ -0,0 +1,27 @@
+"""tenant permissions version
+
+Revision ID: 8e4c1d2b6a9f
+Revises: 3f0d8b7c1a2e
+Create Date: 2026-10-18 11:03:27.194310
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e4c1d2b6a9f'
+down_revision = '3f0d8b7c1a2e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'tenant',
+        sa.Column('permissionsVersion', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+
+def downgrade():
+    op.drop_column('tenant', 'permissionsVersion')
@@ -0,0 +1,24 @@
+"""dataset table glue columns hash
+
+Revision ID: a4f26c8e0d17
+Revises: 5d7a0e3f9b41
+Create Date: 2026-10-18 16:27:51.338402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4f26c8e0d17'
+down_revision = '5d7a0e3f9b41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('dataset_table', sa.Column('LastGlueColumnsHash', sa.String(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('dataset_table', 'LastGlueColumnsHash')
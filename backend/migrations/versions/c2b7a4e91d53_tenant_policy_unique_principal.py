@@ -0,0 +1,49 @@
+"""tenant policy unique principal
+
+Revision ID: c2b7a4e91d53
+Revises: 8e4c1d2b6a9f
+Create Date: 2026-10-18 12:41:08.376215
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2b7a4e91d53'
+down_revision = '8e4c1d2b6a9f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # keeps the oldest policy of every principal, the permissions of the duplicates are merged into it
+    op.execute(
+        '''
+        CREATE TEMPORARY TABLE tenant_policy_duplicates AS
+        SELECT p.sid AS sid, k.sid AS kept_sid
+        FROM tenant_policy p
+        JOIN (
+            SELECT DISTINCT ON ("tenantUri", "principalId") sid, "tenantUri", "principalId"
+            FROM tenant_policy
+            ORDER BY "tenantUri", "principalId", created NULLS LAST, sid
+        ) k ON k."tenantUri" = p."tenantUri" AND k."principalId" = p."principalId" AND k.sid <> p.sid
+        '''
+    )
+    op.execute(
+        '''
+        INSERT INTO tenant_policy_permission (sid, "permissionUri", created)
+        SELECT DISTINCT d.kept_sid, pp."permissionUri", now()
+        FROM tenant_policy_permission pp JOIN tenant_policy_duplicates d ON d.sid = pp.sid
+        ON CONFLICT DO NOTHING
+        '''
+    )
+    op.execute('DELETE FROM tenant_policy_permission WHERE sid IN (SELECT sid FROM tenant_policy_duplicates)')
+    op.execute('DELETE FROM tenant_policy WHERE sid IN (SELECT sid FROM tenant_policy_duplicates)')
+    op.execute('DROP TABLE tenant_policy_duplicates')
+    op.create_unique_constraint(
+        'uq_tenant_policy_principal', 'tenant_policy', ['tenantUri', 'principalId']
+    )
+
+
+def downgrade():
+    op.drop_constraint('uq_tenant_policy_principal', 'tenant_policy', type_='unique')
@@ -140,6 +140,7 @@ class LambdaApiStack(pyNestedClass):
             lambda_event_sources.SqsEventSource(
                 queue=sqs_queue,
                 batch_size=1,
+                report_batch_item_failures=True,
             )
         )
 
@@ -0,0 +1,16 @@
+from dataall.base.api import bootstrap, get_executable_schema
+from dataall.base.api.schema_artifact import ApiArtifact
+
+
+def test_artifact_round_trip(tmp_path):
+    path = str(tmp_path / 'api_artifact.json')
+    schema = bootstrap()
+    ApiArtifact(sdl=schema.gql(with_directives=False), permissions_fingerprint='fingerprint').save(path)
+
+    artifact = ApiArtifact.load(path)
+    assert artifact.permissions_fingerprint == 'fingerprint'
+    assert get_executable_schema(schema=schema, type_defs=artifact.sdl).get_type('Query')
+
+
+def test_missing_artifact(tmp_path):
+    assert ApiArtifact.load(str(tmp_path / 'missing.json')) is None
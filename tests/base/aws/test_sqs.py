@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+from dataall.base.aws.sqs import SqsQueue
+
+
+@pytest.fixture
+def sqs_client(mocker):
+    client = mocker.MagicMock()
+    client.send_message_batch.return_value = {'Successful': []}
+    mocker.patch.object(SqsQueue, 'queue_url', 'https://sqs/queue.fifo')
+    mocker.patch.object(SqsQueue, 'get_sqs_client', return_value=client)
+    yield client
+
+
+def test_send_tasks_in_one_message(sqs_client):
+    SqsQueue.send(None, ['task1', 'task2', 'task3'])
+
+    sqs_client.send_message_batch.assert_called_once()
+    [entry] = sqs_client.send_message_batch.call_args.kwargs['Entries']
+    assert json.loads(entry['MessageBody']) == ['task1', 'task2', 'task3']
+
+    SqsQueue.send(None, ['task1', 'task2', 'task3'])
+    [same_entry] = sqs_client.send_message_batch.call_args.kwargs['Entries']
+    assert same_entry['MessageDeduplicationId'] == entry['MessageDeduplicationId']
+    assert same_entry['MessageGroupId'] == entry['MessageGroupId']
+
+
+def test_send_splits_large_messages(sqs_client, mocker):
+    mocker.patch.object(SqsQueue, 'TASKS_PER_MESSAGE', 2)
+    task_ids = [f'task{i}' for i in range(5)]
+    SqsQueue.send(None, task_ids)
+
+    entries = sqs_client.send_message_batch.call_args.kwargs['Entries']
+    assert [json.loads(entry['MessageBody']) for entry in entries] == [task_ids[0:2], task_ids[2:4], task_ids[4:]]
+    assert len({entry['MessageDeduplicationId'] for entry in entries}) == 3
@@ -0,0 +1,60 @@
+import datetime
+import threading
+
+import pytest
+
+from dataall.base.aws.sts import SessionHelper, remote_session_cache
+
+
+def _credentials(minutes=60):
+    return {
+        'AccessKeyId': 'access',
+        'SecretAccessKey': 'secret',
+        'SessionToken': 'token',
+        'Expiration': datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=minutes),
+    }
+
+
+@pytest.fixture
+def assume_role(mocker):
+    remote_session_cache.clear()
+    mocker.patch('dataall.base.aws.sts.SessionHelper.get_external_id_secret', return_value='external-id')
+    mocker.patch('dataall.base.aws.sts.SessionHelper.get_delegation_role_name', return_value='pivotRole')
+    yield mocker.patch('dataall.base.aws.sts.SessionHelper._assume_role', return_value=_credentials())
+    remote_session_cache.clear()
+
+
+def test_remote_session_is_cached(assume_role):
+    sessions = [SessionHelper.remote_session(accountid='111111111111') for _ in range(200)]
+    assert all(session is sessions[0] for session in sessions)
+    assert assume_role.call_count == 1
+
+    SessionHelper.remote_session(accountid='111111111111', role='arn:aws:iam::111111111111:role/other')
+    SessionHelper.remote_session(accountid='222222222222')
+    assert assume_role.call_count == 3
+
+
+def test_remote_session_concurrent_creation(assume_role):
+    threads = [
+        threading.Thread(target=SessionHelper.remote_session, kwargs={'accountid': '111111111111'})
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert assume_role.call_count == 1
+
+
+def test_remote_session_refreshes_expiring_credentials(assume_role):
+    assume_role.return_value = _credentials(minutes=5)
+    session = SessionHelper.remote_session(accountid='111111111111')
+    assume_role.return_value = _credentials()
+    session.get_credentials().get_frozen_credentials()
+    assert assume_role.call_count == 2
+
+
+def test_remote_session_reuses_clients(assume_role):
+    session = SessionHelper.remote_session(accountid='111111111111')
+    assert session.client('s3', region_name='eu-west-1') is session.client('s3', region_name='eu-west-1')
+    assert session.client('s3', region_name='eu-west-1') is not session.client('s3', region_name='us-east-1')
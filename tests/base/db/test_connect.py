@@ -1,5 +1,10 @@
 import os
+import threading
+
+import pytest
+
 import dataall
+from dataall.core.permissions.db.permission_models import Tenant
 
 
 def test(db: dataall.base.db.Engine):
@@ -17,3 +22,80 @@ def test(db: dataall.base.db.Engine):
                 assert nb == 0
     else:
         assert True
+
+
+def test_nested_scoped_sessions_share_the_session(db: dataall.base.db.Engine):
+    with db.scoped_session() as outer:
+        tenant = outer.query(Tenant).first()
+        with db.scoped_session() as inner:
+            assert inner is outer
+        # the nested block must not close the outer session
+        assert tenant in outer
+
+
+def test_nested_scoped_sessions_commit_once(db: dataall.base.db.Engine):
+    with pytest.raises(RuntimeError):
+        with db.scoped_session() as outer:
+            with db.scoped_session() as inner:
+                tenant = Tenant(name='nested-tenant', description='nested')
+                inner.add(tenant)
+            # the nested block must not commit the unit of work of the outer block
+            assert tenant in outer.new
+            raise RuntimeError('rolls back the outer block')
+
+    with db.scoped_session() as session:
+        assert not session.query(Tenant).filter(Tenant.name == 'nested-tenant').count()
+
+
+def test_nested_scoped_session_rolls_back_on_errors(db: dataall.base.db.Engine):
+    with db.scoped_session() as outer:
+        try:
+            with db.scoped_session() as inner:
+                inner.add(Tenant(name='failed-nested-tenant', description='nested'))
+                inner.flush()
+                raise RuntimeError('caught by the caller')
+        except RuntimeError:
+            pass
+        outer.add(Tenant(name='outer-tenant', description='outer'))
+
+    with db.scoped_session() as session:
+        assert not session.query(Tenant).filter(Tenant.name == 'failed-nested-tenant').count()
+        assert session.query(Tenant).filter(Tenant.name == 'outer-tenant').count() == 1
+        session.query(Tenant).filter(Tenant.name == 'outer-tenant').delete()
+
+
+def test_sessions_are_per_thread(db: dataall.base.db.Engine):
+    sessions = []
+
+    def use_session():
+        with db.scoped_session() as session:
+            sessions.append(session)
+
+    thread = threading.Thread(target=use_session)
+    thread.start()
+    thread.join()
+    with db.scoped_session() as session:
+        assert sessions[0] is not session
+
+
+def test_pool_config():
+    config = dataall.base.db.DbPoolConfig.from_dict({'pool_size': '3', 'max_overflow': 0})
+    assert config.pool_size == 3
+    assert config.max_overflow == 0
+    assert config.pre_ping
+
+    with pytest.raises(ValueError):
+        dataall.base.db.DbPoolConfig(pool_size=0)
+
+
+def test_pool_metrics(db: dataall.base.db.Engine, caplog):
+    with db.scoped_session() as session:
+        session.execute('SELECT 1')
+        metrics = db.pool_metrics()
+        assert metrics['checked_out'] >= 1
+        assert metrics['checkouts'] >= 1
+    assert metrics['pool_size'] == db.pool_config.pool_size
+
+    with caplog.at_level('DEBUG', logger='dataall.base.db.connection'):
+        db.close_session()
+    assert '"event": "db_pool"' in caplog.text
@@ -0,0 +1,74 @@
+from unittest.mock import MagicMock
+
+from dataall.base.services.caching_service_provider import CachingServiceProvider, ServiceProviderCache
+
+
+def _provider():
+    provider = MagicMock()
+    provider.get_groups_for_user.side_effect = lambda user_id: [f'{user_id}-group']
+    provider.get_user_emailids_from_group.side_effect = lambda group: [f'{group}@example.com']
+    return provider
+
+
+def test_answers_are_cached_per_key():
+    provider = _provider()
+    caching = CachingServiceProvider(provider, ServiceProviderCache(ttl=60))
+
+    assert caching.get_groups_for_user('alice') == ['alice-group']
+    assert caching.get_groups_for_user('alice') == ['alice-group']
+    assert caching.get_groups_for_user('bob') == ['bob-group']
+    assert caching.get_user_emailids_from_group('alice') == ['alice@example.com']
+
+    assert provider.get_groups_for_user.call_count == 2
+    assert caching.cache.stats()['hits'] == 1
+    assert caching.cache.stats()['misses'] == 3
+    assert caching.cache.hit_rate == 0.25
+
+
+def test_expired_and_evicted_entries_are_reloaded(mocker):
+    clock = mocker.patch('dataall.base.services.caching_service_provider.time.monotonic', return_value=0)
+    provider = _provider()
+    caching = CachingServiceProvider(provider, ServiceProviderCache(ttl=60, max_size=2, refresh_after=60))
+
+    caching.get_groups_for_user('alice')
+    caching.get_groups_for_user('bob')
+    caching.get_groups_for_user('alice')
+    caching.get_groups_for_user('carol')  # evicts bob, the least recently used
+    caching.get_groups_for_user('bob')
+    assert provider.get_groups_for_user.call_count == 4
+
+    clock.return_value = 61
+    caching.get_groups_for_user('bob')
+    assert provider.get_groups_for_user.call_count == 5
+
+
+def test_stale_entries_are_refreshed_in_the_background(mocker):
+    clock = mocker.patch('dataall.base.services.caching_service_provider.time.monotonic', return_value=0)
+    provider = _provider()
+    cache = ServiceProviderCache(ttl=60, refresh_after=30)
+    caching = CachingServiceProvider(provider, cache)
+    caching.get_groups_for_user('alice')
+
+    provider.get_groups_for_user.side_effect = lambda user_id: [f'{user_id}-new-group']
+    clock.return_value = 45
+    assert caching.get_groups_for_user('alice') == ['alice-group']
+    cache._executor.submit(lambda: None).result()  # waits for the background refresh
+
+    assert caching.get_groups_for_user('alice') == ['alice-new-group']
+    assert cache.stats()['refreshes'] == 1
+
+
+def test_failed_background_refresh_keeps_the_old_value(mocker):
+    clock = mocker.patch('dataall.base.services.caching_service_provider.time.monotonic', return_value=0)
+    provider = _provider()
+    cache = ServiceProviderCache(ttl=60, refresh_after=30)
+    caching = CachingServiceProvider(provider, cache)
+    caching.get_groups_for_user('alice')
+
+    provider.get_groups_for_user.side_effect = Exception('IdP is down')
+    clock.return_value = 45
+    caching.get_groups_for_user('alice')
+    cache._executor.submit(lambda: None).result()  # waits for the background refresh
+
+    assert caching.get_groups_for_user('alice') == ['alice-group']
+    assert cache.stats()['errors'] == 1
@@ -1,4 +1,22 @@
+import copy
+import logging
+import time
+
+import pytest
+
+from dataall.base import config as config_module
 from dataall.base.config import config
+from dataall.base.feature_toggle_checker import is_feature_enabled
+
+log = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def restore_config():
+    saved = copy.deepcopy(config._config)
+    yield
+    config._config = saved
+    config.refresh()
 
 
 def test_config():
@@ -17,3 +35,73 @@ def test_config():
     config.set_property("a.b.e", "f")
     assert config.get_property("a.b.c") == "d"
     assert config.get_property("a.b.e") == "f"
+
+
+def test_properties_are_read_only():
+    config.set_property("ro.nested", {"list": [1, 2], "key": "value"})
+    nested = config.get_property("ro.nested")
+    with pytest.raises(TypeError):
+        nested["key"] = "other"
+    assert config.get_property("ro.nested.list") == (1, 2)
+    assert config.get_property("ro.nested.key") == "value"
+
+
+def test_feature_flags_are_refreshed_with_the_config():
+    config.set_property("flags.toggle", True)
+
+    @is_feature_enabled("flags.toggle")
+    def feature():
+        return "called"
+
+    assert feature() == "called"
+    config.set_property("flags.toggle", False)
+    with pytest.raises(Exception, match="Disabled by config flags.toggle"):
+        feature()
+
+
+def test_get_property_reads_the_compiled_view(mocker):
+    read_spy = mocker.spy(config_module._Config, "_read_config_file")
+    freeze_spy = mocker.spy(config_module, "_freeze")
+
+    modules = config.get_property("modules")
+    for _ in range(10):
+        assert config.get_property("modules") is modules
+    assert read_spy.call_count == 0
+    assert freeze_spy.call_count == 0
+
+    config.set_property("cache.key", "value")
+    assert freeze_spy.call_count > 0
+    freeze_spy.reset_mock()
+    for _ in range(10):
+        assert config.get_property("cache.key") == "value"
+    assert freeze_spy.call_count == 0
+
+
+def test_get_property_benchmark():
+    """
+    Per-call overhead of reading a config subtree: the previous deepcopy-based lookup against the compiled view.
+    Run with --log-cli-level=INFO to see the timings
+    """
+    raw = config._read_config_file()
+    iterations = 2000
+
+    def deepcopy_lookup(key):
+        res = raw
+        for prop in key.split("."):
+            res = res[prop]
+        return copy.deepcopy(res)
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        before_value = deepcopy_lookup("modules")
+    before = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        after_value = config.get_property("modules")
+    after = time.perf_counter() - started
+
+    log.info(f"get_property('modules') per call: deepcopy {before / iterations * 1e6:.2f}us, "
+             f"compiled {after / iterations * 1e6:.2f}us")
+    # the timings are only reported, both lookups must return the same modules
+    assert set(after_value) == set(before_value)
@@ -0,0 +1,84 @@
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+
+from dataall.base.tracing import (
+    current_trace,
+    instrument_boto3_session,
+    instrument_engine,
+    is_tracing_requested,
+    trace_operation,
+)
+
+
+def test_sql_calls_are_tagged_with_the_resolver_path(db, client, tenant):
+    instrument_engine(db.engine)
+    with trace_operation('listEnvironments') as trace:
+        response = client.query(
+            """
+            query listEnvironments($filter: EnvironmentFilter) {
+                listEnvironments(filter: $filter) { count }
+            }
+            """,
+            username='alice',
+            groups=['testadmins'],
+            filter={},
+        )
+    assert response.data.listEnvironments.count == 0
+    assert current_trace() is None
+
+    summary = trace.summary()
+    assert summary['operationName'] == 'listEnvironments'
+    assert summary['counts']['sql'] == len([span for span in trace.spans if span.kind == 'sql']) > 0
+    assert {span.path for span in trace.spans} == {'listEnvironments'}
+    assert len(summary['slowest']) <= 5
+
+
+def test_sql_calls_outside_of_an_operation_are_not_recorded(db):
+    instrument_engine(db.engine)
+    with db.scoped_session() as session:
+        session.execute('SELECT 1')
+    assert current_trace() is None
+
+
+class _RawResponse:
+    def stream(self, **kwargs):
+        yield b'<GetCallerIdentityResponse><GetCallerIdentityResult><Account>111111111111</Account>' \
+              b'</GetCallerIdentityResult></GetCallerIdentityResponse>'
+
+
+def test_aws_calls_are_recorded():
+    session = boto3.Session(region_name='eu-west-1', aws_access_key_id='key', aws_secret_access_key='secret')
+    instrument_boto3_session(session)
+    sts = session.client('sts')
+    # answers before the request is sent, the before-call and after-call events are emitted as for a real call
+    sts.meta.events.register('before-send', lambda request, **kwargs: AWSResponse(request.url, 200, {}, _RawResponse()))
+    with trace_operation('getCallerIdentity') as trace:
+        assert sts.get_caller_identity()['Account'] == '111111111111'
+
+    assert trace.summary()['counts'] == {'aws': 1}
+    assert trace.spans[0].name == 'sts.GetCallerIdentity'
+
+
+def test_failed_sql_calls_are_not_recorded(db):
+    instrument_engine(db.engine)
+    with trace_operation('failing') as trace:
+        with pytest.raises(Exception):
+            with db.scoped_session() as session:
+                session.execute('SELECT * FROM not_a_table')
+        with db.scoped_session() as session:
+            session.execute('SELECT 1')
+    assert [span.name for span in trace.spans if span.kind == 'sql'] == ['SELECT 1']
+
+
+def test_is_tracing_requested(monkeypatch):
+    assert is_tracing_requested({'X-Dataall-Tracing': 'true'})
+    assert is_tracing_requested({'x-dataall-tracing': '1'})
+    assert not is_tracing_requested({'x-dataall-tracing': 'false'})
+    assert not is_tracing_requested({})
+    assert not is_tracing_requested(None)
+
+    monkeypatch.setenv('envname', 'prod')
+    assert not is_tracing_requested({'x-dataall-tracing': 'true'})
+    assert is_tracing_requested({'x-dataall-tracing': 'true'}, is_tenant_admin=True)
+    assert not is_tracing_requested({'x-dataall-tracing': 'false'}, is_tenant_admin=True)
@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from dataall.base.utils.parameter import ParameterCache
+
+
+@pytest.fixture
+def ssm():
+    client = MagicMock()
+    values = {'/dataall/test/reauth/apis': 'createDataset'}
+
+    def get_parameter(Name):
+        if Name not in values:
+            raise ClientError({'Error': {'Code': 'ParameterNotFound'}}, 'GetParameter')
+        return {'Parameter': {'Value': values[Name]}}
+
+    client.get_parameter.side_effect = get_parameter
+    client.get_paginator.return_value.paginate.return_value = [
+        {'Parameters': [{'Name': name, 'Value': value} for name, value in values.items()]}
+    ]
+    return client
+
+
+@pytest.fixture
+def cache(ssm, mocker):
+    cache = ParameterCache(ttl=300, negative_ttl=60)
+    mocker.patch.object(cache, 'client', return_value=ssm)
+    return cache
+
+
+def test_parameter_is_cached(cache, ssm):
+    assert cache.get('/dataall/test/reauth/apis') == 'createDataset'
+    assert cache.get('/dataall/test/reauth/apis') == 'createDataset'
+    assert ssm.get_parameter.call_count == 1
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_missing_parameter_is_cached(cache, ssm):
+    assert cache.get('/dataall/test/missing') is None
+    assert cache.get('/dataall/test/missing') is None
+    assert ssm.get_parameter.call_count == 1
+
+
+def test_expired_parameter_is_reloaded(cache, ssm):
+    cache.ttl = 0
+    cache.get('/dataall/test/reauth/apis')
+    cache.get('/dataall/test/reauth/apis')
+    assert ssm.get_parameter.call_count == 2
+
+
+def test_prefetch(cache, ssm):
+    cache.prefetch('/dataall/test/reauth')
+    assert cache.get('/dataall/test/reauth/apis') == 'createDataset'
+    assert cache.get('/dataall/test/reauth/other') is None
+    ssm.get_parameter.assert_not_called()
+
+
+def test_invalidate(cache, ssm):
+    cache.get('/dataall/test/reauth/apis')
+    cache.invalidate('/dataall/test/reauth/apis')
+    cache.get('/dataall/test/reauth/apis')
+    assert ssm.get_parameter.call_count == 2
@@ -130,7 +130,7 @@ def group4(db, tenant, user3):
 def tenant(db, permissions):
     with db.scoped_session() as session:
         tenant = Tenant.save_tenant(session, name='dataall', description='Tenant dataall')
-        yield tenant
+    yield tenant
 
 
 @pytest.fixture(scope='module', autouse=True)
@@ -142,7 +142,8 @@ def patch_request(module_mocker):
 @pytest.fixture(scope='module', autouse=True)
 def permissions(db):
     with db.scoped_session() as session:
-        yield Permission.init_permissions(session)
+        permissions = Permission.init_permissions(session)
+    yield permissions
 
 
 @pytest.fixture(scope='function', autouse=True)
@@ -1,10 +1,20 @@
+import dataclasses
+
 import pytest
 
+from dataall.base.context import set_context, dispose_context, RequestContext
+from dataall.core.permissions.db.resource_policy_repositories import ResourcePolicy
+from dataall.core.permissions.permission_checker import has_resource_permission
+from dataall.core.permissions.db import permissions_fingerprint, save_permissions_with_tenant
+from dataall.core.permissions.db.permission_catalog import PermissionCatalog
 from dataall.core.permissions.db.permission_repositories import Permission
+from dataall.core.permissions.db import permission_models as models
 from dataall.core.permissions.db.permission_models import PermissionType
 from dataall.core.permissions.db.tenant_policy_repositories import TenantPolicy
+from dataall.core.permissions.db.tenant_repositories import Tenant
 from dataall.base.db import exceptions
-from dataall.core.permissions.permissions import MANAGE_GROUPS, ENVIRONMENT_ALL, ORGANIZATION_ALL, TENANT_ALL
+from dataall.core.permissions.permissions import MANAGE_GROUPS, ENVIRONMENT_ALL, ORGANIZATION_ALL, TENANT_ALL, \
+    GET_ORGANIZATION
 
 
 def permissions(db, all_perms):
@@ -60,3 +70,163 @@ def test_unauthorized_tenant_policy(db, group):
                 permission_name='UNKNOW_PERMISSION',
                 tenant_name='dataall',
             )
+
+
+def test_resource_permission_checks_are_cached_per_request(db, group, mocker):
+    @has_resource_permission(GET_ORGANIZATION)
+    def get_resource(uri):
+        return uri
+
+    load_spy = mocker.spy(ResourcePolicy, 'get_groups_resource_permissions')
+    set_context(RequestContext(db, 'alice', [group.name], 'alice'))
+    try:
+        with pytest.raises(exceptions.ResourceUnauthorized):
+            get_resource(uri='cached-resource')
+
+        with db.scoped_session() as session:
+            ResourcePolicy.attach_resource_policy(
+                session=session,
+                group=group.name,
+                permissions=[GET_ORGANIZATION],
+                resource_uri='cached-resource',
+                resource_type='Organization',
+            )
+
+        for _ in range(5):
+            assert get_resource(uri='cached-resource') == 'cached-resource'
+        assert load_spy.call_count == 2
+
+        with db.scoped_session() as session:
+            ResourcePolicy.delete_resource_policy(
+                session=session, group=group.name, resource_uri='cached-resource'
+            )
+
+        with pytest.raises(exceptions.ResourceUnauthorized):
+            get_resource(uri='cached-resource')
+        assert load_spy.call_count == 3
+    finally:
+        dispose_context()
+
+
+def test_permissions_upsert_is_skipped_when_fingerprint_matches(db, mocker):
+    init_spy = mocker.spy(Permission, 'init_permissions')
+    tenant_spy = mocker.spy(Tenant, 'save_tenant')
+    with db.scoped_session() as session:
+        fingerprint = permissions_fingerprint(Permission.list_permission_definitions(session))
+    assert fingerprint == permissions_fingerprint()
+
+    save_permissions_with_tenant(db, fingerprint=fingerprint)
+    assert init_spy.call_count == 0
+    assert tenant_spy.call_count == 1
+
+    save_permissions_with_tenant(db, fingerprint='outdated')
+    assert init_spy.call_count == 1
+    assert tenant_spy.call_count == 2
+
+
+def test_changed_permission_descriptions_are_updated(db):
+    with db.scoped_session() as session:
+        permission = Permission.find_permission_by_name(session, MANAGE_GROUPS, PermissionType.TENANT.name)
+        description = permission.description
+        permission.description = 'Outdated description'
+        session.commit()
+        outdated = permissions_fingerprint(Permission.list_permission_definitions(session))
+    assert outdated != permissions_fingerprint()
+
+    with db.scoped_session() as session:
+        assert Permission.init_permissions(session) == []
+
+    with db.scoped_session() as session:
+        permission = Permission.find_permission_by_name(session, MANAGE_GROUPS, PermissionType.TENANT.name)
+        assert permission.description == description
+        assert permissions_fingerprint(Permission.list_permission_definitions(session)) == permissions_fingerprint()
+
+
+def test_attach_and_detach_resource_policies(db):
+    with db.scoped_session() as session:
+        added = ResourcePolicy.attach_resource_policies(
+            session,
+            [
+                ('bulk-group1', 'bulk-resource1', [GET_ORGANIZATION]),
+                ('bulk-group1', 'bulk-resource2', [GET_ORGANIZATION]),
+                ('bulk-group2', 'bulk-resource1', [GET_ORGANIZATION]),
+            ],
+            resource_type='Organization',
+        )
+        assert added == 3
+        assert ResourcePolicy.has_group_resource_permission(session, 'bulk-group1', 'bulk-resource2', GET_ORGANIZATION)
+
+        # attaching again is a no-op, a single policy is kept per group and resource
+        added = ResourcePolicy.attach_resource_policies(
+            session, [('bulk-group1', 'bulk-resource1', [GET_ORGANIZATION])], resource_type='Organization'
+        )
+        assert added == 0
+        policy = ResourcePolicy.attach_resource_policy(
+            session, 'bulk-group1', [GET_ORGANIZATION], 'bulk-resource1', 'Organization'
+        )
+        assert [p.permission.name for p in policy.permissions] == [GET_ORGANIZATION]
+
+        assert ResourcePolicy.detach_resource_policies(
+            session, [('bulk-group1', 'bulk-resource1'), ('bulk-group2', 'bulk-resource1')]
+        ) == 2
+        assert not ResourcePolicy.find_resource_policy(session, 'bulk-group1', 'bulk-resource1')
+        assert ResourcePolicy.find_resource_policy(session, 'bulk-group1', 'bulk-resource2')
+
+
+def test_attach_resource_policies_with_unknown_permission(db):
+    with db.scoped_session() as session:
+        with pytest.raises(exceptions.ObjectNotFound):
+            ResourcePolicy.attach_resource_policies(
+                session, [('bulk-group1', 'bulk-resource3', ['UNKNOWN'])], resource_type='Organization'
+            )
+
+
+def test_permission_lookups_use_the_catalog(db, mocker):
+    save_permissions_with_tenant(db)
+    load_spy = mocker.spy(PermissionCatalog, 'load')
+    with db.scoped_session() as session:
+        permission = Permission.lookup(session, MANAGE_GROUPS, PermissionType.TENANT.name)
+        assert permission.type == PermissionType.TENANT
+        assert Permission.lookup_by_uri(session, permission.permissionUri) == permission
+        assert not Permission.lookup(session, MANAGE_GROUPS, PermissionType.RESOURCE.name)
+        assert load_spy.call_count == 1  # the unknown (name, type) pair reloads the catalog once
+
+        assert not Permission.init_permissions(session)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            permission.name = 'OTHER'
+
+
+def test_permission_writes_get_the_orm_row(db):
+    save_permissions_with_tenant(db)
+    with db.scoped_session() as session:
+        permission = Permission.get_permission_by_name(session, MANAGE_GROUPS, PermissionType.TENANT.name)
+        assert isinstance(permission, models.Permission)
+        assert Permission.get_permission_by_uri(
+            session, permission.permissionUri, PermissionType.TENANT.name
+        ) is permission
+
+
+def test_ensure_group_tenant_policies(db, tenant, mocker):
+    with db.scoped_session() as session:
+        TenantPolicy.attach_group_tenant_policy(session, 'ensure-existing', [MANAGE_GROUPS], 'dataall')
+
+        created = TenantPolicy.ensure_group_tenant_policies(
+            session, ['ensure-existing', 'ensure-new1', 'ensure-new2', 'ensure-new1'], TENANT_ALL, 'dataall'
+        )
+        assert created == ['ensure-new1', 'ensure-new2']
+        assert {p.name for p in TenantPolicy.get_tenant_policy_permissions(session, 'ensure-new2', 'dataall')} == set(
+            TENANT_ALL
+        )
+        # the policy of an existing group is left untouched
+        assert [p.name for p in TenantPolicy.get_tenant_policy_permissions(session, 'ensure-existing', 'dataall')] == [
+            MANAGE_GROUPS
+        ]
+
+        # known groups don't hit the database
+        execute_spy = mocker.spy(session, 'execute')
+        query_spy = mocker.spy(session, 'query')
+        assert TenantPolicy.ensure_group_tenant_policies(
+            session, ['ensure-new1', 'ensure-existing'], TENANT_ALL, 'dataall'
+        ) == []
+        assert execute_spy.call_count == 0
+        assert query_spy.call_count == 0
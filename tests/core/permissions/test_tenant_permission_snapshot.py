@@ -0,0 +1,99 @@
+import logging
+import time
+
+from sqlalchemy import event
+
+from dataall.core.permissions.db.tenant_permission_snapshot import (
+    TenantPermissionSnapshot,
+    get_tenant_permission_snapshot,
+)
+from dataall.core.permissions.db.tenant_policy_repositories import TenantPolicy
+from dataall.core.permissions.permissions import MANAGE_GROUPS, MANAGE_ENVIRONMENTS, MANAGE_ORGANIZATIONS
+
+log = logging.getLogger(__name__)
+
+
+def test_snapshot_is_rebuilt_when_tenant_policies_change(db, tenant, mocker):
+    build_spy = mocker.spy(TenantPermissionSnapshot, 'build')
+    with db.scoped_session() as session:
+        TenantPolicy.attach_group_tenant_policy(session, 'snapshot-group', [MANAGE_GROUPS], 'dataall')
+        snapshot = get_tenant_permission_snapshot(session, 'dataall')
+        assert snapshot.has_policy('snapshot-group')
+        assert snapshot.has_permission(['other-group', 'snapshot-group'], MANAGE_GROUPS)
+        assert not snapshot.has_permission(['snapshot-group'], MANAGE_ENVIRONMENTS)
+        assert not snapshot.has_permission(['snapshot-group'], 'UNKNOWN_PERMISSION')
+
+        assert get_tenant_permission_snapshot(session, 'dataall') is snapshot
+        assert build_spy.call_count == 1
+
+        TenantPolicy.update_group_permissions(
+            session, 'admin', ['DAAdministrators'], 'snapshot-group',
+            data={'permissions': [MANAGE_ENVIRONMENTS]},
+        )
+        updated = get_tenant_permission_snapshot(session, 'dataall')
+        assert updated.version > snapshot.version
+        assert updated.permission_names(['snapshot-group']) == [MANAGE_ENVIRONMENTS]
+        assert build_spy.call_count == 2
+
+        TenantPolicy.delete_tenant_policy(session, 'snapshot-group', 'dataall')
+        assert not get_tenant_permission_snapshot(session, 'dataall').has_policy('snapshot-group')
+
+
+def test_snapshot_checks_query_the_policies_once(db, tenant):
+    groups = [f'snapshot-check-group-{i}' for i in range(5)]
+    checks = [MANAGE_GROUPS, MANAGE_ORGANIZATIONS] * 5
+    with db.scoped_session() as session:
+        for group in groups:
+            TenantPolicy.attach_group_tenant_policy(session, group, [MANAGE_GROUPS], 'dataall')
+        session.flush()
+
+        statements = []
+
+        def count_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', count_statement)
+        try:
+            requests = []
+            for _ in range(3):
+                granted = TenantPolicy.get_groups_tenant_permissions(session, groups, 'dataall')
+                requests.append([permission in granted for permission in checks])
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', count_statement)
+
+    assert requests == [[True, False] * 5] * 3
+    policy_queries = [s for s in statements if 'tenant_policy_permission' in s]
+    assert len(policy_queries) == 1  # the snapshot is built once, the checks are bit tests
+    assert len(statements) == 3 + 1  # one version lookup per request and the snapshot build
+
+
+def test_snapshot_checks_benchmark(db, tenant):
+    """
+    Micro-benchmark of the tenant permission checks of a request: a SQL join per check against
+    one version lookup per request and bit tests of the snapshot. Run with --log-cli-level=INFO to see the timings
+    """
+    groups = [f'benchmark-group-{i}' for i in range(5)]
+    requests, checks = 50, 10
+    with db.scoped_session() as session:
+        for group in groups:
+            TenantPolicy.attach_group_tenant_policy(session, group, [MANAGE_GROUPS], 'dataall')
+
+        started = time.perf_counter()
+        for _ in range(requests):
+            sql_results = [
+                bool(TenantPolicy.has_user_tenant_permission(session, 'alice', groups, 'dataall', permission))
+                for permission in [MANAGE_GROUPS, MANAGE_ORGANIZATIONS] * (checks // 2)
+            ]
+        sql_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(requests):
+            granted = TenantPolicy.get_groups_tenant_permissions(session, groups, 'dataall')
+            snapshot_results = [
+                permission in granted for permission in [MANAGE_GROUPS, MANAGE_ORGANIZATIONS] * (checks // 2)
+            ]
+        snapshot_elapsed = time.perf_counter() - started
+
+    log.info(f'{requests * checks} tenant permission checks: SQL {sql_elapsed:.4f}s, snapshot {snapshot_elapsed:.4f}s')
+    # the timings are only reported, the checks of both paths must agree
+    assert sql_results == snapshot_results == [True, False] * (checks // 2)
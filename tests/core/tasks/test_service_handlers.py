@@ -0,0 +1,130 @@
+import threading
+
+import pytest
+
+from dataall.base.context import RequestContext, dispose_context, get_context, set_context
+from dataall.core.tasks.db.task_models import Task
+from dataall.core.tasks.service_handlers import WorkerHandler
+
+
+@pytest.fixture
+def worker():
+    worker = WorkerHandler(max_workers=4)
+    threads = set()
+
+    @worker.handler(path='test.echo')
+    def echo(engine, task: Task):
+        threads.add(threading.get_ident())
+        return {'target': task.targetUri}
+
+    @worker.handler(path='test.fail', max_concurrency=1)
+    def fail(engine, task: Task):
+        raise Exception('failed')
+
+    barrier = threading.Barrier(4, timeout=10)
+
+    @worker.handler(path='test.wait')
+    def wait(engine, task: Task):
+        threads.add(threading.get_ident())
+        barrier.wait()
+
+    worker.threads = threads
+    return worker
+
+
+def _create_tasks(db, *actions):
+    with db.scoped_session() as session:
+        tasks = [Task(action=action, targetUri=f'target{i}') for i, action in enumerate(actions)]
+        session.add_all(tasks)
+        session.commit()
+        return [task.taskUri for task in tasks]
+
+
+def test_process_all_tasks(db, worker):
+    task_ids = _create_tasks(db, 'test.echo', 'test.echo', 'test.fail', 'test.unknown')
+    responses = worker.process(db, task_ids)
+
+    assert [r['status'] for r in responses] == ['completed', 'completed', 'failed']
+    with db.scoped_session() as session:
+        statuses = {task.taskUri: task.status for task in session.query(Task).filter(Task.taskUri.in_(task_ids))}
+        assert [statuses[taskid] for taskid in task_ids] == ['completed', 'completed', 'failed', 'pending']
+        assert session.query(Task).get(task_ids[0]).response == {'target': 'target0'}
+
+
+def test_process_skips_started_tasks(db, worker):
+    task_ids = _create_tasks(db, 'test.echo')
+    worker.process(db, task_ids)
+    assert worker.process(db, task_ids) == []
+
+
+def test_process_concurrently(db, worker):
+    task_ids = _create_tasks(db, *['test.wait'] * 8)
+    responses = worker.process(db, task_ids)
+    assert all(r['status'] == 'completed' for r in responses)
+    assert len(worker.threads) == 4
+
+
+def test_outbox_sends_deduplicated_tasks_once(db, worker, mocker):
+    worker.sender = mocker.MagicMock()
+    with db.scoped_session() as session:
+        tasks = [Task(action='test.echo', targetUri=target) for target in ['a', 'a', 'b']]
+        session.add_all(tasks)
+        session.commit()
+        task_ids = [task.taskUri for task in tasks]
+
+    with worker.outbox(db):
+        for taskid in task_ids:
+            worker.queue(db, [taskid])
+        worker.sender.assert_not_called()
+
+    worker.sender.assert_called_once_with(db, [task_ids[0], task_ids[2]])
+    with db.scoped_session() as session:
+        assert session.query(Task).get(task_ids[1]).status == 'skipped'
+
+    worker.queue(db, [task_ids[0]])
+    assert worker.sender.call_count == 2
+
+
+def test_outbox_does_not_raise_send_failures(db, worker, mocker):
+    worker.sender = mocker.MagicMock(side_effect=Exception('queue unavailable'))
+    task_ids = _create_tasks(db, 'test.echo')
+
+    with worker.outbox(db):
+        worker.queue(db, task_ids)
+
+    worker.sender.assert_called_once()
+    with db.scoped_session() as session:
+        assert session.query(Task).get(task_ids[0]).status == 'pending'
+
+
+def test_process_retries_failed_tasks_only_when_asked(db, worker):
+    task_ids = _create_tasks(db, 'test.fail')
+    assert [r['status'] for r in worker.process(db, task_ids)] == ['failed']
+    assert worker.process(db, task_ids) == []
+    assert [r['status'] for r in worker.process(db, task_ids, retry_failed=True)] == ['failed']
+
+
+def test_process_puts_tasks_back_to_pending_when_the_status_is_not_saved(db, worker, mocker):
+    task_ids = _create_tasks(db, 'test.echo')
+    mocker.patch.object(WorkerHandler, 'update_tasks', side_effect=Exception('database unavailable'))
+
+    with pytest.raises(Exception, match='database unavailable'):
+        worker.process(db, task_ids)
+    with db.scoped_session() as session:
+        assert session.query(Task).get(task_ids[0]).status == 'pending'
+
+
+def test_process_runs_the_handlers_in_the_request_context(db, worker):
+    contexts = []
+
+    @worker.handler(path='test.context')
+    def context_handler(engine, task: Task):
+        contexts.append(get_context())
+
+    context = RequestContext(db, 'alice', ['testadmins'], 'alice')
+    set_context(context)
+    try:
+        worker.process(db, _create_tasks(db, 'test.context', 'test.context'))
+    finally:
+        dispose_context()
+    assert contexts == [context, context]
@@ -0,0 +1,42 @@
+from dataall.modules.catalog.indexers.base_indexer import BulkIndexWriter
+
+
+def test_bulk_writer_batches_by_size(mocker):
+    bulk = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer._bulk', return_value={})
+    with BulkIndexWriter(batch_size=2) as writer:
+        for i in range(5):
+            writer.index(doc_id=f'doc{i}', doc={'name': f'doc{i}'})
+        writer.delete(doc_id='deleted')
+
+    assert bulk.call_count == 3
+    body = bulk.call_args_list[0].args[0]
+    assert body[0] == {'index': {'_id': 'doc0'}}
+    assert body[1]['name'] == 'doc0'
+    assert bulk.call_args_list[2].args[0] == [{'index': {'_id': 'doc4'}}, {'name': 'doc4', '_indexed': mocker.ANY}, {'delete': {'_id': 'deleted'}}]
+    assert writer.indexed == 5
+    assert writer.deleted == 1
+
+
+def test_bulk_writer_batches_by_bytes(mocker):
+    bulk = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer._bulk', return_value={})
+    with BulkIndexWriter(batch_size=100, batch_bytes=200) as writer:
+        for i in range(3):
+            writer.index(doc_id=f'doc{i}', doc={'description': 'x' * 100})
+    assert bulk.call_count == 3
+
+
+def test_bulk_writer_counts_failures(mocker):
+    mocker.patch(
+        'dataall.modules.catalog.indexers.base_indexer.BaseIndexer._bulk',
+        return_value={
+            'errors': True,
+            'items': [
+                {'index': {'_id': 'doc0', 'status': 400, 'error': {'type': 'mapper_parsing_exception'}}},
+                {'delete': {'_id': 'missing', 'status': 404, 'error': 'not_found'}},
+            ],
+        },
+    )
+    with BulkIndexWriter() as writer:
+        writer.index(doc_id='doc0', doc={})
+        writer.delete(doc_id='missing')
+    assert writer.failed == 1
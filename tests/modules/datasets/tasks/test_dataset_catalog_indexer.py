@@ -59,3 +59,50 @@ def test_catalog_indexer(db, org, env, sync_dataset, table, mocker):
         engine=db
     )
     assert indexed_objects_counter == 2
+
+
+def test_catalog_indexer_bulk_requests(db, sync_dataset, table, mocker):
+    bulk = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer._bulk', return_value={})
+    index = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer._index')
+    index_objects(engine=db, full_rebuild=True)
+
+    index.assert_not_called()
+    doc_ids = [line['index']['_id'] for call in bulk.call_args_list for line in call.args[0] if 'index' in line]
+    assert doc_ids.count(sync_dataset.datasetUri) == 1
+    assert table.tableUri in doc_ids
+
+
+def test_catalog_indexer_incremental(db, sync_dataset, table, mocker):
+    bulk = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer._bulk', return_value={})
+    index_objects(engine=db, full_rebuild=True)
+
+    bulk.reset_mock()
+    assert index_objects(engine=db) == 0
+
+    with db.scoped_session() as session:
+        session.query(DatasetTable).get(table.tableUri).description = 'changed'
+
+    assert index_objects(engine=db) == 2
+    doc_ids = [line['index']['_id'] for call in bulk.call_args_list for line in call.args[0] if 'index' in line]
+    assert sorted(doc_ids) == sorted([table.tableUri, sync_dataset.datasetUri])
+
+
+def test_catalog_indexer_retries_failed_documents(db, sync_dataset, table, mocker):
+    bulk = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer._bulk', return_value={})
+    alarm = mocker.patch('dataall.modules.catalog.tasks.catalog_indexer_task.AlarmService')
+    index_objects(engine=db, full_rebuild=True)
+
+    with db.scoped_session() as session:
+        session.query(DatasetTable).get(table.tableUri).description = 'failed to index'
+
+    bulk.return_value = {
+        'errors': True,
+        'items': [{'index': {'_id': table.tableUri, 'status': 400, 'error': {'type': 'mapper_parsing_exception'}}}],
+    }
+    with pytest.raises(Exception, match='DatasetCatalogIndexer'):
+        index_objects(engine=db)
+    alarm().trigger_catalog_indexing_failure_alarm.assert_called_once()
+
+    # the changes are indexed again by the next run
+    bulk.return_value = {}
+    assert index_objects(engine=db) == 2
@@ -1,6 +1,9 @@
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
+from dataall.modules.datasets.db.dataset_table_repositories import DatasetTableRepository
+from dataall.modules.datasets_base.db.dataset_repositories import DatasetRepository
 from dataall.modules.datasets_base.db.dataset_models import DatasetTable
 from dataall.modules.datasets.tasks.tables_syncer import sync_tables
 
@@ -106,3 +109,71 @@ def test_tables_sync(db, org, env, sync_dataset, table_fixture, mocker):
         )
         assert saved_table
         assert saved_table.GlueTableName == 'table1'
+
+
+def test_tables_sync_skips_unchanged_datasets(db, org, env, sync_dataset, mocker):
+    mock_crawler = MagicMock()
+    mocker.patch('dataall.modules.datasets.tasks.tables_syncer.DatasetCrawler', mock_crawler)
+    mocker.patch('dataall.base.aws.sts.SessionHelper.get_delegation_role_arn', return_value='arn:role')
+    mocker.patch('dataall.modules.datasets.tasks.tables_syncer.is_assumable_pivot_role', return_value=True)
+    mock_client = MagicMock()
+    mocker.patch('dataall.modules.datasets.tasks.tables_syncer.LakeFormationTableClient', mock_client)
+
+    update_time = datetime(2023, 10, 1, 12, 0, tzinfo=timezone.utc)
+    mock_crawler().list_glue_database_tables.return_value = [
+        {
+            'Name': name,
+            'DatabaseName': sync_dataset.GlueDatabaseName,
+            'UpdateTime': update_time,
+            'StorageDescriptor': {
+                'Columns': [{'Name': 'col1', 'Type': 'string'}],
+                'Location': f's3://{sync_dataset.S3BucketName}/{name}',
+            },
+        }
+        for name in ['new_table', 'table1']
+    ]
+
+    grant = mock_client.grant_principals_all_tables_permissions
+    assert len(sync_tables(engine=db, skip_unchanged=True)) == 2
+    grant.assert_called_once()
+
+    assert sync_tables(engine=db, skip_unchanged=True) == []
+    grant.assert_called_once()
+
+    mock_crawler().list_glue_database_tables.return_value[0]['UpdateTime'] = datetime.now(timezone.utc)
+    assert len(sync_tables(engine=db, skip_unchanged=True)) == 2
+    assert grant.call_count == 2
+
+
+def test_tables_sync_continues_after_a_failed_dataset(
+        db, create_dataset, org_fixture, env_fixture, sync_dataset, mocker
+):
+    other_dataset = create_dataset(org_fixture, env_fixture, 'other_dataset')
+    mock_crawler = MagicMock()
+    mocker.patch('dataall.modules.datasets.tasks.tables_syncer.DatasetCrawler', mock_crawler)
+    mocker.patch('dataall.base.aws.sts.SessionHelper.get_delegation_role_arn', return_value='arn:role')
+    mocker.patch('dataall.modules.datasets.tasks.tables_syncer.is_assumable_pivot_role', return_value=True)
+    mocker.patch('dataall.modules.datasets.tasks.tables_syncer.LakeFormationTableClient')
+    mock_crawler().list_glue_database_tables.return_value = [
+        {
+            'Name': 'synced_table',
+            'StorageDescriptor': {'Columns': [{'Name': 'col1', 'Type': 'string'}], 'Location': 's3://bucket/table'},
+        }
+    ]
+
+    get_dataset_by_uri = DatasetRepository.get_dataset_by_uri
+
+    def failing_get_dataset_by_uri(session, dataset_uri):
+        if dataset_uri == sync_dataset.datasetUri:
+            # a database error leaves the transaction of the dataset aborted
+            session.execute('SELECT * FROM not_a_table')
+        return get_dataset_by_uri(session, dataset_uri)
+
+    mocker.patch.object(DatasetRepository, 'get_dataset_by_uri', side_effect=failing_get_dataset_by_uri)
+
+    processed_tables = sync_tables(engine=db)
+
+    assert [table.GlueTableName for table in processed_tables] == ['synced_table']
+    with db.scoped_session() as session:
+        tables = DatasetTableRepository.find_dataset_tables(session, other_dataset.datasetUri)
+        assert [table.GlueTableName for table in tables] == ['synced_table']
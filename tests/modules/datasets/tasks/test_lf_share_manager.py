@@ -7,6 +7,7 @@ from unittest.mock import MagicMock
 
 import boto3
 import pytest
+from botocore.exceptions import ClientError
 
 from typing import Callable
 
@@ -17,6 +18,7 @@ from dataall.modules.dataset_sharing.api.enums import ShareItemStatus
 from dataall.modules.dataset_sharing.db.share_object_models import ShareObject, ShareObjectItem
 from dataall.modules.datasets_base.db.dataset_models import DatasetTable, Dataset
 from dataall.modules.dataset_sharing.services.dataset_alarm_service import DatasetAlarmService
+from dataall.modules.dataset_sharing.aws.lakeformation_client import LakeFormationBatch, LakeFormationClient
 
 from dataall.modules.dataset_sharing.services.share_processors.lf_process_cross_account_share import ProcessLFCrossAccountShare
 from dataall.modules.dataset_sharing.services.share_processors.lf_process_same_account_share import ProcessLFSameAccountShare
@@ -722,3 +724,181 @@ def test_handle_revoke_failure(
 
     # Then
     alarm_service_mock.assert_called_once()
+
+
+def test_process_approved_shares_cross_account(
+        db,
+        table: Callable,
+        share_item_table: Callable,
+        dataset1: Dataset,
+        share_cross_account: ShareObject,
+        share_item_cross_account: ShareObjectItem,
+        table1: DatasetTable,
+        source_environment: Environment,
+        target_environment: Environment,
+        target_environment_group: EnvironmentGroup,
+        mocker,
+):
+    # Given
+    missing_table = table(dataset=dataset1, label="missing_table")
+    missing_item = share_item_table(
+        share=share_cross_account, table=missing_table, status=ShareItemStatus.Share_Approved.value
+    )
+    with db.scoped_session() as session:
+        processor = ProcessLFCrossAccountShare(
+            session,
+            dataset1,
+            share_cross_account,
+            [table1, missing_table],
+            [],
+            source_environment,
+            target_environment,
+            target_environment_group,
+        )
+        mocker.patch.object(processor, "grant_pivot_role_all_database_permissions")
+        mocker.patch.object(processor, "create_shared_database")
+
+        def check_exists(share_item, table):
+            if table.tableUri == missing_table.tableUri:
+                raise Exception("table not found")
+
+        mocker.patch.object(processor, "check_share_item_exists_on_glue_catalog", side_effect=check_exists)
+        share_mock = mocker.patch.object(processor, "share_tables_with_target_account", return_value={})
+        link_mock = mocker.patch.object(processor, "create_resource_link")
+        ram_mock = mocker.patch(
+            "dataall.modules.dataset_sharing.aws.ram_client.RamClient.accept_ram_invitations",
+            return_value=[table1.GlueTableName],
+        )
+        failure_mock = mocker.patch.object(processor, "handle_share_failure")
+
+        # When
+        assert not processor.process_approved_shares()
+
+        # Then the invitations of all tables are accepted at once and the expired one is shared again
+        assert ram_mock.call_count == 2
+        assert ram_mock.call_args_list[0].args[2] == [table1.GlueTableName]
+        assert share_mock.call_count == 2
+        assert share_mock.call_args_list[0].args[0] == [table1]
+        link_mock.assert_called_once()
+        failure_mock.assert_called_once()
+        assert failure_mock.call_args.kwargs["table"] == missing_table
+
+        session.expire_all()
+        statuses = {
+            item.shareItemUri: item.status
+            for item in session.query(ShareObjectItem).filter(
+                ShareObjectItem.shareItemUri.in_([share_item_cross_account.shareItemUri, missing_item.shareItemUri])
+            )
+        }
+        assert statuses == {
+            share_item_cross_account.shareItemUri: ShareItemStatus.Share_Succeeded.value,
+            missing_item.shareItemUri: ShareItemStatus.Share_Failed.value,
+        }
+
+
+def test_lakeformation_batch_maps_failures_to_entries():
+    # Given
+    client = MagicMock()
+
+    def batch_grant_permissions(Entries, **kwargs):
+        return {
+            'Failures': [
+                {'RequestEntry': entry, 'Error': {'ErrorCode': 'AccessDeniedException', 'ErrorMessage': 'denied'}}
+                for entry in Entries
+                if entry['Resource']['Table']['Name'] == 'table_7'
+            ]
+        }
+
+    client.batch_grant_permissions.side_effect = batch_grant_permissions
+    # revoking a permission that is not granted is not a failure
+    client.batch_revoke_permissions.side_effect = lambda Entries, **kwargs: {
+        'Failures': [
+            {'RequestEntry': entry, 'Error': {'ErrorCode': 'InvalidInputException', 'ErrorMessage': 'No permissions revoked'}}
+            for entry in Entries
+        ]
+    }
+    batch = LakeFormationBatch(client, SOURCE_ENV_ACCOUNT)
+    for i in range(45):
+        batch.grant('principal', {'Table': {'DatabaseName': 'db', 'Name': f'table_{i}'}}, ['ALL'], key=f'table_{i}')
+    batch.revoke('principal', {'Table': {'DatabaseName': 'db', 'Name': 'table_0'}}, ['ALL'], key='table_0')
+
+    # When
+    results = batch.execute()
+
+    # Then
+    assert client.batch_grant_permissions.call_count == 3
+    assert [len(call.kwargs['Entries']) for call in client.batch_grant_permissions.call_args_list] == [20, 20, 5]
+    assert len(results) == 46
+    assert list(LakeFormationBatch.errors_by_key(results)) == ['table_7']
+
+
+def test_revoke_source_table_access_batches_the_revokes(mocker):
+    # Given
+    client = MagicMock()
+    client.batch_revoke_permissions.return_value = {'Failures': []}
+    mocker.patch(
+        'dataall.modules.dataset_sharing.aws.lakeformation_client.SessionHelper.remote_session',
+        return_value=MagicMock(client=MagicMock(return_value=client)),
+    )
+    data = dict(
+        target_accountid=TARGET_ACCOUNT_ENV,
+        region='eu-west-1',
+        target_principals=['principal1', 'principal2'],
+        source_database='db',
+        source_table='table',
+        source_accountid=SOURCE_ENV_ACCOUNT,
+    )
+
+    # When
+    LakeFormationClient.revoke_source_table_access(**data)
+
+    # Then
+    client.revoke_permissions.assert_not_called()
+    client.batch_revoke_permissions.assert_called_once()
+    entries = client.batch_revoke_permissions.call_args.kwargs['Entries']
+    assert [(entry['Principal']['DataLakePrincipalIdentifier'], entry['Permissions']) for entry in entries] == [
+        ('principal1', ['DESCRIBE']),
+        ('principal1', ['SELECT']),
+        ('principal2', ['DESCRIBE']),
+        ('principal2', ['SELECT']),
+    ]
+
+    # When a revoke fails for a principal
+    client.batch_revoke_permissions.side_effect = lambda Entries, **kwargs: {
+        'Failures': [
+            {'RequestEntry': entry, 'Error': {'ErrorCode': 'AccessDeniedException', 'ErrorMessage': 'denied'}}
+            for entry in Entries
+            if entry['Principal']['DataLakePrincipalIdentifier'] == 'principal2'
+        ]
+    }
+
+    # Then
+    with pytest.raises(ClientError):
+        LakeFormationClient.revoke_source_table_access(**data)
+
+
+def test_share_tables_with_target_account_ignores_failed_grants(
+        processor_cross_account, table1: DatasetTable, table2: DatasetTable, mocker
+):
+    # Given the grant of table2 to the target account fails
+    client = MagicMock()
+    client.batch_revoke_permissions.return_value = {'Failures': []}
+    client.batch_grant_permissions.side_effect = lambda Entries, **kwargs: {
+        'Failures': [
+            {'RequestEntry': entry, 'Error': {'ErrorCode': 'AccessDeniedException', 'ErrorMessage': 'denied'}}
+            for entry in Entries
+            if entry['Resource']['Table']['Name'] == table2.GlueTableName
+        ]
+    }
+    mocker.patch(
+        'dataall.base.aws.sts.SessionHelper.remote_session',
+        return_value=MagicMock(client=MagicMock(return_value=client)),
+    )
+    mocker.patch('time.sleep')
+
+    # When
+    processor_cross_account.share_tables_with_target_account([table1, table2])
+
+    # Then the failure is only logged, like with the single table grant
+    client.batch_grant_permissions.assert_called_once()
+    assert len(client.batch_grant_permissions.call_args.kwargs['Entries']) == 2
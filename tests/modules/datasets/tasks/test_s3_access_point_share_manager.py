@@ -12,6 +12,7 @@ from dataall.modules.dataset_sharing.aws.s3_client import S3ControlClient
 from dataall.modules.dataset_sharing.db.share_object_models import ShareObject, ShareObjectItem
 
 from dataall.modules.dataset_sharing.services.share_managers import S3AccessPointShareManager
+from dataall.modules.dataset_sharing.services.share_managers.policy_document_manager import PolicyDocumentManager
 from dataall.modules.datasets_base.db.dataset_models import DatasetStorageLocation, Dataset
 
 SOURCE_ENV_ACCOUNT = "111111111111"
@@ -1444,4 +1445,82 @@ def test_delete_dataset_bucket_key_policy_existing_policy_with_no_additional_tar
         kms_client().put_key_policy.assert_called_with(
             kms_client().get_key_id.return_value,
             json.dumps(remaining_policy)
-        )
\ No newline at end of file
+        )
+
+
+def test_access_point_policy_is_written_once_per_share_run(
+    mocker,
+    location: Callable,
+    share_item_folder: Callable,
+    source_environment_group: EnvironmentGroup,
+    target_environment_group: EnvironmentGroup,
+    dataset1: Dataset,
+    db,
+    share1: ShareObject,
+    share_item_folder1: ShareObjectItem,
+    location1: DatasetStorageLocation,
+    source_environment: Environment,
+    target_environment: Environment,
+):
+    # Given an access point policy already granting another prefix and two folders of the share
+    access_point_arn = "existing-access-point-arn"
+    s3_control_client = mock_s3_control_client(mocker)
+    s3_control_client().get_bucket_access_point_arn.return_value = access_point_arn
+    stored = {"policy": json.dumps(
+        _generate_ap_policy_object(access_point_arn, [[target_environment.SamlGroupName, ["existing-prefix"]]])
+    )}
+    s3_control_client().get_access_point_policy.side_effect = lambda access_point_name: stored["policy"]
+    s3_control_client().attach_access_point_policy.side_effect = \
+        lambda access_point_name, policy: stored.update(policy=policy)
+    mocker.patch(
+        "dataall.base.aws.sts.SessionHelper.get_role_id",
+        return_value=target_environment.SamlGroupName,
+    )
+    location2 = location(dataset1, "location2")
+    share_item_folder(share1, location2)
+
+    def share_run(folders, edit):
+        documents = PolicyDocumentManager()
+        with db.scoped_session() as session:
+            for folder in folders:
+                edit(S3AccessPointShareManager(
+                    session,
+                    dataset1,
+                    share1,
+                    folder,
+                    source_environment,
+                    target_environment,
+                    source_environment_group,
+                    target_environment_group,
+                    policy_documents=documents,
+                ))
+            assert not s3_control_client().attach_access_point_policy.called
+            return documents.flush()
+
+    # When both folders are shared in one run, the policy is fetched once, checked and written once
+    assert share_run([location1, location2], S3AccessPointShareManager.manage_access_point_and_policy) == {}
+    assert s3_control_client().get_access_point_policy.call_count == 2
+    assert s3_control_client().attach_access_point_policy.call_count == 1
+    statements = {item["Sid"]: item for item in json.loads(stored["policy"])["Statement"]}
+    assert statements[f"{target_environment.SamlGroupName}0"]["Condition"]["StringLike"]["s3:prefix"] == [
+        "existing-prefix/*", f"{location1.S3Prefix}/*", f"{location2.S3Prefix}/*"
+    ]
+
+    # Then sharing the folders again does not write the unchanged policy
+    s3_control_client().attach_access_point_policy.reset_mock()
+    assert share_run([location1, location2], S3AccessPointShareManager.manage_access_point_and_policy) == {}
+    assert not s3_control_client().attach_access_point_policy.called
+
+    # And a policy changed by someone else during the run gets the edits of the run applied again
+    def revoke_while_policy_changes(manager):
+        manager.delete_access_point_policy()
+        policy = json.loads(stored["policy"])
+        policy["Statement"].append({"Sid": "AddedMeanwhile", "Effect": "Deny", "Principal": "*", "Action": "s3:*"})
+        stored["policy"] = json.dumps(policy)
+
+    assert share_run([location1], revoke_while_policy_changes) == {}
+    statements = {item["Sid"]: item for item in json.loads(stored["policy"])["Statement"]}
+    assert "AddedMeanwhile" in statements
+    assert statements[f"{target_environment.SamlGroupName}0"]["Condition"]["StringLike"]["s3:prefix"] == [
+        "existing-prefix/*", f"{location2.S3Prefix}/*"
+    ]
@@ -1,7 +1,9 @@
+import base64
 import typing
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy import event
 
 from dataall.base.config import config
 from dataall.core.environment.db.environment_models import Environment
@@ -539,3 +541,103 @@ def test_dataset_stack(client, dataset_fixture, group):
     dataset = dataset_fixture
     response = update_stack_query(client, dataset.datasetUri, 'dataset', dataset.SamlAdminGroupName)
     assert response.data.updateStack.targetUri == dataset.datasetUri
+
+
+def test_list_datasets_batches_nested_lookups(client, dataset, env_fixture, org_fixture, db, group, user):
+    for i in range(4):
+        dataset(org=org_fixture, env=env_fixture, name=f'batched{i}', owner=user.username, group=group.name)
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', count_statement)
+    try:
+        response = client.query(
+            """
+            query ListDatasets($filter:DatasetFilter){
+                listDatasets(filter:$filter){
+                    count
+                    nodes{
+                        datasetUri
+                        userRoleForDataset
+                        environment { environmentUri }
+                        organization { organizationUri }
+                        stack { stackUri }
+                    }
+                }
+            }
+            """,
+            filter={'page': 1, 'pageSize': 10},
+            username='bob',
+            groups=[group.name],
+        )
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', count_statement)
+
+    assert len(response.data.listDatasets.nodes) >= 4
+    for table in ['environment', 'organization', 'stack']:
+        lookups = [s for s in statements if s.startswith('SELECT') and f'\nFROM {table} \n' in s]
+        assert len(lookups) == 1, table
+
+
+def test_list_datasets_with_cursor(client, dataset, env_fixture, org_fixture, group, user):
+    for i in range(3):
+        dataset(org=org_fixture, env=env_fixture, name=f'cursor{i}', owner=user.username, group=group.name)
+    query = """
+        query ListDatasets($filter:DatasetFilter){
+            listDatasets(filter:$filter){
+                count
+                hasNext
+                endCursor
+                nodes{
+                    datasetUri
+                }
+            }
+        }
+    """
+    response = client.query(query, filter={'pageSize': 1000}, username='bob', groups=[group.name])
+    expected = response.data.listDatasets.count
+    assert expected >= 3
+
+    seen = []
+    after = ''
+    has_next = True
+    while has_next:
+        response = client.query(query, filter={'pageSize': 2, 'after': after}, username='bob', groups=[group.name])
+        page = response.data.listDatasets
+        assert page.count is None
+        seen += [node.datasetUri for node in page.nodes]
+        has_next, after = page.hasNext, page.endCursor
+
+    assert len(seen) == len(set(seen)) == expected
+
+    for count_mode in ['exact', 'estimate']:
+        response = client.query(
+            query, filter={'pageSize': 2, 'after': '', 'countMode': count_mode}, username='bob', groups=[group.name]
+        )
+        assert response.data.listDatasets.count is not None
+
+
+def test_list_datasets_with_invalid_cursor(client, group):
+    query = """
+        query ListDatasets($filter:DatasetFilter){
+            listDatasets(filter:$filter){
+                endCursor
+            }
+        }
+    """
+    for after in [
+        'not a cursor',
+        base64.urlsafe_b64encode(b'{"a": 1}').decode(),
+        base64.urlsafe_b64encode(b'[{"$dt": "yesterday"}, "uri"]').decode(),
+        base64.urlsafe_b64encode(b'[{"$dt": 1}, "uri"]').decode(),
+    ]:
+        response = client.query(query, filter={'pageSize': 2, 'after': after}, username='bob', groups=[group.name])
+        assert 'InvalidInput' in response.errors[0].message, after
+
+    response = client.query(
+        query, filter={'pageSize': 2, 'after': '', 'countMode': 'everything'}, username='bob', groups=[group.name]
+    )
+    assert response.errors
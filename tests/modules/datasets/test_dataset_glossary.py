@@ -1,6 +1,8 @@
 from typing import List
 
 from dataall.modules.catalog.db.glossary_models import TermLink
+from dataall.modules.catalog.db.glossary_repositories import GlossaryRepository
+from dataall.modules.catalog.indexers.registry import GlossaryRegistry
 from dataall.modules.datasets_base.db.dataset_models import DatasetTableColumn
 from tests.modules.catalog.test_glossary import *
 
@@ -108,3 +110,15 @@ def test_get_column_term_associations(t1, dataset_fixture, group, db, client):
     )
     assert r.data.getDataset.terms.nodes[0].nodeUri == t1.nodeUri
     assert r.data.getDataset.terms.nodes[0].label == t1.label
+
+
+def test_unlinking_terms_reindexes_the_target(db, t1, table_fixture, mocker):
+    reindex = mocker.patch.object(GlossaryRegistry, 'reindex')
+    with db.scoped_session() as session:
+        GlossaryRepository.set_glossary_terms_links(session, 'alice', table_fixture.tableUri, 'DatasetTable', [t1.nodeUri])
+        GlossaryRepository.set_glossary_terms_links(session, 'alice', table_fixture.tableUri, 'DatasetTable', [t1.nodeUri])
+        reindex.assert_not_called()
+
+        GlossaryRepository.set_glossary_terms_links(session, 'alice', table_fixture.tableUri, 'DatasetTable', [])
+        reindex.assert_called_once_with(session, 'DatasetTable', table_fixture.tableUri)
+        assert not session.query(TermLink).filter(TermLink.targetUri == table_fixture.tableUri).count()
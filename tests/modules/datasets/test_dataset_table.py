@@ -1,3 +1,4 @@
+from dataall.modules.datasets.db.dataset_table_repositories import DatasetTableRepository
 from dataall.modules.datasets.services.dataset_table_service import DatasetTableService
 from dataall.modules.datasets_base.db.dataset_models import DatasetTableColumn, DatasetTable, Dataset
 
@@ -265,6 +266,49 @@ def test_sync_tables_and_columns(client, table, dataset_fixture, db):
         assert deleted_table.LastGlueTableStatus == 'Deleted'
 
 
+
+def test_sync_table_columns_applies_differences(table, dataset_fixture, db):
+    def glue_table(columns, partitions):
+        return {
+            'Name': 'table3',
+            'StorageDescriptor': {'Columns': [{'Name': name, 'Type': type} for name, type in columns]},
+            'PartitionKeys': [{'Name': name, 'Type': type} for name, type in partitions],
+        }
+
+    def saved_columns(session, table_uri):
+        return {
+            (column.name, column.columnType): column
+            for column in session.query(DatasetTableColumn).filter(DatasetTableColumn.tableUri == table_uri)
+        }
+
+    with db.scoped_session() as session:
+        table3 = session.query(DatasetTable).filter(DatasetTable.name == 'table3').first()
+        DatasetTableRepository.sync_table_columns(
+            session, table3, glue_table([('a', 'string'), ('b', 'int')], [('p', 'string')])
+        )
+        before = saved_columns(session, table3.tableUri)
+        assert set(before) == {('a', 'column'), ('b', 'column'), ('p', 'partition_0')}
+        before[('a', 'column')].description = 'user description'
+        session.commit()
+
+        DatasetTableRepository.sync_table_columns(
+            session, table3, glue_table([('a', 'string'), ('b', 'int')], [('p', 'string')])
+        )
+        assert saved_columns(session, table3.tableUri)[('a', 'column')].description == 'user description'
+
+        DatasetTableRepository.sync_table_columns(
+            session, table3, glue_table([('a', 'string'), ('b', 'bigint'), ('c', 'date')], [])
+        )
+        session.expire_all()
+        after = saved_columns(session, table3.tableUri)
+        assert set(after) == {('a', 'column'), ('b', 'column'), ('c', 'column')}
+        assert after[('a', 'column')].columnUri == before[('a', 'column')].columnUri
+        assert after[('a', 'column')].description == 'user description'
+        assert after[('b', 'column')].columnUri == before[('b', 'column')].columnUri
+        assert after[('b', 'column')].typeName == 'bigint'
+        assert after[('c', 'column')].typeName == 'date'
+
+
 def test_delete_table(client, table, dataset_fixture, db, group):
     table_to_delete = table(
         dataset=dataset_fixture, name=f'table_to_update', username=dataset_fixture.owner
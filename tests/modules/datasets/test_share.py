@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from dataall.base.tracing import instrument_engine, trace_operation
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
 from dataall.core.organizations.db.organization_models import Organization
 from dataall.modules.dataset_sharing.api.enums import ShareableType, PrincipalType
@@ -996,6 +997,35 @@ def test_list_dataset_share_objects_approvers(
     assert list_dataset_share_objects_response.data.getDataset.shares.nodes[0].userRoleForShareObject == 'Approvers'
 
 
+def test_list_dataset_share_objects_statistics(
+        db, client, user, group, share2_item_pa, share3_item_shared, dataset1
+):
+    # Given a share with a pending item and a share with a shared item
+    with db.scoped_session() as session:
+        summaries = ShareObjectRepository.get_share_items_summaries(
+            session, [share2_item_pa.shareUri, share3_item_shared.shareUri]
+        )
+    assert summaries[share2_item_pa.shareUri].statistics() == {
+        'tables': 1, 'locations': 0, 'sharedItems': 0, 'revokedItems': 0, 'failedItems': 0, 'pendingItems': 1
+    }
+    assert summaries[share3_item_shared.shareUri].statistics()['sharedItems'] == 1
+    assert summaries[share3_item_shared.shareUri].states == [ShareItemStatus.Share_Succeeded.value]
+
+    # When the shares of the dataset are listed with their statistics
+    instrument_engine(db.engine)
+    with trace_operation('getDataset') as trace:
+        response = list_dataset_share_objects(client=client, user=user, group=group, datasetUri=dataset1.datasetUri)
+
+    # Then the items of all shares of the page are counted with a single query
+    statistics = {node.shareUri: node.statistics for node in response.data.getDataset.shares.nodes}
+    assert statistics[share2_item_pa.shareUri].tables == statistics[share3_item_shared.shareUri].tables == 1
+    count_queries = [
+        span for span in trace.spans
+        if span.kind == 'sql' and 'count(share_object_item' in span.name.lower()
+    ]
+    assert len(count_queries) == 1
+
+
 def test_list_dataset_share_objects_unauthorized(
         client, user3, group4, share1_draft, dataset1
 ):
@@ -1074,6 +1104,53 @@ def test_list_shares_from_me_requester(
     assert get_share_requests_from_me_response.data.getShareRequestsFromMe.count == 2
 
 
+def test_list_shares_from_me_with_cursor(
+        client, user2, group2, share, dataset1, env2, env2group, share1_draft
+):
+    # Given
+    # Existing share objects sent by the Requesters group (->fixture share1_draft + 2 more share objects)
+    extra_shares = [
+        share(dataset=dataset1, environment=env2, env_group=env2group, owner=user2.username,
+              status=ShareObjectStatus.Draft.value)
+        for _ in range(2)
+    ]
+    query = """
+        query getShareRequestsFromMe($filter: ShareObjectFilter){
+            getShareRequestsFromMe(filter: $filter){
+                count
+                hasNext
+                endCursor
+                nodes{
+                    shareUri
+                }
+            }
+        }
+    """
+    try:
+        response = client.query(query, filter={'pageSize': 1000}, username=user2.username, groups=[group2.name])
+        expected = [node.shareUri for node in response.data.getShareRequestsFromMe.nodes]
+        assert len(expected) >= 3
+
+        # When the requester walks the share objects one page at a time
+        seen = []
+        after = ''
+        has_next = True
+        while has_next:
+            response = client.query(
+                query, filter={'pageSize': 1, 'after': after}, username=user2.username, groups=[group2.name]
+            )
+            page = response.data.getShareRequestsFromMe
+            seen += [node.shareUri for node in page.nodes]
+            has_next, after = page.hasNext, page.endCursor
+    finally:
+        for extra_share in extra_shares:
+            delete_share_object(client=client, user=user2, group=group2, shareUri=extra_share.shareUri)
+
+    # Then every share object is listed exactly once
+    assert len(seen) == len(set(seen))
+    assert sorted(seen) == sorted(expected)
+
+
 def test_add_share_item(
         client, user2, group2, share1_draft,
 
@@ -1497,6 +1574,56 @@ def test_delete_share_object_remaining_items_error(
     assert 'UnauthorizedOperation' in delete_share_object_response.errors[0].message
 
 
+def test_run_transition_items_updates_once_per_target_state(
+        db, share: typing.Callable, share_item: typing.Callable, table: typing.Callable,
+        dataset1: Dataset, env2: Environment, env2group: EnvironmentGroup, user2
+):
+    # Given a share with items in different states
+    share5 = share(
+        dataset=dataset1, environment=env2, env_group=env2group, owner=user2.username,
+        status=ShareObjectStatus.Submitted.value
+    )
+    statuses = [
+        ShareItemStatus.PendingApproval.value,
+        ShareItemStatus.PendingApproval.value,
+        ShareItemStatus.Share_Succeeded.value,
+        ShareItemStatus.Share_Failed.value,
+    ]
+    items = [
+        share_item(share=share5, table=table(dataset1, name=random_table_name(), username=dataset1.owner), status=status)
+        for status in statuses
+    ]
+    pending, other_pending, succeeded, failed = [item.shareItemUri for item in items]
+
+    instrument_engine(db.engine)
+    with db.scoped_session() as session:
+        loaded = [ShareObjectRepository.get_share_item_by_uri(session, item.shareItemUri) for item in items]
+
+        # When the items run a transition, the items that cannot run it are skipped
+        with trace_operation('approve') as trace:
+            new_states = ShareItemSM.run_transition_items(
+                session, share5.shareUri, loaded, ShareObjectActions.Approve.value
+            )
+        assert ShareObjectRepository.get_share_items_states(session, share5.shareUri, [failed]) == [
+            ShareItemStatus.Share_Failed.value
+        ]
+
+        # Then the other items are transitioned from their own states with one UPDATE per target state
+        assert new_states == {
+            pending: ShareItemStatus.Share_Approved.value,
+            other_pending: ShareItemStatus.Share_Approved.value,
+            succeeded: ShareItemStatus.Share_Succeeded.value,
+        }
+        assert [item.status for item in loaded[:2]] == [ShareItemStatus.Share_Approved.value] * 2
+        assert len([span for span in trace.spans if span.name.startswith('UPDATE share_object_item')]) == 1
+
+        ShareItemSM.run_transition_items(session, share5.shareUri, loaded[3:], ShareItemActions.RemoveItem.value)
+        assert ShareObjectRepository.get_share_items_states(session, share5.shareUri, [failed]) == []
+
+        session.query(ShareObjectItem).filter(ShareObjectItem.shareUri == share5.shareUri).delete()
+        session.delete(ShareObjectRepository.get_share_by_uri(session, share5.shareUri))
+
+
 def _successfull_processing_for_share_object(db, share):
     with db.scoped_session() as session:
         print('Processing share with action ShareObjectActions.Start')
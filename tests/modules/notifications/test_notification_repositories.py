@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from dataall.modules.notifications.db.notification_models import Notification
+from dataall.modules.notifications.db.notification_repositories import NotificationRepository
+
+
+def test_notifications_cursor_walk(db):
+    created = datetime(2024, 1, 1)
+    with db.scoped_session() as session:
+        # the first notifications share the same creation time, the URI breaks the tie between them
+        for i in range(7):
+            session.add(Notification(
+                type='SHARE_OBJECT_SUBMITTED',
+                message=f'cursor walk {i}',
+                recipient='cursor-walk-group',
+                target_uri=f'target{i}',
+                created=created if i < 4 else datetime(2024, 1, 1 + i),
+            ))
+        session.flush()
+
+        expected = [
+            n.notificationUri
+            for n in session.query(Notification).filter(Notification.recipient == 'cursor-walk-group')
+        ]
+        seen = []
+        after = ''
+        has_next = True
+        while has_next:
+            page = NotificationRepository.paginated_notifications(
+                session, 'cursor-walk-user', ['cursor-walk-group'], {'pageSize': 2, 'after': after}
+            )
+            assert len(page['nodes']) <= 2
+            seen += [n.notificationUri for n in page['nodes']]
+            has_next, after = page['hasNext'], page['endCursor']
+
+    assert len(seen) == len(set(seen))
+    assert sorted(seen) == sorted(expected)